@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
+import functools
 import importlib
+import inspect
+from types import MappingProxyType
 from typing import Any, cast
 
 from graph.nodes import (
@@ -18,11 +22,12 @@ from graph.nodes import (
     verify,
 )
 from graph.state import AgentState
+from graph.tracing import TRACE_FIELD, GraphTracer
 
 START = "__start__"
 END = "__end__"
 
-NodeFn = Callable[[AgentState], dict[str, Any]]
+NodeFn = Callable[[AgentState], dict[str, Any] | Awaitable[dict[str, Any]]]
 RouteFn = Callable[[AgentState], str]
 
 
@@ -32,11 +37,46 @@ class _GraphDefinition:
     edges: set[tuple[str, str]]
     conditional_edges: dict[str, dict[str, str]]
     routers: dict[str, RouteFn]
+    write_fields: dict[str, tuple[str, ...]] | None = None
+    read_fields: dict[str, tuple[str, ...]] | None = None
+
+
+class UndeclaredStateWriteError(RuntimeError):
+    pass
+
+
+def _projected_state(
+    definition: _GraphDefinition, node: str, state: Mapping[str, Any]
+) -> AgentState:
+    if definition.read_fields is None:
+        return cast(AgentState, state)
+    projected = {
+        field: state[field] for field in definition.read_fields[node] if field in state
+    }
+    return cast(AgentState, MappingProxyType(projected))
+
+
+def _checked_updates(
+    definition: _GraphDefinition, node: str, updates: Any
+) -> dict[str, Any]:
+    if not updates:
+        return {}
+    if definition.write_fields is None:
+        return updates
+    undeclared = sorted(set(updates) - set(definition.write_fields.get(node, ())))
+    if undeclared:
+        raise UndeclaredStateWriteError(
+            f"node {node} wrote undeclared fields: {', '.join(undeclared)}"
+        )
+    return updates
 
 
 class _CompiledGraphShim:
-    def __init__(self, definition: _GraphDefinition):
+    def __init__(self, definition: _GraphDefinition, tracer: GraphTracer | None = None):
         self.backend = "shim"
+        self.tracer = tracer
+        self.read_fields = definition.read_fields
+        self._definition = definition
         self.edges = definition.edges
         self.conditional_edges = definition.conditional_edges
         self._nodes = definition.nodes
@@ -51,40 +91,116 @@ class _CompiledGraphShim:
         self, state: AgentState, config: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         _ = config
+        if self.tracer is None:
+            return self._run(state)
+        with self.tracer.session(state) as records:
+            result = self._run(state)
+        return {**result, TRACE_FIELD: list(records)}
+
+    async def ainvoke(
+        self, state: AgentState, config: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        _ = config
+        if self.tracer is None:
+            return await self._arun(state)
+        with self.tracer.session(state) as records:
+            result = await self._arun(state)
+        return {**result, TRACE_FIELD: list(records)}
+
+    def _run(self, state: AgentState) -> dict[str, Any]:
         next_node = self._linear_edges[START]
         current_state: dict[str, Any] = dict(state)
+        state_view = cast(AgentState, MappingProxyType(current_state))
 
         for _ in range(100):
-            updates = self._nodes[next_node](cast(AgentState, current_state))
-            if updates:
-                current_state.update(updates)
+            node_state = _projected_state(self._definition, next_node, state_view)
+            updates = self._nodes[next_node](node_state)
+            if inspect.isawaitable(updates):
+                updates.close()
+                raise TypeError(f"node {next_node} is async; use ainvoke")
+            current_state.update(_checked_updates(self._definition, next_node, updates))
+
+            next_node = self._next_node(next_node, state_view)
+            if next_node == END:
+                return current_state
 
-            if next_node in self.conditional_edges:
-                route_key = self._routers[next_node](cast(AgentState, current_state))
-                next_node = self.conditional_edges[next_node][route_key]
+        raise RuntimeError("graph execution exceeded maximum steps")
+
+    async def _arun(self, state: AgentState) -> dict[str, Any]:
+        next_node = self._linear_edges[START]
+        current_state: dict[str, Any] = dict(state)
+        state_view = cast(AgentState, MappingProxyType(current_state))
+
+        for _ in range(100):
+            node_fn = self._nodes[next_node]
+            node_state = _projected_state(self._definition, next_node, state_view)
+            if inspect.iscoroutinefunction(node_fn):
+                updates = await node_fn(node_state)
             else:
-                next_node = self._linear_edges[next_node]
+                updates = await asyncio.to_thread(node_fn, node_state)
+                if inspect.isawaitable(updates):
+                    updates = await updates
+            current_state.update(_checked_updates(self._definition, next_node, updates))
 
+            next_node = self._next_node(next_node, state_view)
             if next_node == END:
                 return current_state
 
         raise RuntimeError("graph execution exceeded maximum steps")
 
+    def _next_node(self, node: str, state: AgentState) -> str:
+        if node in self.conditional_edges:
+            route_key = self._routers[node](state)
+            return self.conditional_edges[node][route_key]
+        return self._linear_edges[node]
+
 
 class _CompiledGraphAdapter:
-    def __init__(self, compiled: Any, definition: _GraphDefinition):
+    def __init__(
+        self,
+        compiled: Any,
+        definition: _GraphDefinition,
+        tracer: GraphTracer | None = None,
+    ):
         self.backend = "langgraph"
+        self.tracer = tracer
+        self.read_fields = definition.read_fields
         self._compiled = compiled
         self.edges = definition.edges
         self.conditional_edges = definition.conditional_edges
 
     def invoke(
         self, state: AgentState, config: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        if self.tracer is None:
+            return self._invoke_compiled(state, config)
+        with self.tracer.session(state) as records:
+            result = self._invoke_compiled(state, config)
+        return {**result, TRACE_FIELD: list(records)}
+
+    async def ainvoke(
+        self, state: AgentState, config: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        if self.tracer is None:
+            return await self._ainvoke_compiled(state, config)
+        with self.tracer.session(state) as records:
+            result = await self._ainvoke_compiled(state, config)
+        return {**result, TRACE_FIELD: list(records)}
+
+    def _invoke_compiled(
+        self, state: AgentState, config: dict[str, Any] | None
     ) -> dict[str, Any]:
         if config is None:
             return self._compiled.invoke(state)
         return self._compiled.invoke(state, config=config)
 
+    async def _ainvoke_compiled(
+        self, state: AgentState, config: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        if config is None:
+            return await self._compiled.ainvoke(state)
+        return await self._compiled.ainvoke(state, config=config)
+
 
 def _interrupt_node(state: AgentState) -> dict[str, Any]:
     _ = state
@@ -212,14 +328,68 @@ def _build_definition() -> _GraphDefinition:
         "verify": _route_verify,
     }
 
+    node_modules = {
+        "detect": detect,
+        "collect": collect,
+        "analyze": analyze,
+        "triage": triage,
+        "propose": propose,
+        "execute": execute,
+        "verify": verify,
+        "rollback": rollback,
+        "report_only": report_only,
+        "postmortem": postmortem,
+    }
+    write_fields = {name: module.WRITE_FIELDS for name, module in node_modules.items()}
+    read_fields = {
+        name: tuple(
+            dict.fromkeys(
+                (
+                    *module.READ_FIELDS,
+                    *module.WRITE_FIELDS,
+                    *getattr(module, "INPUT_FIELDS", ()),
+                )
+            )
+        )
+        for name, module in node_modules.items()
+    }
+    write_fields["interrupt"] = ()
+    read_fields["interrupt"] = ()
+
     return _GraphDefinition(
         nodes=nodes,
         edges=edges,
         conditional_edges=conditional_edges,
         routers=routers,
+        write_fields=write_fields,
+        read_fields=read_fields,
     )
 
 
+def nodes_reading(changed_fields: Iterable[str]) -> set[str]:
+    changed = set(changed_fields)
+    read_fields = _build_definition().read_fields or {}
+    return {node for node, fields in read_fields.items() if changed & set(fields)}
+
+
+def _checked_node(definition: _GraphDefinition, node: str, node_fn: NodeFn) -> NodeFn:
+    if inspect.iscoroutinefunction(node_fn):
+
+        @functools.wraps(node_fn)
+        async def _checked_async(state: AgentState) -> dict[str, Any]:
+            updates = await node_fn(_projected_state(definition, node, state))
+            return _checked_updates(definition, node, updates)
+
+        return _checked_async
+
+    @functools.wraps(node_fn)
+    def _checked(state: AgentState) -> dict[str, Any]:
+        updates = node_fn(_projected_state(definition, node, state))
+        return _checked_updates(definition, node, updates)
+
+    return _checked
+
+
 def _build_langgraph(definition: _GraphDefinition, checkpointer: Any | None) -> Any:
     module = importlib.import_module("langgraph.graph")
     LG_END = module.END
@@ -228,7 +398,7 @@ def _build_langgraph(definition: _GraphDefinition, checkpointer: Any | None) ->
 
     builder = StateGraph(AgentState)
     for node_name, node_fn in definition.nodes.items():
-        builder.add_node(node_name, node_fn)
+        builder.add_node(node_name, _checked_node(definition, node_name, node_fn))
 
     for source, target in definition.edges:
         actual_source = LG_START if source == START else source
@@ -251,8 +421,28 @@ def _build_langgraph(definition: _GraphDefinition, checkpointer: Any | None) ->
     return builder.compile(checkpointer=checkpointer)
 
 
-def build_graph(checkpointer: Any | None = None) -> Any:
+def _instrument_definition(
+    definition: _GraphDefinition, tracer: GraphTracer
+) -> _GraphDefinition:
+    return replace(
+        definition,
+        nodes={
+            name: tracer.wrap_node(name, node_fn)
+            for name, node_fn in definition.nodes.items()
+        },
+        routers={
+            name: tracer.wrap_router(name, route_fn)
+            for name, route_fn in definition.routers.items()
+        },
+    )
+
+
+def build_graph(
+    checkpointer: Any | None = None, *, tracer: GraphTracer | None = None
+) -> Any:
     definition = _build_definition()
+    if tracer is not None:
+        definition = _instrument_definition(definition, tracer)
 
     try:
         langgraph_spec = importlib.util.find_spec("langgraph.graph")
@@ -260,7 +450,7 @@ def build_graph(checkpointer: Any | None = None) -> Any:
         langgraph_spec = None
 
     if langgraph_spec is None:
-        return _CompiledGraphShim(definition)
+        return _CompiledGraphShim(definition, tracer=tracer)
 
     compiled = _build_langgraph(definition, checkpointer=checkpointer)
-    return _CompiledGraphAdapter(compiled, definition)
+    return _CompiledGraphAdapter(compiled, definition, tracer=tracer)
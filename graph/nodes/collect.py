@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import Any
 
 from graph.state import AgentState
 from tools.bad_records_summarizer import summarize_bad_records
+from tools.collect_watermarks import (
+    WATERMARK_COLUMNS,
+    WatermarkStore,
+    latest_watermark,
+    resolve_collect_windows,
+)
+from tools.data_collector import collect_pipeline_context
+from tools.query_executor import QueryExecutor
 
 READ_FIELDS = ("pipeline", "run_id", "pipeline_states", "detected_issues")
 WRITE_FIELDS = ("exceptions", "dq_tags", "bad_records_summary")
+INPUT_FIELDS = ("exception_ledger", "dq_status", "bad_records")
 
 
 class CollectError(RuntimeError):
@@ -50,6 +60,57 @@ def _classify_collect_error(exc: Exception) -> CollectError:
     return CollectPermanentError(str(exc).strip() or exc.__class__.__name__)
 
 
+def _classify_fanout_errors(errors: dict[str, Exception]) -> CollectError:
+    classified = {name: _classify_collect_error(exc) for name, exc in errors.items()}
+    detail = "; ".join(f"{name}: {exc}" for name, exc in sorted(classified.items()))
+    if any(isinstance(exc, CollectPermanentError) for exc in classified.values()):
+        return CollectPermanentError(f"collect queries failed: {detail}")
+    return CollectTransientError(f"collect queries failed: {detail}")
+
+
+def fetch_collect_inputs(
+    executor: QueryExecutor,
+    pipeline: str,
+    run_id: str | None,
+    *,
+    timeout_seconds: float | None = None,
+    watermark_store: WatermarkStore | None = None,
+    now_utc: datetime | None = None,
+) -> dict[str, Any]:
+    current_time = now_utc or datetime.now(tz=UTC)
+    windows = resolve_collect_windows(watermark_store, pipeline, now_utc=current_time)
+    try:
+        query_specs = collect_pipeline_context(pipeline, run_id, windows=windows)
+    except ValueError as exc:
+        raise CollectPermanentError(str(exc)) from exc
+
+    fanout = executor.execute_concurrently(
+        query_specs,
+        timeout_seconds=timeout_seconds,
+    )
+    if fanout.errors:
+        first_error = next(iter(fanout.errors.values()))
+        raise _classify_fanout_errors(fanout.errors) from first_error
+
+    if watermark_store is not None:
+        for source, column in WATERMARK_COLUMNS.items():
+            watermark_store.advance(
+                pipeline,
+                source,
+                latest_watermark(fanout.results[source], column)
+                or windows[source].start_ts,
+                polled_at=current_time,
+            )
+
+    pipeline_state = fanout.results["pipeline_state"]
+    return {
+        "pipeline_states": {pipeline: pipeline_state} if pipeline_state else {},
+        "dq_status": fanout.results["dq_status"],
+        "exception_ledger": fanout.results["exception_ledger"],
+        "collect_query_timings": fanout.timings,
+    }
+
+
 def run(state: AgentState) -> dict[str, Any]:
     try:
         raw_exceptions = _expect_list(state.get("exception_ledger"), "exception_ledger")
@@ -59,7 +120,7 @@ def run(state: AgentState) -> dict[str, Any]:
         exceptions = _collect_exceptions(raw_exceptions)
         dq_tags = _collect_dq_tags(raw_dq_status)
         bad_records_summary = summarize_bad_records(
-            [row for row in raw_bad_records if isinstance(row, dict)]
+            row for row in raw_bad_records if isinstance(row, dict)
         )
     except Exception as exc:  # pragma: no cover - exercised via classification tests
         raise _classify_collect_error(exc) from exc
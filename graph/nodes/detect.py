@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import timedelta
 import logging
 from typing import Any
@@ -17,12 +18,13 @@ READ_FIELDS = (
     "fingerprint_duplicate",
 )
 WRITE_FIELDS = ("pipeline_states", "detected_issues")
+INPUT_FIELDS = ("exception_ledger", "dq_status")
 
 _LOGGER = logging.getLogger(__name__)
 _CRITICAL_DQ_TAGS = {"SOURCE_STALE", "EVENT_DROP_SUSPECTED"}
 
 
-def _has_pipeline_failure(state: dict[str, Any], pipeline: str | None) -> bool:
+def _has_pipeline_failure(state: Mapping[str, Any], pipeline: str | None) -> bool:
     if pipeline is None:
         return False
     pipeline_states = state.get("pipeline_states")
@@ -32,7 +34,7 @@ def _has_pipeline_failure(state: dict[str, Any], pipeline: str | None) -> bool:
     return isinstance(current, dict) and current.get("status") == "failure"
 
 
-def _has_new_critical_exception(state: dict[str, Any]) -> bool:
+def _has_new_critical_exception(state: Mapping[str, Any]) -> bool:
     ledger = state.get("exception_ledger")
     if not isinstance(ledger, list):
         return False
@@ -49,7 +51,7 @@ def _has_new_critical_exception(state: dict[str, Any]) -> bool:
     return False
 
 
-def _has_critical_dq_anomaly(state: dict[str, Any]) -> bool:
+def _has_critical_dq_anomaly(state: Mapping[str, Any]) -> bool:
     dq_rows = state.get("dq_status")
     if not isinstance(dq_rows, list):
         return False
@@ -64,7 +66,7 @@ def _has_critical_dq_anomaly(state: dict[str, Any]) -> bool:
     return False
 
 
-def _is_cutoff_delay(state: dict[str, Any], pipeline: str | None) -> bool:
+def _is_cutoff_delay(state: Mapping[str, Any], pipeline: str | None) -> bool:
     if pipeline is None:
         return False
     pipeline_states = state.get("pipeline_states")
@@ -90,14 +92,13 @@ def _is_cutoff_delay(state: dict[str, Any], pipeline: str | None) -> bool:
 
 
 def run(state: AgentState) -> dict[str, Any]:
-    working_state = dict(state)
-    pipeline = working_state.get("pipeline")
+    pipeline = state.get("pipeline")
 
-    pipeline_states = working_state.get("pipeline_states")
+    pipeline_states = state.get("pipeline_states")
     if not isinstance(pipeline_states, dict):
         pipeline_states = {}
 
-    if bool(working_state.get("fingerprint_duplicate")):
+    if bool(state.get("fingerprint_duplicate")):
         _LOGGER.info("detect heartbeat: duplicate fingerprint skip")
         return {
             "pipeline_states": pipeline_states,
@@ -106,18 +107,16 @@ def run(state: AgentState) -> dict[str, Any]:
 
     detected_issues: list[dict[str, str]] = []
 
-    if _has_pipeline_failure(
-        working_state, pipeline if isinstance(pipeline, str) else None
-    ):
+    if _has_pipeline_failure(state, pipeline if isinstance(pipeline, str) else None):
         detected_issues.append({"type": "failure", "severity": "critical"})
 
-    if _has_new_critical_exception(working_state):
+    if _has_new_critical_exception(state):
         detected_issues.append({"type": "new_exception", "severity": "critical"})
 
-    if _has_critical_dq_anomaly(working_state):
+    if _has_critical_dq_anomaly(state):
         detected_issues.append({"type": "critical_dq", "severity": "critical"})
 
-    if _is_cutoff_delay(working_state, pipeline if isinstance(pipeline, str) else None):
+    if _is_cutoff_delay(state, pipeline if isinstance(pipeline, str) else None):
         detected_issues.append({"type": "cutoff_delay", "severity": "warning"})
 
     if not detected_issues:
@@ -34,8 +34,13 @@ class AgentState(TypedDict):
     fingerprint: Optional[str]
     fingerprint_duplicate: Optional[bool]
 
+    exception_ledger: Optional[list[Any]]
+    dq_status: Optional[list[Any]]
+    bad_records: Optional[list[Any]]
+
     pipeline_states: dict[str, Any]
     detected_issues: list[Any]
+    collect_query_timings: Optional[dict[str, float]]
 
     exceptions: list[Any]
     dq_tags: list[Any]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import inspect
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+TRACE_FIELD = "node_trace"
+
+_ACTIVE_TRACE: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "graph_node_trace", default=None
+)
+
+
+class JsonlTraceSink:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def write(
+        self, records: list[dict[str, Any]], *, context: Mapping[str, Any]
+    ) -> None:
+        if not records:
+            return
+        lines = [
+            json.dumps({**context, **record}, ensure_ascii=False, sort_keys=True)
+            for record in records
+        ]
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+
+
+class GraphTracer:
+    def __init__(self, sink: JsonlTraceSink | None = None) -> None:
+        self.sink = sink
+
+    @contextmanager
+    def session(self, state: Mapping[str, Any]) -> Iterator[list[dict[str, Any]]]:
+        records: list[dict[str, Any]] = []
+        token = _ACTIVE_TRACE.set(records)
+        try:
+            yield records
+        finally:
+            _ACTIVE_TRACE.reset(token)
+            if self.sink is not None:
+                self.sink.write(
+                    records,
+                    context={
+                        "incident_id": state.get("incident_id"),
+                        "pipeline": state.get("pipeline"),
+                    },
+                )
+
+    def wrap_node(self, name: str, node_fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(node_fn):
+
+            @functools.wraps(node_fn)
+            async def _traced_async(state: Any) -> Any:
+                started_wall = time.perf_counter()
+                started_cpu = time.thread_time()
+                try:
+                    updates = await node_fn(state)
+                except Exception as exc:
+                    _record_step(name, started_wall, started_cpu, None, exc)
+                    raise
+                _record_step(name, started_wall, started_cpu, updates)
+                return updates
+
+            return _traced_async
+
+        @functools.wraps(node_fn)
+        def _traced(state: Any) -> Any:
+            started_wall = time.perf_counter()
+            started_cpu = time.thread_time()
+            try:
+                updates = node_fn(state)
+            except Exception as exc:
+                _record_step(name, started_wall, started_cpu, None, exc)
+                raise
+            _record_step(name, started_wall, started_cpu, updates)
+            return updates
+
+        return _traced
+
+    def wrap_router(
+        self, name: str, route_fn: Callable[[Any], str]
+    ) -> Callable[[Any], str]:
+        @functools.wraps(route_fn)
+        def _traced_route(state: Any) -> str:
+            route_key = route_fn(state)
+            records = _ACTIVE_TRACE.get()
+            if records and records[-1]["node"] == name:
+                records[-1]["route"] = route_key
+            return route_key
+
+        return _traced_route
+
+
+def update_size_bytes(updates: Any) -> int:
+    if not updates:
+        return 0
+    encoded = json.dumps(updates, default=str, separators=(",", ":"))
+    return len(encoded.encode("utf-8"))
+
+
+def _record_step(
+    name: str,
+    started_wall: float,
+    started_cpu: float,
+    updates: Any,
+    error: Exception | None = None,
+) -> None:
+    records = _ACTIVE_TRACE.get()
+    if records is None:
+        return
+    records.append(
+        {
+            "step": len(records),
+            "node": name,
+            "wall_seconds": round(time.perf_counter() - started_wall, 6),
+            "cpu_seconds": round(time.thread_time() - started_cpu, 6),
+            "update_keys": sorted(updates) if isinstance(updates, Mapping) else [],
+            "update_bytes": update_size_bytes(updates),
+            "route": None,
+            "error": None if error is None else error.__class__.__name__,
+        }
+    )
+
+
+__all__ = [
+    "TRACE_FIELD",
+    "GraphTracer",
+    "JsonlTraceSink",
+    "update_size_bytes",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 import sys
 
@@ -17,10 +18,29 @@ if str(ROOT) not in sys.path:
 from runtime import watchdog  # noqa: E402
 
 
-def main() -> int:
-    watchdog.run_once()
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="NSC pipeline ops watchdog")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and poll on poll_every_minutes boundaries",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args([] if argv is None else argv)
+    if not args.daemon:
+        watchdog.run_once()
+        return 0
+
+    from runtime.daemon import WatchdogDaemon
+
+    daemon = WatchdogDaemon()
+    daemon.install_signal_handlers()
+    daemon.run()
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(sys.argv[1:]))
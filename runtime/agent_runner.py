@@ -1,15 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from contextlib import AbstractContextManager, ExitStack
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 import importlib
+import logging
 from pathlib import Path
 import sqlite3
 from typing import Any
 
 from graph.graph import build_graph
+from runtime.checkpoint_serde import (
+    CheckpointBlobStore,
+    LeanCheckpointSerializer,
+    lean_saver_class,
+)
+from utils.sqlite_store import DEFAULT_BUSY_TIMEOUT_SECONDS, SqliteStore
 
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARALLEL_INCIDENTS = 4
 
 _ALLOWED_REGISTRY_STATUSES = {
     "running",
@@ -35,10 +47,20 @@ def _ensure_parent_dir(checkpoint_db_path: str) -> None:
     )
 
 
-def create_sqlite_checkpointer(checkpoint_db_path: str) -> Any:
+@contextmanager
+def create_sqlite_checkpointer(checkpoint_db_path: str) -> Iterator[Any]:
     _ensure_parent_dir(checkpoint_db_path)
-    sqlite_saver = _load_sqlite_saver()
-    return sqlite_saver.from_conn_string(checkpoint_db_path)
+    sqlite_saver = lean_saver_class(_load_sqlite_saver())
+    with ExitStack() as resources:
+        blob_store = CheckpointBlobStore(checkpoint_db_path)
+        resources.callback(blob_store.close)
+        conn = sqlite3.connect(
+            checkpoint_db_path,
+            timeout=DEFAULT_BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+        )
+        resources.callback(conn.close)
+        yield sqlite_saver(conn, serde=LeanCheckpointSerializer(blob_store))
 
 
 def _enter_checkpointer_if_context_manager(
@@ -50,6 +72,18 @@ def _enter_checkpointer_if_context_manager(
     return candidate
 
 
+@dataclass(frozen=True)
+class IncidentRunOutcome:
+    incident_id: str
+    pipeline: str | None
+    result: dict[str, Any] | None
+    error: Exception | None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class AgentRunner:
     def __init__(
         self,
@@ -72,8 +106,8 @@ class AgentRunner:
             else:
                 self._checkpointer = checkpointer
             self._graph = graph_factory(checkpointer=self._checkpointer)
-            self._registry_conn = sqlite3.connect(self._checkpoint_db_path)
-            self._resources.callback(self._registry_conn.close)
+            self._registry = SqliteStore(self._checkpoint_db_path)
+            self._resources.callback(self._registry.close)
             self._init_registry_table()
         except Exception:
             self._resources.close()
@@ -110,6 +144,44 @@ class AgentRunner:
         self._upsert_incident_registry(merged, default_status="resumed")
         return merged
 
+    def invoke_many(
+        self,
+        initial_states: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = DEFAULT_MAX_PARALLEL_INCIDENTS,
+    ) -> list[IncidentRunOutcome]:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        states = [dict(state) for state in initial_states]
+        incident_ids = [self._require_incident_id(state) for state in states]
+        duplicates = sorted(
+            {value for value in incident_ids if incident_ids.count(value) > 1}
+        )
+        if duplicates:
+            raise ValueError(f"duplicate incident_id in batch: {', '.join(duplicates)}")
+        if not states:
+            return []
+
+        def _run(state: dict[str, Any]) -> IncidentRunOutcome:
+            incident_id = state["incident_id"]
+            pipeline = _optional_text(state.get("pipeline"))
+            try:
+                result = self.invoke(state)
+            except Exception as exc:
+                _LOGGER.exception(
+                    "incident graph failed: incident_id=%s pipeline=%s",
+                    incident_id,
+                    pipeline,
+                )
+                return IncidentRunOutcome(incident_id, pipeline, None, exc)
+            return IncidentRunOutcome(incident_id, pipeline, result, None)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(states)),
+            thread_name_prefix="incident-graph",
+        ) as pool:
+            return list(pool.map(_run, states))
+
     def _thread_config(self, incident_id: str) -> dict[str, dict[str, str]]:
         return {"configurable": {"thread_id": incident_id}}
 
@@ -120,7 +192,8 @@ class AgentRunner:
         return incident_id
 
     def _init_registry_table(self) -> None:
-        self._registry_conn.execute(
+        self._registry.migrate(
+            "incident_registry_v1",
             """
             CREATE TABLE IF NOT EXISTS incident_registry (
                 incident_id TEXT PRIMARY KEY,
@@ -130,9 +203,8 @@ class AgentRunner:
                 status TEXT NOT NULL,
                 updated_at TEXT NOT NULL
             )
-            """
+            """,
         )
-        self._registry_conn.commit()
 
     def _upsert_incident_registry(
         self,
@@ -142,7 +214,7 @@ class AgentRunner:
     ) -> None:
         incident_id = self._require_incident_id(state)
         now = datetime.now(timezone.utc).isoformat()
-        self._registry_conn.execute(
+        self._registry.execute(
             """
             INSERT INTO incident_registry (
                 incident_id,
@@ -173,7 +245,6 @@ class AgentRunner:
                 now,
             ),
         )
-        self._registry_conn.commit()
 
 
 def _optional_text(value: Any) -> str | None:
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import functools
+import hashlib
+import importlib
+from pathlib import Path
+import threading
+from typing import Any
+
+from utils.sqlite_store import SqliteStore
+
+RAW_INPUT_FIELDS = ("bad_records", "exception_ledger", "dq_status")
+
+BLOB_TYPE = "checkpoint_blob"
+_BLOB_REF_KEY = "__checkpoint_blob__"
+_START_CHANNEL = "__start__"
+_IDENTITY_CACHE_SIZE = 64
+
+
+def _load_default_serde() -> Any:
+    module = importlib.import_module("langgraph.checkpoint.serde.jsonplus")
+    return module.JsonPlusSerializer()
+
+
+@dataclass(frozen=True)
+class _BlobValue:
+    value: Any
+
+
+class CheckpointBlobStore:
+    def __init__(self, checkpoint_db_path: str | Path) -> None:
+        self._store = SqliteStore(checkpoint_db_path)
+        self._store.migrate(
+            "checkpoint_blobs_v1",
+            """
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                digest TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                payload BLOB NOT NULL
+            )
+            """,
+        )
+
+    def close(self) -> None:
+        self._store.close()
+
+    def put(self, digest: str, type_: str, payload: bytes) -> None:
+        self._store.execute(
+            """
+            INSERT OR IGNORE INTO checkpoint_blobs (digest, type, payload)
+            VALUES (?, ?, ?)
+            """,
+            (digest, type_, payload),
+        )
+
+    def get(self, digest: str) -> tuple[str, bytes]:
+        row = self._store.fetchone(
+            "SELECT type, payload FROM checkpoint_blobs WHERE digest = ?",
+            (digest,),
+        )
+        if row is None:
+            raise KeyError(f"checkpoint blob not found: {digest}")
+        return str(row[0]), bytes(row[1])
+
+    def count(self) -> int:
+        row = self._store.fetchone("SELECT COUNT(*) FROM checkpoint_blobs")
+        return 0 if row is None else int(row[0])
+
+
+class LeanCheckpointSerializer:
+    def __init__(
+        self,
+        blob_store: CheckpointBlobStore,
+        *,
+        base: Any | None = None,
+        blob_fields: Iterable[str] = RAW_INPUT_FIELDS,
+    ) -> None:
+        self.blob_store = blob_store
+        self.base = base if base is not None else _load_default_serde()
+        self.blob_fields = frozenset(blob_fields)
+        self._lock = threading.Lock()
+        self._digests: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        if isinstance(obj, _BlobValue):
+            return BLOB_TYPE, self._store_blob(obj.value).encode("ascii")
+        if isinstance(obj, dict) and isinstance(obj.get("channel_values"), dict):
+            obj = {**obj, "channel_values": self._lean_values(obj["channel_values"])}
+        return self.base.dumps_typed(obj)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == BLOB_TYPE:
+            return self._load_blob(payload.decode("ascii"))
+        obj = self.base.loads_typed(data)
+        if isinstance(obj, dict) and isinstance(obj.get("channel_values"), dict):
+            obj["channel_values"] = self._restore_values(obj["channel_values"])
+        return obj
+
+    def lean_writes(self, writes: Sequence[tuple[str, Any]]) -> list[tuple[str, Any]]:
+        return [
+            (
+                (channel, _BlobValue(value))
+                if channel in self.blob_fields and value is not None
+                else (channel, value)
+            )
+            for channel, value in writes
+        ]
+
+    def _lean_values(self, values: dict[str, Any]) -> dict[str, Any]:
+        lean = dict(values)
+        for field in self.blob_fields.intersection(lean):
+            if lean[field] is not None:
+                lean[field] = {_BLOB_REF_KEY: self._store_blob(lean[field])}
+        start = lean.get(_START_CHANNEL)
+        if isinstance(start, dict):
+            lean[_START_CHANNEL] = self._lean_values(start)
+        return lean
+
+    def _restore_values(self, values: dict[str, Any]) -> dict[str, Any]:
+        for field, value in values.items():
+            if isinstance(value, dict) and set(value) == {_BLOB_REF_KEY}:
+                values[field] = self._load_blob(value[_BLOB_REF_KEY])
+            elif field == _START_CHANNEL and isinstance(value, dict):
+                values[field] = self._restore_values(value)
+        return values
+
+    def _store_blob(self, value: Any) -> str:
+        with self._lock:
+            cached = self._digests.get(id(value))
+            if cached is not None and cached[0] is value:
+                self._digests.move_to_end(id(value))
+                return cached[1]
+        type_, payload = self.base.dumps_typed(value)
+        digest = hashlib.sha256(type_.encode("utf-8") + b"\0" + payload).hexdigest()
+        self.blob_store.put(digest, type_, payload)
+        with self._lock:
+            self._digests[id(value)] = (value, digest)
+            while len(self._digests) > _IDENTITY_CACHE_SIZE:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _load_blob(self, digest: str) -> Any:
+        return self.base.loads_typed(self.blob_store.get(digest))
+
+
+@functools.cache
+def lean_saver_class(saver_cls: type[Any]) -> type[Any]:
+    class _LeanSaver(saver_cls):  # type: ignore[misc, valid-type]
+        def put_writes(
+            self,
+            config: Any,
+            writes: Sequence[tuple[str, Any]],
+            task_id: str,
+            task_path: str = "",
+        ) -> None:
+            if isinstance(self.serde, LeanCheckpointSerializer):
+                writes = self.serde.lean_writes(writes)
+            super().put_writes(config, writes, task_id, task_path)
+
+    _LeanSaver.__name__ = _LeanSaver.__qualname__ = f"Lean{saver_cls.__name__}"
+    return _LeanSaver
+
+
+__all__ = [
+    "RAW_INPUT_FIELDS",
+    "CheckpointBlobStore",
+    "LeanCheckpointSerializer",
+    "lean_saver_class",
+]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import logging
+import signal
+import threading
+from typing import Any
+
+from orchestrator.pipeline_monitoring_config import (
+    PipelineMonitoringConfig,
+    load_pipeline_monitoring_config,
+)
+from orchestrator.utils.config import RuntimeSettings, load_runtime_settings
+from runtime import watchdog
+from runtime.scheduler import PollScheduler, next_aligned_tick
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WatchdogDaemon:
+    def __init__(
+        self,
+        *,
+        settings: RuntimeSettings | None = None,
+        monitoring_config: PipelineMonitoringConfig | None = None,
+        query_runner: watchdog.PipelineStateQueryRunner | None = None,
+        tick: Callable[..., dict[str, Any]] | None = None,
+        clock: Callable[[], datetime] | None = None,
+        wait: Callable[[float], bool] | None = None,
+    ) -> None:
+        self.settings = settings or load_runtime_settings()
+        self.monitoring_config = monitoring_config or load_pipeline_monitoring_config()
+        self.interval_minutes = (
+            self.monitoring_config.pipelines.pipeline_a.poll_every_minutes
+        )
+        self.query_runner = query_runner
+        self._tick = tick or watchdog.run_once
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._stop = threading.Event()
+        self._wait = wait or self._stop.wait
+        self._resources = ExitStack()
+        self.scheduler = PollScheduler(
+            self.monitoring_config,
+            self.settings.target_pipelines,
+            start_utc=self._clock(),
+        )
+        self.ticks = 0
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop.is_set()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self._resources.close()
+
+    def own(self, resource: Any) -> Any:
+        close = getattr(resource, "close", None)
+        if callable(close):
+            self._resources.callback(close)
+        return resource
+
+    def install_signal_handlers(self) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle_signal)
+
+    def run(self, *, max_ticks: int | None = None) -> int:
+        try:
+            while not self._stop.is_set():
+                if max_ticks is not None and self.ticks >= max_ticks:
+                    break
+                scheduled = self.scheduler.next_wakeup()
+                if scheduled is None:
+                    scheduled = next_aligned_tick(
+                        self._clock(), interval_minutes=self.interval_minutes
+                    )
+                delay = (scheduled - self._clock()).total_seconds()
+                if delay > 0 and self._wait(delay):
+                    break
+                due = self.scheduler.pop_due(max(self._clock(), scheduled))
+                self.run_tick(scheduled, [poll.pipeline for poll in due])
+        finally:
+            self.close()
+        return self.ticks
+
+    def run_tick(
+        self, scheduled: datetime, due_pipelines: list[str]
+    ) -> dict[str, Any] | None:
+        self.ticks += 1
+        try:
+            return self._tick(
+                now_utc=scheduled,
+                settings=self.settings,
+                monitoring_config=self.monitoring_config,
+                query_runner=self.query_runner,
+                due_pipelines=due_pipelines,
+            )
+        except Exception:
+            _LOGGER.exception("watchdog tick failed: scheduled=%s", scheduled)
+            return None
+
+    def _handle_signal(self, signum: int, frame: Any) -> None:
+        _ = frame
+        _LOGGER.info("watchdog daemon stopping: signal=%s", signum)
+        self.stop()
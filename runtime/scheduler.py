@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import heapq
+import logging
+
+from orchestrator.pipeline_monitoring_config import (
+    DailyBatchPipelineConfig,
+    MicrobatchPipelineConfig,
+    PipelineMonitoringConfig,
+)
+from orchestrator.utils.time import KST
+
+_LOGGER = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class DuePoll:
+    pipeline: str
+    due_utc: datetime
+    missed_slots: int
+
+
+def next_aligned_tick(now_utc: datetime, *, interval_minutes: int) -> datetime:
+    if interval_minutes <= 0:
+        raise ValueError("interval_minutes must be a positive integer")
+    interval = timedelta(minutes=interval_minutes)
+    elapsed = now_utc.astimezone(timezone.utc) - _EPOCH
+    return _EPOCH + (elapsed // interval + 1) * interval
+
+
+def _ceil_aligned(at_utc: datetime, *, interval: timedelta) -> datetime:
+    elapsed = at_utc.astimezone(timezone.utc) - _EPOCH
+    return _EPOCH - (-elapsed // interval) * interval
+
+
+def _parse_hhmm(value: str) -> tuple[int, int]:
+    hour, minute = value.split(":")
+    return int(hour), int(minute)
+
+
+class PollScheduler:
+    def __init__(
+        self,
+        monitoring_config: PipelineMonitoringConfig,
+        target_pipelines: list[str],
+        *,
+        start_utc: datetime,
+    ) -> None:
+        self.interval = timedelta(
+            minutes=monitoring_config.pipelines.pipeline_a.poll_every_minutes
+        )
+        self._configs: dict[
+            str, DailyBatchPipelineConfig | MicrobatchPipelineConfig
+        ] = {}
+        self._queue: list[tuple[datetime, int, str]] = []
+
+        for order, pipeline in enumerate(dict.fromkeys(target_pipelines)):
+            config = getattr(monitoring_config.pipelines, pipeline, None)
+            if config is None:
+                _LOGGER.warning("Unknown target pipeline skipped: %s", pipeline)
+                continue
+            self._configs[pipeline] = config
+            due = self._next_due(pipeline, start_utc)
+            heapq.heappush(self._queue, (due, order, pipeline))
+
+    def next_wakeup(self) -> datetime | None:
+        return self._queue[0][0] if self._queue else None
+
+    def pop_due(self, now_utc: datetime) -> list[DuePoll]:
+        due_polls: list[DuePoll] = []
+        while self._queue and self._queue[0][0] <= now_utc:
+            due, order, pipeline = heapq.heappop(self._queue)
+            next_due = self._next_due(pipeline, due + timedelta(microseconds=1))
+            missed_slots = 0
+            while next_due <= now_utc:
+                missed_slots += 1
+                next_due = self._next_due(
+                    pipeline, next_due + timedelta(microseconds=1)
+                )
+            due_polls.append(
+                DuePoll(pipeline=pipeline, due_utc=due, missed_slots=missed_slots)
+            )
+            heapq.heappush(self._queue, (next_due, order, pipeline))
+
+        for poll in due_polls:
+            if poll.missed_slots:
+                _LOGGER.warning(
+                    "poll catch-up: pipeline=%s missed_slots=%s",
+                    poll.pipeline,
+                    poll.missed_slots,
+                )
+        return due_polls
+
+    def _next_due(self, pipeline: str, at_utc: datetime) -> datetime:
+        config = self._configs[pipeline]
+        if isinstance(config, MicrobatchPipelineConfig):
+            return _ceil_aligned(at_utc, interval=self.interval)
+        return self._next_daily_due(config.poll_after_kst, at_utc)
+
+    def _next_daily_due(self, poll_after_kst: str, at_utc: datetime) -> datetime:
+        hour, minute = _parse_hhmm(poll_after_kst)
+        at_kst = at_utc.astimezone(KST)
+        day_start = at_kst.replace(hour=0, minute=0, second=0, microsecond=0)
+        window_start = day_start.replace(hour=hour, minute=minute)
+        if at_kst <= window_start:
+            return window_start.astimezone(timezone.utc)
+
+        steps = -((window_start - at_kst) // self.interval)
+        candidate = window_start + steps * self.interval
+        if candidate < day_start + timedelta(days=1):
+            return candidate.astimezone(timezone.utc)
+        next_window = window_start + timedelta(days=1)
+        return next_window.astimezone(timezone.utc)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import logging
+from typing import Any, Protocol
 
 from orchestrator.pipeline_monitoring_config import (
     PipelineMonitoringConfig,
@@ -9,10 +10,15 @@ from orchestrator.pipeline_monitoring_config import (
 )
 from orchestrator.utils.config import RuntimeSettings, load_runtime_settings
 from orchestrator.utils.time import KST
+from tools.data_collector import build_pipeline_states_query, split_pipeline_states
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class PipelineStateQueryRunner(Protocol):
+    def execute(self, query_spec: dict[str, Any]) -> Any: ...
+
+
 def _is_daily_batch_poll_due(*, poll_after_kst: str, now_utc: datetime) -> bool:
     now_kst = now_utc.astimezone(KST)
     current_hhmm = now_kst.strftime("%H:%M")
@@ -56,25 +62,42 @@ def pipelines_to_poll(
     return selected
 
 
+def fetch_pipeline_states(
+    query_runner: PipelineStateQueryRunner, pipelines: list[str]
+) -> dict[str, dict[str, Any] | None]:
+    if not pipelines:
+        return {}
+    rows = query_runner.execute(build_pipeline_states_query(pipelines))
+    return split_pipeline_states(pipelines, rows or [])
+
+
 def run_once(
     *,
     now_utc: datetime | None = None,
     settings: RuntimeSettings | None = None,
     monitoring_config: PipelineMonitoringConfig | None = None,
-) -> dict[str, list[str]]:
+    query_runner: PipelineStateQueryRunner | None = None,
+    due_pipelines: list[str] | None = None,
+) -> dict[str, Any]:
     runtime_settings = settings or load_runtime_settings()
     current_time = now_utc or datetime.now(timezone.utc)
-    polled = pipelines_to_poll(
-        target_pipelines=runtime_settings.target_pipelines,
-        now_utc=current_time,
-        monitoring_config=monitoring_config,
-    )
+    if due_pipelines is not None:
+        polled = list(due_pipelines)
+    else:
+        polled = pipelines_to_poll(
+            target_pipelines=runtime_settings.target_pipelines,
+            now_utc=current_time,
+            monitoring_config=monitoring_config,
+        )
     _LOGGER.info(
         "watchdog heartbeat: normal target=%s polled=%s",
         runtime_settings.target_pipelines,
         polled,
     )
-    return {
+    result: dict[str, Any] = {
         "target_pipelines": runtime_settings.target_pipelines,
         "polled_pipelines": polled,
     }
+    if query_runner is not None:
+        result["pipeline_states"] = fetch_pipeline_states(query_runner, polled)
+    return result
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark bad_records summarization throughput.
+
+Usage:
+    python scripts/benchmarks/bench_bad_records_summarizer.py [--rows N] [--reasons N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any, Iterator
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.bad_records_summarizer import (  # noqa: E402
+    REASON_CACHE_SIZE,
+    summarize_bad_record_batches,
+    summarize_bad_records,
+)
+
+
+def _synthetic_reasons(reason_cardinality: int) -> list[str]:
+    return [
+        json.dumps(
+            {
+                "field": f"field_{idx % 40}",
+                "rule": f"rule_{idx % 12}",
+                "detail": f"constraint_violation_{idx}",
+            },
+            ensure_ascii=False,
+        )
+        for idx in range(reason_cardinality)
+    ]
+
+
+def _synthetic_records(
+    row_count: int, reason_cardinality: int
+) -> Iterator[dict[str, Any]]:
+    reasons = _synthetic_reasons(reason_cardinality)
+    for idx in range(row_count):
+        yield {
+            "source_table": f"silver.table_{idx % 9}",
+            "reason": reasons[(idx * 7919) % reason_cardinality],
+            "record_json": '{"id": %d, "amount": 0}' % idx,
+        }
+
+
+def _synthetic_batches(
+    row_count: int, reason_cardinality: int, batch_size: int = 100_000
+) -> Iterator[dict[str, list[Any]]]:
+    rows = _synthetic_records(row_count, reason_cardinality)
+    while True:
+        batch = [row for _, row in zip(range(batch_size), rows)]
+        if not batch:
+            return
+        yield {
+            name: [row[name] for row in batch]
+            for name in ("source_table", "reason", "record_json")
+        }
+
+
+def _run_case(
+    label: str, row_count: int, reason_cardinality: int, **options: Any
+) -> None:
+    columnar = options.pop("columnar", False)
+    if columnar:
+        inputs: Any = list(_synthetic_batches(row_count, reason_cardinality))
+        summarize: Any = summarize_bad_record_batches
+    else:
+        inputs = list(_synthetic_records(row_count, reason_cardinality))
+        summarize = summarize_bad_records
+
+    started = time.perf_counter()
+    summary = summarize(inputs, include_metadata=True, **options)
+    elapsed = time.perf_counter() - started
+    cache = summary["metadata"]["reason_cache"]
+    print(
+        f"{label:<16} rows={row_count:>9} reasons={reason_cardinality:>6} "
+        f"elapsed={elapsed:8.3f}s rows/s={row_count / elapsed:>12,.0f} "
+        f"cache_hits={cache['hits']} cache_misses={cache['misses']}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--reasons", type=int, default=300)
+    args = parser.parse_args()
+
+    _run_case("no_cache", args.rows, args.reasons, reason_cache_size=0)
+    _run_case(
+        "reason_cache",
+        args.rows,
+        args.reasons,
+        reason_cache_size=REASON_CACHE_SIZE,
+    )
+    _run_case("columnar", args.rows, args.reasons, columnar=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark top-K violation selection against a full sort.
+
+Usage:
+    python scripts/benchmarks/bench_bad_records_top_k.py [--max-exponent N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.bad_records_summarizer import (  # noqa: E402
+    MAX_TYPE_COUNT,
+    BadRecordsAccumulator,
+)
+
+
+def _accumulator_with_keys(key_count: int) -> BadRecordsAccumulator:
+    rng = random.Random(key_count)
+    accumulator = BadRecordsAccumulator()
+    for idx in range(key_count):
+        key = (f"table_{idx % 17}", f"field_{idx % 31}", f"free_text_reason_{idx}")
+        accumulator._counts[key] = rng.randint(1, 50)
+    accumulator.total_records = sum(accumulator._counts.values())
+    return accumulator
+
+
+def _full_sort_selection(accumulator: BadRecordsAccumulator) -> list[Any]:
+    counts = accumulator._counts
+    sorted_keys = sorted(
+        counts,
+        key=lambda key: (-counts[key], key[0], key[1], key[2]),
+    )
+    return sorted_keys[:MAX_TYPE_COUNT]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-exponent", type=int, default=6)
+    args = parser.parse_args()
+
+    for exponent in range(2, args.max_exponent + 1):
+        key_count = 10**exponent
+        accumulator = _accumulator_with_keys(key_count)
+
+        started = time.perf_counter()
+        expected = _full_sort_selection(accumulator)
+        full_sort_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        summary = accumulator.summarize()
+        top_k_elapsed = time.perf_counter() - started
+
+        selected = [
+            (violation["source_table"], violation["field"], violation["reason"])
+            for violation in summary["types"]
+        ]
+        if selected != expected:
+            raise RuntimeError(f"top-K ordering diverged at {key_count} keys")
+        print(
+            f"keys={key_count:>9} full_sort={full_sort_elapsed * 1000:10.2f}ms "
+            f"top_k={top_k_elapsed * 1000:10.2f}ms "
+            f"speedup={full_sort_elapsed / top_k_elapsed:6.2f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark checkpoint DB write contention with N concurrent writers.
+
+Each writer alternates incident_registry upserts and llm_daily_usage increments,
+the two hot write paths that share the checkpoint DB file.
+
+Usage:
+    python scripts/benchmarks/bench_sqlite_store_contention.py [--writers N] [--ops N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from orchestrator.utils.sqlite_store import SqliteStore  # noqa: E402
+
+_REGISTRY_DDL = """
+CREATE TABLE IF NOT EXISTS incident_registry (
+    incident_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+_BUDGET_DDL = """
+CREATE TABLE IF NOT EXISTS llm_daily_usage (
+    day_key TEXT PRIMARY KEY,
+    request_count INTEGER NOT NULL
+)
+"""
+_REGISTRY_UPSERT = """
+INSERT INTO incident_registry (incident_id, status, updated_at) VALUES (?, ?, ?)
+ON CONFLICT(incident_id) DO UPDATE SET
+    status = excluded.status,
+    updated_at = excluded.updated_at
+"""
+_BUDGET_INCREMENT = """
+INSERT INTO llm_daily_usage(day_key, request_count) VALUES (?, 1)
+ON CONFLICT(day_key) DO UPDATE
+SET request_count = llm_daily_usage.request_count + 1
+"""
+
+
+def _legacy_writer(db_path: Path) -> Callable[[int, int], None]:
+    def _write(writer: int, op: int) -> None:
+        with sqlite3.connect(db_path, timeout=30.0) as conn:
+            if op % 2:
+                conn.execute(_BUDGET_DDL)
+                conn.execute(_BUDGET_INCREMENT, ("2026-01-01",))
+            else:
+                conn.execute(_REGISTRY_DDL)
+                conn.execute(
+                    _REGISTRY_UPSERT, (f"inc-{writer}", "running", str(time.time()))
+                )
+        conn.close()
+
+    return _write
+
+
+def _store_writer(store: SqliteStore) -> Callable[[int, int], None]:
+    store.migrate("bench_v1", _REGISTRY_DDL, _BUDGET_DDL)
+
+    def _write(writer: int, op: int) -> None:
+        if op % 2:
+            store.execute(_BUDGET_INCREMENT, ("2026-01-01",))
+        else:
+            store.execute(
+                _REGISTRY_UPSERT, (f"inc-{writer}", "running", str(time.time()))
+            )
+
+    return _write
+
+
+def _run_case(
+    label: str, write: Callable[[int, int], None], writers: int, ops: int
+) -> None:
+    latencies: list[float] = []
+
+    def _worker(writer: int) -> None:
+        for op in range(ops):
+            started = time.perf_counter()
+            write(writer, op)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        list(pool.map(_worker, range(writers)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    total = writers * ops
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(
+        f"{label:<14} writers={writers:>3} ops={total:>7} "
+        f"elapsed={elapsed:8.3f}s ops/s={total / elapsed:>10,.0f} "
+        f"p50={p50:7.2f}ms p99={p99:7.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = Path(tmp_dir) / "legacy.db"
+        _run_case("legacy", _legacy_writer(legacy_path), args.writers, args.ops)
+
+        store = SqliteStore(Path(tmp_dir) / "store.db")
+        try:
+            _run_case("sqlite_store", _store_writer(store), args.writers, args.ops)
+            print(f"{'':<14} store_stats={store.stats()}")
+        finally:
+            store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
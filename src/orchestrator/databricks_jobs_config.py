@@ -6,6 +6,8 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, ConfigDict
 
+from .utils.config_cache import CONFIG_CACHE
+
 
 class _StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
@@ -53,6 +55,11 @@ _UniqueKeyLoader.add_constructor(
 )
 
 
+def _parse_databricks_jobs_config(content: bytes) -> DatabricksJobsConfig:
+    raw_config = yaml.load(content, Loader=_UniqueKeyLoader)
+    return DatabricksJobsConfig.model_validate(raw_config)
+
+
 def default_databricks_jobs_config_path() -> Path:
     return Path(__file__).resolve().parents[2] / "config" / "databricks_jobs.yaml"
 
@@ -65,6 +72,4 @@ def load_databricks_jobs_config(
         if config_path is not None
         else default_databricks_jobs_config_path()
     )
-    with path.open("r", encoding="utf-8") as handle:
-        raw_config = yaml.load(handle, Loader=_UniqueKeyLoader)
-    return DatabricksJobsConfig.model_validate(raw_config)
+    return CONFIG_CACHE.load(path, _parse_databricks_jobs_config)
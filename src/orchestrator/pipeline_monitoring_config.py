@@ -6,6 +6,8 @@ from typing import Any, Literal
 import yaml
 from pydantic import BaseModel, ConfigDict
 
+from .utils.config_cache import CONFIG_CACHE
+
 
 class _StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
@@ -43,6 +45,11 @@ class PipelineMonitoringConfig(_StrictModel):
     pipelines: PipelinesConfig
 
 
+def _parse_pipeline_monitoring_config(content: bytes) -> PipelineMonitoringConfig:
+    raw_config: dict[str, Any] = yaml.safe_load(content)
+    return PipelineMonitoringConfig.model_validate(raw_config)
+
+
 def default_pipeline_monitoring_config_path() -> Path:
     return Path(__file__).resolve().parents[2] / "config" / "pipeline_monitoring.yaml"
 
@@ -55,6 +62,4 @@ def load_pipeline_monitoring_config(
         if config_path is not None
         else default_pipeline_monitoring_config_path()
     )
-    with path.open("r", encoding="utf-8") as handle:
-        raw_config: dict[str, Any] = yaml.safe_load(handle)
-    return PipelineMonitoringConfig.model_validate(raw_config)
+    return CONFIG_CACHE.load(path, _parse_pipeline_monitoring_config)
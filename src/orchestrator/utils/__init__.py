@@ -1,10 +1,17 @@
 from .config import RuntimeSettings, load_runtime_settings
+from .config_cache import ConfigCache, config_cache_stats, invalidate_config_cache
+from .sqlite_store import SqliteStore, shared_sqlite_store
 from .time import parse_pipeline_ts, to_kst, to_utc
 
 __all__ = [
+    "ConfigCache",
     "RuntimeSettings",
+    "SqliteStore",
+    "config_cache_stats",
+    "invalidate_config_cache",
     "load_runtime_settings",
     "parse_pipeline_ts",
+    "shared_sqlite_store",
     "to_kst",
     "to_utc",
 ]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import threading
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _CacheEntry:
+    mtime_ns: int
+    size: int
+    digest: str
+    value: Any
+
+
+class ConfigCache:
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Path, Callable[[bytes], Any]], _CacheEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str | Path, parse: Callable[[bytes], T]) -> T:
+        resolved = Path(path).expanduser().resolve()
+        key = (resolved, parse)
+        stat = resolved.stat()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                self._hits += 1
+                return entry.value
+
+        content = resolved.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.digest == digest:
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.size = stat.st_size
+                self._hits += 1
+                return entry.value
+
+        value = parse(content)
+        with self._lock:
+            self._entries[key] = _CacheEntry(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                digest=digest,
+                value=value,
+            )
+            self._misses += 1
+        return value
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            resolved = Path(path).expanduser().resolve()
+            for key in [key for key in self._entries if key[0] == resolved]:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+CONFIG_CACHE = ConfigCache()
+
+
+def config_cache_stats() -> dict[str, int]:
+    return CONFIG_CACHE.stats()
+
+
+def invalidate_config_cache(path: str | Path | None = None) -> None:
+    CONFIG_CACHE.invalidate(path)
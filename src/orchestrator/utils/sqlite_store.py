@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any
+
+DEFAULT_BUSY_TIMEOUT_SECONDS = 30.0
+DEFAULT_BUSY_RETRIES = 5
+DEFAULT_RETRY_DELAY_SECONDS = 0.05
+DEFAULT_MAX_IDLE_CONNECTIONS = 8
+STATEMENT_CACHE_SIZE = 256
+
+MEMORY_PATH = ":memory:"
+
+_BUSY_MARKERS = ("database is locked", "database is busy", "database table is locked")
+
+
+def is_busy_error(exc: BaseException) -> bool:
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    message = str(exc).lower()
+    return any(marker in message for marker in _BUSY_MARKERS)
+
+
+def connect_sqlite(
+    db_path: str | Path,
+    *,
+    busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+) -> sqlite3.Connection:
+    path = str(db_path)
+    if path != MEMORY_PATH:
+        Path(path).expanduser().resolve().parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        path,
+        timeout=busy_timeout_seconds,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class SqliteStore:
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        busy_timeout_seconds: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+        busy_retries: int = DEFAULT_BUSY_RETRIES,
+        retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+        max_idle_connections: int = DEFAULT_MAX_IDLE_CONNECTIONS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if busy_retries < 0:
+            raise ValueError("busy_retries must be a non-negative integer")
+        if max_idle_connections <= 0:
+            raise ValueError("max_idle_connections must be a positive integer")
+        self.db_path = str(db_path)
+        self._busy_timeout_seconds = busy_timeout_seconds
+        self._busy_retries = busy_retries
+        self._retry_delay_seconds = retry_delay_seconds
+        self._max_idle_connections = max_idle_connections
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._idle: list[sqlite3.Connection] = []
+        self._migrated: set[str] = set()
+        self._migration_lock = threading.Lock()
+        self._closed = False
+        self._connections_opened = 0
+        self._busy_retry_count = 0
+        self._memory_lock: threading.RLock | None = None
+        if self.db_path == MEMORY_PATH:
+            self._memory_lock = threading.RLock()
+            self._idle.append(self._open())
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        if self._memory_lock is not None:
+            with self._memory_lock:
+                self._ensure_open()
+                yield self._idle[0]
+            return
+
+        with self._lock:
+            self._ensure_open()
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as conn:
+            self._with_busy_retry(lambda: conn.execute("BEGIN IMMEDIATE"))
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        with self.connection() as conn:
+            cursor = self._with_busy_retry(lambda: conn.execute(sql, params))
+            return cursor.rowcount
+
+    def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        if not rows:
+            return 0
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> tuple[Any, ...] | None:
+        with self.connection() as conn:
+            return self._with_busy_retry(lambda: conn.execute(sql, params).fetchone())
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        with self.connection() as conn:
+            return self._with_busy_retry(lambda: conn.execute(sql, params).fetchall())
+
+    def migrate(self, name: str, *statements: str) -> None:
+        if name in self._migrated:
+            return
+        with self._migration_lock:
+            if name in self._migrated:
+                return
+            with self.transaction() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        name TEXT PRIMARY KEY,
+                        applied_at TEXT NOT NULL
+                    )
+                    """
+                )
+                applied = conn.execute(
+                    "SELECT 1 FROM schema_migrations WHERE name = ?", (name,)
+                ).fetchone()
+                if applied is None:
+                    for statement in statements:
+                        conn.execute(statement)
+                    conn.execute(
+                        "INSERT INTO schema_migrations (name, applied_at) VALUES (?, ?)",
+                        (name, datetime.now(timezone.utc).isoformat()),
+                    )
+            self._migrated.add(name)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "connections_opened": self._connections_opened,
+                "idle_connections": len(self._idle),
+                "busy_retries": self._busy_retry_count,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = connect_sqlite(
+            self.db_path, busy_timeout_seconds=self._busy_timeout_seconds
+        )
+        with self._lock:
+            self._connections_opened += 1
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if not self._closed and len(self._idle) < self._max_idle_connections:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise sqlite3.ProgrammingError(f"sqlite store is closed: {self.db_path}")
+
+    def _with_busy_retry(self, operation: Callable[[], Any]) -> Any:
+        for attempt in range(self._busy_retries + 1):
+            try:
+                return operation()
+            except sqlite3.OperationalError as exc:
+                if not is_busy_error(exc) or attempt >= self._busy_retries:
+                    raise
+                with self._lock:
+                    self._busy_retry_count += 1
+                self._sleep(self._retry_delay_seconds * (2**attempt))
+        raise AssertionError("unreachable")
+
+
+_SHARED_STORES: dict[Path, SqliteStore] = {}
+_SHARED_STORES_LOCK = threading.Lock()
+
+
+def shared_sqlite_store(db_path: str | Path) -> SqliteStore:
+    if str(db_path) == MEMORY_PATH:
+        return SqliteStore(db_path)
+    resolved = Path(db_path).expanduser().resolve()
+    with _SHARED_STORES_LOCK:
+        store = _SHARED_STORES.get(resolved)
+        if store is None:
+            store = SqliteStore(resolved)
+            _SHARED_STORES[resolved] = store
+        return store
+
+
+def close_shared_sqlite_stores() -> None:
+    with _SHARED_STORES_LOCK:
+        stores = list(_SHARED_STORES.values())
+        _SHARED_STORES.clear()
+    for store in stores:
+        store.close()
+
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_SECONDS",
+    "SqliteStore",
+    "close_shared_sqlite_stores",
+    "connect_sqlite",
+    "is_busy_error",
+    "shared_sqlite_store",
+]
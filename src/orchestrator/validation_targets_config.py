@@ -6,6 +6,8 @@ from typing import Any, Literal
 import yaml
 from pydantic import BaseModel, ConfigDict, model_validator
 
+from .utils.config_cache import CONFIG_CACHE
+
 
 class _StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
@@ -171,6 +173,11 @@ class ValidationTargetsConfig(_StrictModel):
         return self
 
 
+def _parse_validation_targets_config(content: bytes) -> ValidationTargetsConfig:
+    raw_config: dict[str, Any] = yaml.safe_load(content)
+    return ValidationTargetsConfig.model_validate(raw_config)
+
+
 def default_validation_targets_config_path() -> Path:
     return Path(__file__).resolve().parents[2] / "config" / "validation_targets.yaml"
 
@@ -183,6 +190,4 @@ def load_validation_targets_config(
         if config_path is not None
         else default_validation_targets_config_path()
     )
-    with path.open("r", encoding="utf-8") as handle:
-        raw_config: dict[str, Any] = yaml.safe_load(handle)
-    return ValidationTargetsConfig.model_validate(raw_config)
+    return CONFIG_CACHE.load(path, _parse_validation_targets_config)
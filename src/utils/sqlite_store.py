@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from orchestrator.utils.sqlite_store import (
+    DEFAULT_BUSY_TIMEOUT_SECONDS,
+    SqliteStore,
+    close_shared_sqlite_stores,
+    connect_sqlite,
+    is_busy_error,
+    shared_sqlite_store,
+)
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_SECONDS",
+    "SqliteStore",
+    "close_shared_sqlite_stores",
+    "connect_sqlite",
+    "is_busy_error",
+    "shared_sqlite_store",
+]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -12,3 +13,13 @@ if str(ROOT) not in sys.path:
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+from tools.rate_limiter import reset_rate_limiters  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_rate_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
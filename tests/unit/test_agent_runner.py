@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
 import sqlite3
 from pathlib import Path
+import time
 from typing import Any
 import json
 
@@ -10,6 +10,7 @@ import pytest
 
 import runtime.agent_runner as agent_runner_module
 from runtime.agent_runner import AgentRunner, _status_value
+from runtime.checkpoint_serde import LeanCheckpointSerializer
 
 
 class _SpyGraph:
@@ -211,17 +212,24 @@ def test_agent_runner_resume_smoke_after_process_restart(tmp_path: Path) -> None
     )
 
 
+class _FakeSqliteSaver:
+    def __init__(self, conn: sqlite3.Connection, *, serde: Any) -> None:
+        self.conn = conn
+        self.serde = serde
+
+
 def test_agent_runner_initializes_sqlite_saver_from_checkpoint_db_path(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    captured: dict[str, str] = {}
+    captured: dict[str, Any] = {}
 
-    class _FakeSqliteSaver:
-        @staticmethod
-        def from_conn_string(value: str) -> object:
-            captured["path"] = value
-            return object()
+    def _graph_factory(*, checkpointer: _FakeSqliteSaver) -> _SpyGraph:
+        captured["database"] = checkpointer.conn.execute(
+            "PRAGMA database_list"
+        ).fetchone()[2]
+        captured["serde"] = checkpointer.serde
+        return _SpyGraph()
 
     monkeypatch.setattr(
         "runtime.agent_runner._load_sqlite_saver",
@@ -229,42 +237,23 @@ def test_agent_runner_initializes_sqlite_saver_from_checkpoint_db_path(
     )
 
     db_path = tmp_path / "checkpoints" / "agent.db"
-    AgentRunner(
+    runner = AgentRunner(
         checkpoint_db_path=str(db_path),
-        graph_factory=lambda *, checkpointer: _SpyGraph(),
+        graph_factory=_graph_factory,
     )
+    runner.close()
 
-    assert captured["path"] == str(db_path)
+    assert captured["database"] == str(db_path)
+    assert isinstance(captured["serde"], LeanCheckpointSerializer)
 
 
-def test_agent_runner_uses_entered_checkpointer_when_factory_returns_context_manager(
+def test_agent_runner_closes_sqlite_checkpointer_connection_on_close(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
-    lifecycle: dict[str, Any] = {
-        "entered": False,
-        "exited": False,
-    }
-    entered_checkpointer = object()
-
-    class _FakeSqliteSaver:
-        @staticmethod
-        def from_conn_string(value: str) -> Any:
-            _ = value
-
-            @contextmanager
-            def _checkpointer_cm():
-                lifecycle["entered"] = True
-                try:
-                    yield entered_checkpointer
-                finally:
-                    lifecycle["exited"] = True
-
-            return _checkpointer_cm()
-
     captured: dict[str, Any] = {}
 
-    def _graph_factory(*, checkpointer: object) -> _SpyGraph:
+    def _graph_factory(*, checkpointer: _FakeSqliteSaver) -> _SpyGraph:
         captured["checkpointer"] = checkpointer
         return _SpyGraph()
 
@@ -273,18 +262,19 @@ def test_agent_runner_uses_entered_checkpointer_when_factory_returns_context_man
         lambda: _FakeSqliteSaver,
     )
 
-    db_path = tmp_path / "checkpoints" / "agent.db"
     runner = AgentRunner(
-        checkpoint_db_path=str(db_path),
+        checkpoint_db_path=str(tmp_path / "agent.db"),
         graph_factory=_graph_factory,
     )
-
-    assert lifecycle["entered"] is True
-    assert captured["checkpointer"] is entered_checkpointer
+    checkpointer = captured["checkpointer"]
+    checkpointer.conn.execute("SELECT 1")
 
     runner.close()
 
-    assert lifecycle["exited"] is True
+    with pytest.raises(sqlite3.ProgrammingError):
+        checkpointer.conn.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        checkpointer.serde.blob_store.count()
 
 
 def test_agent_runner_invoke_with_memory_checkpoint_path_keeps_registry_available() -> (
@@ -476,3 +466,106 @@ def test_status_value_boundary_rules(
     expected: str,
 ) -> None:
     assert _status_value(final_status, default=default) == expected
+
+
+class _SlowPipelineGraph:
+    def __init__(self, delay_seconds: float, failing_pipeline: str | None = None):
+        self._delay_seconds = delay_seconds
+        self._failing_pipeline = failing_pipeline
+
+    def invoke(self, state: dict[str, Any], config: dict[str, Any]) -> dict[str, Any]:
+        _ = config
+        time.sleep(self._delay_seconds)
+        if state.get("pipeline") == self._failing_pipeline:
+            raise TimeoutError("analyze llm call timed out")
+        return {**state, "final_status": "resolved"}
+
+
+def _incident_states(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "incident_id": f"inc-par-{idx}",
+            "pipeline": f"pipeline_{idx}",
+            "detected_at": "2026-02-23T00:00:00+00:00",
+            "fingerprint": f"fp-par-{idx}",
+        }
+        for idx in range(count)
+    ]
+
+
+def test_agent_runner_invoke_many_runs_incident_graphs_concurrently(
+    tmp_path: Path,
+) -> None:
+    runner = AgentRunner(
+        checkpoint_db_path=str(tmp_path / "checkpoints" / "agent.db"),
+        graph_factory=lambda *, checkpointer: _SlowPipelineGraph(0.2),
+        checkpointer_factory=lambda _path: object(),
+    )
+
+    started = time.monotonic()
+    outcomes = runner.invoke_many(_incident_states(3), max_workers=3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert [outcome.incident_id for outcome in outcomes] == [
+        "inc-par-0",
+        "inc-par-1",
+        "inc-par-2",
+    ]
+    assert all(outcome.ok for outcome in outcomes)
+    assert outcomes[1].result is not None
+    assert outcomes[1].result["final_status"] == "resolved"
+
+
+def test_agent_runner_invoke_many_isolates_per_pipeline_failures(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "checkpoints" / "agent.db"
+    runner = AgentRunner(
+        checkpoint_db_path=str(db_path),
+        graph_factory=lambda *, checkpointer: _SlowPipelineGraph(0.0, "pipeline_1"),
+        checkpointer_factory=lambda _path: object(),
+    )
+
+    outcomes = runner.invoke_many(_incident_states(3))
+
+    assert [outcome.ok for outcome in outcomes] == [True, False, True]
+    assert isinstance(outcomes[1].error, TimeoutError)
+    assert outcomes[1].pipeline == "pipeline_1"
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT incident_id FROM incident_registry ORDER BY incident_id"
+        ).fetchall()
+    assert rows == [("inc-par-0",), ("inc-par-2",)]
+
+
+def test_agent_runner_invoke_many_serializes_concurrent_registry_writes(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "checkpoints" / "agent.db"
+    runner = AgentRunner(
+        checkpoint_db_path=str(db_path),
+        graph_factory=lambda *, checkpointer: _SlowPipelineGraph(0.0),
+        checkpointer_factory=lambda _path: object(),
+    )
+
+    outcomes = runner.invoke_many(_incident_states(40), max_workers=8)
+
+    assert all(outcome.ok for outcome in outcomes)
+    with sqlite3.connect(db_path) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM incident_registry").fetchone()
+    assert count == (40,)
+
+
+def test_agent_runner_invoke_many_rejects_duplicate_incident_ids(
+    tmp_path: Path,
+) -> None:
+    runner = AgentRunner(
+        checkpoint_db_path=str(tmp_path / "checkpoints" / "agent.db"),
+        graph_factory=lambda *, checkpointer: _SpyGraph(),
+        checkpointer_factory=lambda _path: object(),
+    )
+    states = _incident_states(2) + _incident_states(1)
+
+    with pytest.raises(ValueError, match="duplicate incident_id in batch: inc-par-0"):
+        runner.invoke_many(states)
@@ -41,8 +41,12 @@ def test_agent_state_fields_match_spec() -> None:
         "detected_at",
         "fingerprint",
         "fingerprint_duplicate",
+        "exception_ledger",
+        "dq_status",
+        "bad_records",
         "pipeline_states",
         "detected_issues",
+        "collect_query_timings",
         "exceptions",
         "dq_tags",
         "bad_records_summary",
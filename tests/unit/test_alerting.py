@@ -77,6 +77,7 @@ def test_emit_alert_serializes_minimal_payload_and_sends_request() -> None:
 
 def test_emit_alert_retries_when_error_is_transient() -> None:
     attempts = 0
+    delays: list[float] = []
 
     def sender(request: Request, timeout: float) -> _StubResponse:
         del request, timeout
@@ -103,13 +104,16 @@ def test_emit_alert_retries_when_error_is_transient() -> None:
             "LOG_ANALYTICS_STREAM_NAME": "Custom-AiAgentEvents",
         },
         sender=sender,
+        sleep=delays.append,
     )
 
     assert attempts == 3
+    assert delays == pytest.approx([0.5, 1.0], rel=0.1)
 
 
 def test_emit_alert_retries_when_transient_status_is_returned() -> None:
     attempts = 0
+    delays: list[float] = []
 
     def sender(request: Request, timeout: float) -> _StubResponse:
         del request, timeout
@@ -130,13 +134,16 @@ def test_emit_alert_retries_when_transient_status_is_returned() -> None:
             "LOG_ANALYTICS_STREAM_NAME": "Custom-AiAgentEvents",
         },
         sender=sender,
+        sleep=delays.append,
     )
 
     assert attempts == 3
+    assert delays == pytest.approx([0.5, 1.0], rel=0.1)
 
 
 def test_emit_alert_raises_transient_error_after_retry_limit() -> None:
     attempts = 0
+    delays: list[float] = []
 
     def sender(request: Request, timeout: float) -> _StubResponse:
         del request, timeout
@@ -162,9 +169,11 @@ def test_emit_alert_raises_transient_error_after_retry_limit() -> None:
                 "LOG_ANALYTICS_STREAM_NAME": "Custom-AiAgentEvents",
             },
             sender=sender,
+            sleep=delays.append,
         )
 
     assert attempts == 3
+    assert len(delays) == 2
     assert "[ALERT][TRANSIENT]" in str(exc_info.value)
 
 
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 import json
+from typing import Any
+
+import pytest
 
 from tools.bad_records_summarizer import (
     MAX_FIELD_LENGTH,
@@ -9,12 +14,56 @@ from tools.bad_records_summarizer import (
     MAX_SAMPLES_PER_TYPE,
     MAX_TABLE_LENGTH,
     MAX_TYPE_COUNT,
+    BadRecordsAccumulator,
+    summarize_bad_record_batches,
+    summarize_bad_record_chunks,
     summarize_bad_records,
+    summarize_bad_records_sharded,
 )
 
+SummarizeFn = Callable[..., dict[str, Any]]
+
+
+def _to_columns(records: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    names = ("source_table", "reason", "record_json")
+    return {name: [record.get(name) for record in records] for name in names}
+
+
+def _summarize_via_columns(
+    records: list[dict[str, Any]], **kwargs: Any
+) -> dict[str, Any]:
+    return summarize_bad_record_batches([_to_columns(records)], **kwargs)
+
+
+@pytest.fixture(params=["records", "columns"])
+def summarize(request: pytest.FixtureRequest) -> SummarizeFn:
+    if request.param == "columns":
+        return _summarize_via_columns
+    return summarize_bad_records
+
+
+def _synthetic_records(count: int, *, type_cardinality: int) -> list[dict[str, str]]:
+    records: list[dict[str, str]] = []
+    for idx in range(count):
+        type_idx = idx % type_cardinality
+        records.append(
+            {
+                "source_table": f"table_{type_idx % 7}",
+                "reason": json.dumps(
+                    {
+                        "field": f"field_{type_idx % 5}",
+                        "detail": f"violation_{type_idx}",
+                    },
+                    ensure_ascii=False,
+                ),
+                "record_json": json.dumps({"index": idx}, ensure_ascii=False),
+            }
+        )
+    return records
+
 
-def test_summarize_bad_records_with_zero_records() -> None:
-    assert summarize_bad_records([]) == {
+def test_summarize_bad_records_with_zero_records(summarize: SummarizeFn) -> None:
+    assert summarize([]) == {
         "total_records": 0,
         "type_count": 0,
         "types_truncated": False,
@@ -22,7 +71,9 @@ def test_summarize_bad_records_with_zero_records() -> None:
     }
 
 
-def test_summarize_bad_records_with_one_record_and_abbreviation() -> None:
+def test_summarize_bad_records_with_one_record_and_abbreviation(
+    summarize: SummarizeFn,
+) -> None:
     long_source_table = "source_" + ("table_" * 40)
     long_field = "field_" + ("name_" * 40)
     long_reason = "reason_" + ("detail_" * 60)
@@ -42,7 +93,7 @@ def test_summarize_bad_records_with_one_record_and_abbreviation() -> None:
         }
     ]
 
-    result = summarize_bad_records(records)
+    result = summarize(records)
 
     assert result["total_records"] == 1
     assert result["type_count"] == 1
@@ -68,7 +119,9 @@ def test_summarize_bad_records_with_one_record_and_abbreviation() -> None:
     assert len(sample["record_json"]) <= 240
 
 
-def test_summarize_bad_records_with_large_volume_has_hard_bounds() -> None:
+def test_summarize_bad_records_with_large_volume_has_hard_bounds(
+    summarize: SummarizeFn,
+) -> None:
     records: list[dict[str, str]] = []
 
     for idx in range(10_000):
@@ -90,7 +143,7 @@ def test_summarize_bad_records_with_large_volume_has_hard_bounds() -> None:
             }
         )
 
-    result = summarize_bad_records(records)
+    result = summarize(records)
 
     assert result["total_records"] == 10_000
     assert result["type_count"] == 50
@@ -108,7 +161,9 @@ def test_summarize_bad_records_with_large_volume_has_hard_bounds() -> None:
             assert len(sample["record_json"]) <= 240
 
 
-def test_summarize_bad_records_does_not_merge_types_with_truncated_reason() -> None:
+def test_summarize_bad_records_does_not_merge_types_with_truncated_reason(
+    summarize: SummarizeFn,
+) -> None:
     records = [
         {
             "source_table": "events",
@@ -134,14 +189,16 @@ def test_summarize_bad_records_does_not_merge_types_with_truncated_reason() -> N
         },
     ]
 
-    result = summarize_bad_records(records, max_reason_length=10)
+    result = summarize(records, max_reason_length=10)
 
     assert result["total_records"] == 2
     assert result["type_count"] == 2
     assert sorted(violation["count"] for violation in result["types"]) == [1, 1]
 
 
-def test_summarize_bad_records_large_volume_serialized_size_is_bounded() -> None:
+def test_summarize_bad_records_large_volume_serialized_size_is_bounded(
+    summarize: SummarizeFn,
+) -> None:
     records: list[dict[str, str]] = []
 
     for idx in range(12_500):
@@ -166,7 +223,7 @@ def test_summarize_bad_records_large_volume_serialized_size_is_bounded() -> None
             }
         )
 
-    result = summarize_bad_records(records)
+    result = summarize(records)
     serialized = json.dumps(result, ensure_ascii=False)
 
     assert result["total_records"] == 12_500
@@ -182,3 +239,187 @@ def test_summarize_bad_records_large_volume_serialized_size_is_bounded() -> None
             assert len(sample["record_json"]) <= MAX_RECORD_JSON_LENGTH
 
     assert len(serialized.encode("utf-8")) <= 160_000
+
+
+def test_summarize_bad_records_accepts_single_pass_iterator() -> None:
+    records = _synthetic_records(3_000, type_cardinality=80)
+    consumed: list[int] = []
+
+    def _stream() -> Iterator[dict[str, str]]:
+        for idx, record in enumerate(records):
+            consumed.append(idx)
+            yield record
+
+    assert summarize_bad_records(_stream()) == summarize_bad_records(records)
+    assert len(consumed) == len(records)
+
+
+def test_summarize_bad_record_chunks_matches_materialized_list() -> None:
+    records = _synthetic_records(2_500, type_cardinality=120)
+    chunks = (records[offset : offset + 333] for offset in range(0, len(records), 333))
+
+    assert summarize_bad_record_chunks(chunks) == summarize_bad_records(records)
+
+
+def test_accumulator_keeps_bounded_samples_per_violation_key() -> None:
+    accumulator = BadRecordsAccumulator(max_samples_per_type=3)
+    accumulator.extend(_synthetic_records(10_000, type_cardinality=4))
+
+    assert accumulator.total_records == 10_000
+    assert accumulator.key_count == 4
+    assert all(len(samples) <= 3 for samples in accumulator._samples.values())
+
+    result = accumulator.summarize()
+    assert [violation["count"] for violation in result["types"]] == [2_500] * 4
+    assert all(violation["samples_truncated"] for violation in result["types"])
+    assert result["types"][0]["samples"] == [
+        {"record_json": '{"index": 0}'},
+        {"record_json": '{"index": 4}'},
+        {"record_json": '{"index": 8}'},
+    ]
+
+
+def test_reason_cache_reports_hits_and_misses_in_metadata() -> None:
+    records = _synthetic_records(1_000, type_cardinality=25)
+
+    result = summarize_bad_records(records, include_metadata=True)
+
+    assert result["metadata"]["reason_cache"] == {
+        "hits": 975,
+        "misses": 25,
+        "size": 25,
+        "max_size": 4096,
+    }
+    result.pop("metadata")
+    assert result == summarize_bad_records(records, reason_cache_size=0)
+
+
+def test_reason_cache_is_bounded_and_evicts_least_recently_used() -> None:
+    records = _synthetic_records(400, type_cardinality=20)
+
+    accumulator = BadRecordsAccumulator(reason_cache_size=8)
+    accumulator.extend(records)
+
+    stats = accumulator.reason_cache_stats()
+    assert stats["size"] == 8
+    assert stats["hits"] == 0
+    assert stats["misses"] == 400
+    assert accumulator.summarize() == summarize_bad_records(records)
+
+
+def test_summary_omits_metadata_by_default() -> None:
+    result = summarize_bad_records(_synthetic_records(10, type_cardinality=2))
+
+    assert "metadata" not in result
+
+
+def test_accumulator_merge_matches_single_accumulator() -> None:
+    records = _synthetic_records(1_200, type_cardinality=90)
+
+    left = BadRecordsAccumulator().extend(records[:500])
+    right = BadRecordsAccumulator().extend(records[500:])
+
+    assert left.merge(right).summarize() == summarize_bad_records(records)
+
+
+def test_sharded_summary_is_identical_to_serial_summary() -> None:
+    records = _synthetic_records(4_000, type_cardinality=150)
+    # Equal-count ties across keys exercise the table/field/reason tie-break.
+    records.extend(
+        {
+            "source_table": "tie_table",
+            "reason": json.dumps({"field": "f", "detail": f"tie_{idx % 3}"}),
+            "record_json": json.dumps({"tie": idx}),
+        }
+        for idx in range(90)
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        sharded = summarize_bad_records_sharded(
+            records,
+            shard_size=257,
+            max_workers=2,
+            executor=executor,
+        )
+
+    serial = summarize_bad_records(records)
+    assert sharded == serial
+    assert sharded["types_truncated"] is True
+    assert any(violation["samples_truncated"] for violation in sharded["types"])
+
+
+def test_sharded_summary_rejects_non_positive_shard_size() -> None:
+    with pytest.raises(ValueError, match="shard_size must be a positive integer"):
+        summarize_bad_records_sharded([], shard_size=0)
+
+
+def test_columnar_batches_match_row_path_across_batch_boundaries() -> None:
+    records = _synthetic_records(3_000, type_cardinality=140)
+    batches = [
+        _to_columns(records[offset : offset + 700])
+        for offset in range(0, len(records), 700)
+    ]
+
+    assert summarize_bad_record_batches(batches) == summarize_bad_records(records)
+
+
+def test_columnar_path_accepts_arrow_like_batches_and_missing_columns() -> None:
+    class _ArrowLikeBatch:
+        def __init__(self, columns: dict[str, list[Any]]) -> None:
+            self._columns = columns
+
+        def to_pydict(self) -> dict[str, list[Any]]:
+            return self._columns
+
+    records = [{"reason": "not-json"}, {"reason": "not-json"}]
+    batch = _ArrowLikeBatch({"reason": ["not-json", "not-json"]})
+
+    assert summarize_bad_record_batches([batch]) == summarize_bad_records(records)
+
+
+def test_columnar_path_falls_back_for_unhashable_reason_cells() -> None:
+    records = [
+        {
+            "source_table": "silver.orders",
+            "reason": {"field": "amount", "detail": "amount <= 0"},
+            "record_json": '{"id": 1}',
+        }
+    ]
+
+    assert summarize_bad_record_batches([_to_columns(records)]) == (
+        summarize_bad_records(records)
+    )
+
+
+def test_columnar_path_rejects_ragged_columns() -> None:
+    with pytest.raises(ValueError, match="equal lengths"):
+        summarize_bad_record_batches([{"source_table": ["a"], "reason": []}])
+
+
+def test_top_k_selection_matches_full_sort_ordering() -> None:
+    records: list[dict[str, str]] = []
+    for type_idx in range(2_000):
+        repeat_count = (type_idx * 37) % 5 + 1
+        for _ in range(repeat_count):
+            records.append(
+                {
+                    "source_table": f"table_{type_idx % 3}",
+                    "reason": json.dumps(
+                        {"field": f"field_{type_idx % 4}", "detail": f"r_{type_idx}"}
+                    ),
+                    "record_json": "{}",
+                }
+            )
+
+    result = summarize_bad_records(records, max_type_count=25)
+
+    accumulator = BadRecordsAccumulator().extend(records)
+    counts = accumulator._counts
+    expected_keys = sorted(
+        counts, key=lambda key: (-counts[key], key[0], key[1], key[2])
+    )[:25]
+    assert [
+        (violation["source_table"], violation["field"], violation["reason"])
+        for violation in result["types"]
+    ] == expected_keys
+    assert result["types_truncated"] is True
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+from typing import Any, Optional, TypedDict
+
+import pytest
+
+from runtime.agent_runner import create_sqlite_checkpointer
+from runtime.checkpoint_serde import (
+    BLOB_TYPE,
+    CheckpointBlobStore,
+    LeanCheckpointSerializer,
+)
+
+pytest.importorskip("langgraph.checkpoint.serde.jsonplus")
+
+
+def _raw_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {"reason": "null_amount", "record_json": f'{{"id": {index}}}'}
+        for index in range(count)
+    ]
+
+
+def _checkpoint(bad_records: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "v": 4,
+        "id": "checkpoint-1",
+        "channel_values": {
+            "incident_id": "inc-1",
+            "bad_records": bad_records,
+            "dq_status": None,
+            "__start__": {"incident_id": "inc-1", "bad_records": bad_records},
+        },
+    }
+
+
+def test_lean_serializer_replaces_raw_fields_with_blob_references(
+    tmp_path: Path,
+) -> None:
+    store = CheckpointBlobStore(tmp_path / "checkpoints.db")
+    serde = LeanCheckpointSerializer(store)
+
+    small = serde.dumps_typed(_checkpoint(_raw_rows(5)))
+    large = serde.dumps_typed(_checkpoint(_raw_rows(5000)))
+
+    assert len(large[1]) == len(small[1])
+    assert store.count() == 2
+
+    restored = serde.loads_typed(large)
+    assert restored["channel_values"]["bad_records"] == _raw_rows(5000)
+    assert restored["channel_values"]["__start__"]["bad_records"] == _raw_rows(5000)
+    assert restored["channel_values"]["dq_status"] is None
+    store.close()
+
+
+def test_lean_serializer_stores_repeated_raw_values_once(tmp_path: Path) -> None:
+    store = CheckpointBlobStore(tmp_path / "checkpoints.db")
+    serde = LeanCheckpointSerializer(store)
+    bad_records = _raw_rows(100)
+
+    for _ in range(5):
+        serde.dumps_typed(_checkpoint(bad_records))
+    serde.dumps_typed(_checkpoint(_raw_rows(100)))
+
+    assert store.count() == 1
+    store.close()
+
+
+def test_lean_serializer_stores_raw_channel_writes_as_blobs(tmp_path: Path) -> None:
+    store = CheckpointBlobStore(tmp_path / "checkpoints.db")
+    serde = LeanCheckpointSerializer(store)
+    bad_records = _raw_rows(100)
+
+    writes = serde.lean_writes(
+        [("bad_records", bad_records), ("dq_status", None), ("steps", 1)]
+    )
+    serialized = [serde.dumps_typed(value) for _channel, value in writes]
+
+    assert serialized[0][0] == BLOB_TYPE
+    assert serde.loads_typed(serialized[0]) == bad_records
+    assert serde.loads_typed(serialized[1]) is None
+    assert serde.loads_typed(serialized[2]) == 1
+    assert store.count() == 1
+    store.close()
+
+
+class _RawInputState(TypedDict):
+    incident_id: str
+    bad_records: Optional[list[Any]]
+    bad_records_summary: dict[str, Any]
+    steps: int
+
+
+def _checkpoint_bytes(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            """
+            SELECT
+                (SELECT COALESCE(SUM(LENGTH(checkpoint)), 0) FROM checkpoints)
+                + (SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes)
+            """
+        ).fetchone()
+    return int(row[0])
+
+
+def _run_graph(db_path: Path, bad_records: list[dict[str, Any]]) -> dict[str, Any]:
+    langgraph_graph = pytest.importorskip("langgraph.graph")
+
+    def _summarize(state: _RawInputState) -> dict[str, Any]:
+        return {
+            "bad_records_summary": {"count": len(state["bad_records"] or [])},
+            "steps": 1,
+        }
+
+    def _step(state: _RawInputState) -> dict[str, Any]:
+        return {"steps": state["steps"] + 1}
+
+    builder = langgraph_graph.StateGraph(_RawInputState)
+    builder.add_node("summarize", _summarize)
+    builder.add_node("step_a", _step)
+    builder.add_node("step_b", _step)
+    builder.add_edge(langgraph_graph.START, "summarize")
+    builder.add_edge("summarize", "step_a")
+    builder.add_edge("step_a", "step_b")
+    builder.add_edge("step_b", langgraph_graph.END)
+
+    with create_sqlite_checkpointer(str(db_path)) as checkpointer:
+        graph = builder.compile(checkpointer=checkpointer)
+        config = {"configurable": {"thread_id": "inc-1"}}
+        graph.invoke({"incident_id": "inc-1", "bad_records": bad_records}, config)
+        return dict(graph.get_state(config).values)
+
+
+def test_sqlite_checkpoint_size_is_independent_of_raw_input_size(
+    tmp_path: Path,
+) -> None:
+    small_db = tmp_path / "small.db"
+    large_db = tmp_path / "large.db"
+
+    small_state = _run_graph(small_db, _raw_rows(10))
+    large_state = _run_graph(large_db, _raw_rows(10_000))
+
+    assert small_state["bad_records_summary"] == {"count": 10}
+    assert large_state["bad_records_summary"] == {"count": 10_000}
+    assert large_state["bad_records"] == _raw_rows(10_000)
+    assert large_state["steps"] == 3
+    assert abs(_checkpoint_bytes(large_db) - _checkpoint_bytes(small_db)) < 64
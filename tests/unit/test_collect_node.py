@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
 
 import graph.graph as graph_module
 from graph.nodes import collect
+from tools.collect_watermarks import WatermarkStore
+from tools.query_executor import QueryFanoutResult
 
 
 def _base_state() -> dict[str, Any]:
@@ -164,3 +167,142 @@ def test_collect_classifies_non_network_error_as_permanent(
         collect.CollectPermanentError, match="unexpected collector format"
     ):
         collect.run(state)
+
+
+class _FanoutExecutor:
+    def __init__(self, fanout: QueryFanoutResult) -> None:
+        self.fanout = fanout
+        self.calls: list[dict[str, Any]] = []
+
+    def execute_concurrently(
+        self, query_specs: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> QueryFanoutResult:
+        self.calls.append({"specs": query_specs, "timeout_seconds": timeout_seconds})
+        return self.fanout
+
+
+def test_fetch_collect_inputs_maps_fanout_results_and_timings() -> None:
+    executor = _FanoutExecutor(
+        QueryFanoutResult(
+            results={
+                "pipeline_state": {
+                    "pipeline_name": "pipeline_silver",
+                    "status": "failure",
+                },
+                "dq_status": [{"dq_tag": "SOURCE_STALE"}],
+                "exception_ledger": [],
+            },
+            errors={},
+            timings={"pipeline_state": 0.1, "dq_status": 0.2, "exception_ledger": 0.3},
+        )
+    )
+
+    updates = collect.fetch_collect_inputs(
+        executor, "pipeline_silver", "run-017", timeout_seconds=5.0
+    )
+
+    assert set(executor.calls[0]["specs"]) == {
+        "pipeline_state",
+        "dq_status",
+        "exception_ledger",
+    }
+    assert executor.calls[0]["timeout_seconds"] == 5.0
+    assert updates == {
+        "pipeline_states": {
+            "pipeline_silver": {"pipeline_name": "pipeline_silver", "status": "failure"}
+        },
+        "dq_status": [{"dq_tag": "SOURCE_STALE"}],
+        "exception_ledger": [],
+        "collect_query_timings": {
+            "pipeline_state": 0.1,
+            "dq_status": 0.2,
+            "exception_ledger": 0.3,
+        },
+    }
+
+
+def test_fetch_collect_inputs_classifies_transient_partial_failures() -> None:
+    executor = _FanoutExecutor(
+        QueryFanoutResult(
+            results={"pipeline_state": None, "dq_status": []},
+            errors={"exception_ledger": TimeoutError("query timed out after 30s")},
+            timings={"pipeline_state": 0.1, "dq_status": 0.1, "exception_ledger": 30.0},
+        )
+    )
+
+    with pytest.raises(
+        collect.CollectTransientError,
+        match="exception_ledger: query timed out after 30s",
+    ):
+        collect.fetch_collect_inputs(executor, "pipeline_silver", "run-017")
+
+
+def test_fetch_collect_inputs_escalates_when_any_failure_is_permanent() -> None:
+    executor = _FanoutExecutor(
+        QueryFanoutResult(
+            results={"pipeline_state": None},
+            errors={
+                "dq_status": ConnectionError("reset"),
+                "exception_ledger": ValueError("column metric not found"),
+            },
+            timings={},
+        )
+    )
+
+    with pytest.raises(collect.CollectPermanentError) as exc_info:
+        collect.fetch_collect_inputs(executor, "pipeline_silver", "run-017")
+
+    assert str(exc_info.value) == (
+        "collect queries failed: dq_status: reset; "
+        "exception_ledger: column metric not found"
+    )
+
+
+def test_fetch_collect_inputs_requires_run_id() -> None:
+    executor = _FanoutExecutor(QueryFanoutResult(results={}, errors={}, timings={}))
+
+    with pytest.raises(collect.CollectPermanentError, match="run_id is required"):
+        collect.fetch_collect_inputs(executor, "pipeline_silver", None)
+    assert executor.calls == []
+
+
+def test_fetch_collect_inputs_advances_watermarks_between_polls() -> None:
+    store = WatermarkStore(":memory:")
+    first_poll = datetime(2026, 2, 25, 12, 0, tzinfo=UTC)
+    executor = _FanoutExecutor(
+        QueryFanoutResult(
+            results={
+                "pipeline_state": None,
+                "dq_status": [{"window_end_ts": "2026-02-25T11:55:00Z"}],
+                "exception_ledger": [],
+            },
+            errors={},
+            timings={},
+        )
+    )
+
+    collect.fetch_collect_inputs(
+        executor, "pipeline_a", "run-1", watermark_store=store, now_utc=first_poll
+    )
+    collect.fetch_collect_inputs(
+        executor,
+        "pipeline_a",
+        "run-1",
+        watermark_store=store,
+        now_utc=first_poll + timedelta(minutes=5),
+    )
+
+    first_specs = executor.calls[0]["specs"]
+    second_specs = executor.calls[1]["specs"]
+    assert first_specs["dq_status"]["params"]["window_start_ts"] == (
+        "2026-02-24T12:00:00Z"
+    )
+    assert "window_end_ts >= " in first_specs["dq_status"]["sql"]
+    assert second_specs["dq_status"]["params"]["window_start_ts"] == (
+        "2026-02-25T11:55:00Z"
+    )
+    assert "window_end_ts > " in second_specs["dq_status"]["sql"]
+    assert second_specs["exception_ledger"]["params"]["window_start_ts"] == (
+        "2026-02-24T12:05:00Z"
+    )
+    assert "generated_at >= " in second_specs["exception_ledger"]["sql"]
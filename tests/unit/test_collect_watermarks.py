@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from tools.collect_watermarks import (
+    CollectWindow,
+    WatermarkStore,
+    latest_watermark,
+    resolve_collect_windows,
+)
+
+NOW = datetime(2026, 2, 25, 12, 0, tzinfo=UTC)
+
+
+def test_resolve_collect_windows_without_store_uses_full_window() -> None:
+    windows = resolve_collect_windows(None, "pipeline_a", now_utc=NOW)
+
+    assert windows == {
+        "dq_status": CollectWindow(start_ts="2026-02-24T12:00:00Z", incremental=False),
+        "exception_ledger": CollectWindow(
+            start_ts="2026-02-24T12:00:00Z", incremental=False
+        ),
+    }
+
+
+def test_resolve_collect_windows_reads_persisted_watermarks(tmp_path: Path) -> None:
+    db_path = str(tmp_path / "checkpoints" / "agent.db")
+    store = WatermarkStore(db_path)
+    store.advance(
+        "pipeline_a",
+        "dq_status",
+        "2026-02-25T11:55:00Z",
+        polled_at=NOW - timedelta(minutes=5),
+    )
+    store.close()
+
+    reopened = WatermarkStore(db_path)
+    windows = resolve_collect_windows(reopened, "pipeline_a", now_utc=NOW)
+
+    assert windows["dq_status"] == CollectWindow(
+        start_ts="2026-02-25T11:55:00Z", incremental=True
+    )
+    assert windows["exception_ledger"].incremental is False
+    assert resolve_collect_windows(reopened, "pipeline_b", now_utc=NOW)[
+        "dq_status"
+    ] == CollectWindow(start_ts="2026-02-24T12:00:00Z", incremental=False)
+
+
+def test_resolve_collect_windows_falls_back_to_full_window_after_gap() -> None:
+    store = WatermarkStore(":memory:")
+    store.advance(
+        "pipeline_a",
+        "exception_ledger",
+        "2026-02-25T11:00:00Z",
+        polled_at=NOW - timedelta(hours=1),
+    )
+    store.advance(
+        "pipeline_a",
+        "dq_status",
+        "2026-02-20T00:00:00Z",
+        polled_at=NOW - timedelta(minutes=5),
+    )
+
+    windows = resolve_collect_windows(store, "pipeline_a", now_utc=NOW)
+
+    assert windows["exception_ledger"].incremental is False
+    assert windows["dq_status"].incremental is False
+    assert windows["dq_status"].start_ts == "2026-02-24T12:00:00Z"
+
+
+def test_watermark_store_never_moves_watermark_backwards() -> None:
+    store = WatermarkStore(":memory:")
+    store.advance("pipeline_a", "dq_status", "2026-02-25T11:55:00Z", polled_at=NOW)
+    store.advance(
+        "pipeline_a",
+        "dq_status",
+        "2026-02-25T11:00:00Z",
+        polled_at=NOW + timedelta(minutes=5),
+    )
+
+    assert store.get("pipeline_a", "dq_status") == (
+        "2026-02-25T11:55:00Z",
+        "2026-02-25T12:05:00Z",
+    )
+
+
+def test_latest_watermark_normalizes_datetimes_and_skips_invalid_rows() -> None:
+    rows = [
+        {"generated_at": "2026-02-25T11:50:00Z"},
+        {"generated_at": datetime(2026, 2, 25, 11, 58)},
+        {"generated_at": None},
+        "not-a-row",
+    ]
+
+    assert latest_watermark(rows, "generated_at") == "2026-02-25T11:58:00Z"
+    assert latest_watermark([], "generated_at") is None
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from orchestrator.pipeline_monitoring_config import (
+    default_pipeline_monitoring_config_path,
+    load_pipeline_monitoring_config,
+)
+from orchestrator.utils.config_cache import ConfigCache
+from orchestrator.validation_targets_config import load_validation_targets_config
+
+
+def _counting_parser(calls: list[bytes]):
+    def _parse(content: bytes) -> str:
+        calls.append(content)
+        return content.decode("utf-8").strip()
+
+    return _parse
+
+
+def test_config_cache_reuses_parsed_value_until_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("first\n", encoding="utf-8")
+    cache = ConfigCache()
+    calls: list[bytes] = []
+    parse = _counting_parser(calls)
+
+    assert cache.load(config_path, parse) == "first"
+    assert cache.load(config_path, parse) == "first"
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    config_path.write_text("second\n", encoding="utf-8")
+    os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+
+    assert cache.load(config_path, parse) == "second"
+    assert len(calls) == 2
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 1}
+
+
+def test_config_cache_skips_reparse_when_only_mtime_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("same\n", encoding="utf-8")
+    cache = ConfigCache()
+    calls: list[bytes] = []
+    parse = _counting_parser(calls)
+
+    cache.load(config_path, parse)
+    os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000))
+    cache.load(config_path, parse)
+    cache.load(config_path, parse)
+
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 2
+
+
+def test_config_cache_invalidate_forces_reparse(tmp_path: Path) -> None:
+    first_path = tmp_path / "first.yaml"
+    second_path = tmp_path / "second.yaml"
+    first_path.write_text("a\n", encoding="utf-8")
+    second_path.write_text("b\n", encoding="utf-8")
+    cache = ConfigCache()
+    calls: list[bytes] = []
+    parse = _counting_parser(calls)
+
+    cache.load(first_path, parse)
+    cache.load(second_path, parse)
+    cache.invalidate(first_path)
+    assert cache.stats()["size"] == 1
+
+    cache.load(first_path, parse)
+    cache.load(second_path, parse)
+    assert len(calls) == 3
+
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+
+
+def test_config_cache_does_not_store_failed_parses(tmp_path: Path) -> None:
+    config_path = tmp_path / "pipeline_monitoring.yaml"
+    config_path.write_text("boundary: {}\n", encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        load_pipeline_monitoring_config(config_path)
+
+    config_path.write_text(
+        default_pipeline_monitoring_config_path().read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    assert load_pipeline_monitoring_config(config_path).boundary is not None
+
+
+def test_loaders_return_cached_config_for_unchanged_files() -> None:
+    assert load_pipeline_monitoring_config() is load_pipeline_monitoring_config()
+    assert load_validation_targets_config() is load_validation_targets_config()
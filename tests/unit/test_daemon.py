@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import signal
+from typing import Any
+
+import pytest
+
+from orchestrator.utils.config import load_runtime_settings
+
+from runtime.daemon import WatchdogDaemon, next_aligned_tick
+
+
+def _settings() -> Any:
+    return load_runtime_settings(
+        {
+            "TARGET_PIPELINES": "pipeline_a",
+            "LANGFUSE_HOST": "http://localhost:3000",
+        }
+    )
+
+
+class _FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+        self.waits: list[float] = []
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def wait(self, seconds: float) -> bool:
+        self.waits.append(seconds)
+        self.now += timedelta(seconds=seconds, milliseconds=250)
+        return False
+
+
+def test_next_aligned_tick_snaps_to_interval_boundaries() -> None:
+    start = datetime(2026, 2, 25, 0, 3, 10, tzinfo=timezone.utc)
+
+    assert next_aligned_tick(start, interval_minutes=5) == datetime(
+        2026, 2, 25, 0, 5, tzinfo=timezone.utc
+    )
+    assert next_aligned_tick(
+        datetime(2026, 2, 25, 0, 5, tzinfo=timezone.utc), interval_minutes=5
+    ) == datetime(2026, 2, 25, 0, 10, tzinfo=timezone.utc)
+    with pytest.raises(ValueError, match="interval_minutes must be a positive"):
+        next_aligned_tick(start, interval_minutes=0)
+
+
+def test_daemon_ticks_on_aligned_boundaries_without_drift() -> None:
+    clock = _FakeClock(datetime(2026, 2, 25, 0, 3, 10, tzinfo=timezone.utc))
+    ticks: list[dict[str, Any]] = []
+
+    def _tick(**kwargs: Any) -> dict[str, Any]:
+        ticks.append(kwargs)
+        clock.now += timedelta(seconds=40)
+        return {}
+
+    daemon = WatchdogDaemon(
+        settings=_settings(), tick=_tick, clock=clock, wait=clock.wait
+    )
+
+    assert daemon.run(max_ticks=3) == 3
+    assert [tick["now_utc"].strftime("%H:%M:%S") for tick in ticks] == [
+        "00:05:00",
+        "00:10:00",
+        "00:15:00",
+    ]
+    assert clock.waits == [110.0, 259.75, 259.75]
+    assert [tick["due_pipelines"] for tick in ticks] == [["pipeline_a"]] * 3
+    assert all(tick["settings"] is daemon.settings for tick in ticks)
+    assert all(tick["monitoring_config"] is daemon.monitoring_config for tick in ticks)
+
+
+def test_daemon_keeps_running_after_tick_failure(caplog) -> None:
+    clock = _FakeClock(datetime(2026, 2, 25, 0, 4, tzinfo=timezone.utc))
+    calls = {"count": 0}
+
+    def _tick(**kwargs: Any) -> dict[str, Any]:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise ConnectionError("warehouse unavailable")
+        return {}
+
+    daemon = WatchdogDaemon(
+        settings=_settings(), tick=_tick, clock=clock, wait=clock.wait
+    )
+
+    assert daemon.run(max_ticks=2) == 2
+    assert "watchdog tick failed" in caplog.text
+
+
+def test_daemon_stops_on_sigterm_and_closes_owned_resources() -> None:
+    clock = _FakeClock(datetime(2026, 2, 25, 0, 4, tzinfo=timezone.utc))
+    closed: list[str] = []
+
+    class _Resource:
+        def close(self) -> None:
+            closed.append("resource")
+
+    daemon = WatchdogDaemon(settings=_settings(), clock=clock, wait=clock.wait)
+
+    def _tick(**kwargs: Any) -> dict[str, Any]:
+        daemon._handle_signal(signal.SIGTERM, None)
+        return {}
+
+    daemon._tick = _tick
+    daemon.own(_Resource())
+
+    assert daemon.run() == 1
+    assert daemon.stopping is True
+    assert closed == ["resource"]
+
+
+def test_daemon_wait_returns_immediately_once_stopped() -> None:
+    daemon = WatchdogDaemon(settings=_settings())
+    daemon.stop()
+
+    assert daemon.run() == 0
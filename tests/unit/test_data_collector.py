@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from datetime import datetime as real_datetime
+import json
+from typing import Any
 
 import pytest
 
+from tools.collect_watermarks import CollectWindow
+from tools.bad_records_summarizer import (
+    summarize_aggregated_bad_records,
+    summarize_bad_records,
+)
 import tools.data_collector as data_collector
 from tools.data_collector import (
+    build_bad_records_summary_query,
     build_dq_status_query,
     build_exception_ledger_query,
     collect_pipeline_context,
     build_pipeline_state_query,
+    build_pipeline_states_query,
+    split_pipeline_states,
 )
+from tools.local_warehouse import connect_local_warehouse, execute_query_spec
 
 
 def test_build_pipeline_state_query_uses_pipeline_filter() -> None:
@@ -27,6 +38,56 @@ def test_build_pipeline_state_query_uses_pipeline_filter() -> None:
     }
 
 
+def test_build_pipeline_states_query_batches_pipelines_in_one_in_filter() -> None:
+    result = build_pipeline_states_query(
+        ["pipeline_silver", "pipeline_a", "pipeline_silver"]
+    )
+
+    assert result == {
+        "sql": (
+            "SELECT pipeline_name, status, last_success_ts, last_processed_end, last_run_id "
+            "FROM gold.pipeline_state "
+            "WHERE pipeline_name IN (%(pipeline_name_0)s, %(pipeline_name_1)s)"
+        ),
+        "params": {
+            "pipeline_name_0": "pipeline_silver",
+            "pipeline_name_1": "pipeline_a",
+        },
+        "result_shape": "list",
+    }
+
+
+def test_build_pipeline_states_query_rejects_empty_pipelines() -> None:
+    with pytest.raises(ValueError, match="pipelines must not be empty"):
+        build_pipeline_states_query([])
+
+
+def test_pipeline_states_query_demultiplexes_rows_per_pipeline() -> None:
+    conn = connect_local_warehouse()
+    conn.execute(
+        "CREATE TABLE gold.pipeline_state ("
+        "pipeline_name TEXT, status TEXT, last_success_ts TEXT, "
+        "last_processed_end TEXT, last_run_id TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO gold.pipeline_state VALUES (?, ?, NULL, NULL, ?)",
+        [
+            ("pipeline_silver", "success", "run-1"),
+            ("pipeline_a", "failure", "run-2"),
+            ("pipeline_b", "success", "run-3"),
+        ],
+    )
+    pipelines = ["pipeline_silver", "pipeline_a", "pipeline_c"]
+
+    rows = execute_query_spec(conn, build_pipeline_states_query(pipelines))
+    states = split_pipeline_states(pipelines, rows)
+
+    assert list(states) == pipelines
+    assert states["pipeline_silver"]["last_run_id"] == "run-1"
+    assert states["pipeline_a"]["status"] == "failure"
+    assert states["pipeline_c"] is None
+
+
 def test_build_dq_status_query_uses_run_id_and_window_filters() -> None:
     result = build_dq_status_query(
         run_id="run-2026-02-23-001",
@@ -151,3 +212,132 @@ def test_collect_pipeline_context_query_specs_keep_contract_shape(
     assert context["pipeline_state"]["result_shape"] == "single"
     assert context["dq_status"]["result_shape"] == "list"
     assert context["exception_ledger"]["result_shape"] == "list"
+
+
+def _load_bad_records(rows: list[dict[str, Any]]) -> Any:
+    conn = connect_local_warehouse()
+    conn.execute(
+        "CREATE TABLE silver.bad_records ("
+        "source_table TEXT, reason TEXT, record_json TEXT, run_id TEXT, "
+        "detected_date_kst TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO silver.bad_records "
+        "VALUES (:source_table, :reason, :record_json, :run_id, '2026-02-23')",
+        rows,
+    )
+    return conn
+
+
+def _bad_record_rows(run_id: str) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for idx in range(900):
+        type_idx = idx % 70
+        reason: Any = json.dumps(
+            {"field": f"field_{type_idx % 6}", "detail": f"d_{type_idx}"}
+        )
+        if type_idx == 3:
+            reason = "plain text reason"
+        elif type_idx == 4:
+            reason = json.dumps({"field": " ", "rule": "amount_positive"})
+        rows.append(
+            {
+                "source_table": f"silver.table_{type_idx % 4}",
+                "reason": reason,
+                "record_json": json.dumps({"idx": idx, "payload": "x" * (idx % 300)}),
+                "run_id": run_id,
+            }
+        )
+    return rows
+
+
+def test_build_bad_records_summary_query_pushes_caps_into_params() -> None:
+    result = build_bad_records_summary_query(
+        "run-1", max_type_count=5, max_samples_per_type=2
+    )
+
+    assert result["result_shape"] == "list"
+    assert result["params"] == {
+        "run_id": "run-1",
+        "max_type_count": 5,
+        "max_samples_per_type": 2,
+        "record_json_prefix_length": 241,
+    }
+    assert "FROM silver.bad_records" in result["sql"]
+    assert "GROUP BY source_table, field, reason" in result["sql"]
+
+
+def test_bad_records_pushdown_matches_python_summarizer_contract() -> None:
+    rows = _bad_record_rows("run-1") + _bad_record_rows("run-other")[:50]
+    conn = _load_bad_records(rows)
+
+    aggregated = execute_query_spec(conn, build_bad_records_summary_query("run-1"))
+    expected_input = sorted(
+        (row for row in rows if row["run_id"] == "run-1"),
+        key=lambda row: row["record_json"],
+    )
+
+    assert len(aggregated) <= 50 * 10
+    assert summarize_aggregated_bad_records(aggregated) == summarize_bad_records(
+        expected_input
+    )
+
+
+def test_bad_records_pushdown_keeps_types_without_samples() -> None:
+    conn = _load_bad_records(_bad_record_rows("run-1"))
+
+    aggregated = execute_query_spec(
+        conn,
+        build_bad_records_summary_query(
+            "run-1", max_type_count=3, max_samples_per_type=0
+        ),
+    )
+    summary = summarize_aggregated_bad_records(aggregated, max_type_count=3)
+
+    assert len(aggregated) == 3
+    assert summary["total_records"] == 900
+    assert summary["types_truncated"] is True
+    assert [violation["samples"] for violation in summary["types"]] == [[], [], []]
+    assert all(violation["samples_truncated"] for violation in summary["types"])
+
+
+def test_bad_records_pushdown_with_no_rows_returns_empty_summary() -> None:
+    conn = _load_bad_records([])
+
+    aggregated = execute_query_spec(conn, build_bad_records_summary_query("run-1"))
+
+    assert summarize_aggregated_bad_records(aggregated) == summarize_bad_records([])
+
+
+def test_collect_pipeline_context_can_include_bad_records_pushdown() -> None:
+    context = collect_pipeline_context(
+        "pipeline_silver", "run-1", include_bad_records_summary=True
+    )
+
+    assert context["bad_records_summary"] == build_bad_records_summary_query("run-1")
+
+
+def test_collect_pipeline_context_reads_only_rows_newer_than_watermarks() -> None:
+    context = collect_pipeline_context(
+        "pipeline_a",
+        "run-1",
+        windows={
+            "dq_status": CollectWindow(
+                start_ts="2026-02-25T11:55:00Z", incremental=True
+            ),
+            "exception_ledger": CollectWindow(
+                start_ts="2026-02-24T12:00:00Z", incremental=False
+            ),
+        },
+    )
+
+    assert context["dq_status"]["sql"].endswith(
+        "AND window_end_ts > %(window_start_ts)s"
+    )
+    assert context["dq_status"]["params"]["window_start_ts"] == "2026-02-25T11:55:00Z"
+    assert context["exception_ledger"]["sql"].endswith(
+        "AND generated_at >= %(window_start_ts)s"
+    )
+    assert context["exception_ledger"]["params"]["window_start_ts"] == (
+        "2026-02-24T12:00:00Z"
+    )
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from tools import databricks_jobs
+from tools.databricks_http import DatabricksHttpClient, DatabricksHttpError
+
+
+class _StubDatabricksServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.requests: list[dict[str, Any]] = []
+        self.client_ports: set[int] = set()
+        self.responses: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.delay_seconds = 0.0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubDatabricksServer
+
+    def do_GET(self) -> None:
+        self._respond()
+
+    def do_POST(self) -> None:
+        self._respond()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        _ = format, args
+
+    def _respond(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0]
+        self.server.client_ports.add(self.client_address[1])
+        self.server.requests.append(
+            {
+                "method": self.command,
+                "path": self.path,
+                "authorization": self.headers.get("Authorization"),
+                "body": json.loads(body) if body else None,
+            }
+        )
+        if self.server.delay_seconds:
+            time.sleep(self.server.delay_seconds)
+        status, payload = self.server.responses.get(path, (200, {}))
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+@pytest.fixture
+def stub_server() -> Iterator[_StubDatabricksServer]:
+    server = _StubDatabricksServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_reuses_keepalive_connection_across_requests(
+    stub_server: _StubDatabricksServer,
+) -> None:
+    stub_server.responses["/api/2.1/jobs/runs/get"] = (
+        200,
+        {"state": {"life_cycle_state": "RUNNING"}},
+    )
+    client = DatabricksHttpClient(stub_server.base_url, "token")
+
+    for _ in range(5):
+        payload = client.request_json(
+            "GET",
+            f"{stub_server.base_url}/api/2.1/jobs/runs/get?run_id=1",
+            timeout_seconds=5.0,
+        )
+
+    assert payload == {"state": {"life_cycle_state": "RUNNING"}}
+    assert len(stub_server.client_ports) == 1
+    assert client.metrics()["connections_opened"] == 1
+    assert {request["authorization"] for request in stub_server.requests} == {
+        "Bearer token"
+    }
+    client.close()
+
+
+def test_client_records_per_endpoint_latency_and_errors(
+    stub_server: _StubDatabricksServer,
+) -> None:
+    stub_server.responses["/api/2.1/jobs/run-now"] = (503, {"message": "busy"})
+    client = DatabricksHttpClient(stub_server.base_url, "token")
+
+    client.request_json("GET", "/api/2.1/jobs/runs/list?limit=1", timeout_seconds=5.0)
+    with pytest.raises(DatabricksHttpError, match="status=503") as exc_info:
+        client.request_json(
+            "POST",
+            "/api/2.1/jobs/run-now",
+            payload={"job_id": 1},
+            timeout_seconds=5.0,
+        )
+    client.record_retry("POST /api/2.1/jobs/run-now")
+
+    metrics = client.metrics()["endpoints"]
+    assert exc_info.value.status_code == 503
+    assert metrics["GET /api/2.1/jobs/runs/list"]["requests"] == 1
+    assert metrics["GET /api/2.1/jobs/runs/list"]["errors"] == 0
+    assert metrics["POST /api/2.1/jobs/run-now"]["errors"] == 1
+    assert metrics["POST /api/2.1/jobs/run-now"]["retries"] == 1
+    assert metrics["POST /api/2.1/jobs/run-now"]["max_seconds"] > 0
+    assert stub_server.requests[-1]["body"] == {"job_id": 1}
+    client.close()
+
+
+def test_client_maps_socket_timeout_to_timeout_error(
+    stub_server: _StubDatabricksServer,
+) -> None:
+    stub_server.delay_seconds = 0.5
+    client = DatabricksHttpClient(stub_server.base_url, "token")
+
+    with pytest.raises(TimeoutError, match="timed out"):
+        client.request_json("GET", "/api/2.1/jobs/runs/get", timeout_seconds=0.05)
+
+    assert client.metrics()["idle_connections"] == 0
+    client.close()
+
+
+def test_client_replaces_idle_connections_past_keepalive_window(
+    stub_server: _StubDatabricksServer,
+) -> None:
+    now = [0.0]
+    client = DatabricksHttpClient(
+        stub_server.base_url,
+        "token",
+        idle_keepalive_seconds=10.0,
+        clock=lambda: now[0],
+    )
+
+    client.request_json("GET", "/api/2.1/jobs/runs/get", timeout_seconds=5.0)
+    now[0] = 30.0
+    client.request_json("GET", "/api/2.1/jobs/runs/get", timeout_seconds=5.0)
+
+    assert client.metrics()["connections_opened"] == 2
+    client.close()
+
+
+def test_client_rejects_urls_for_other_hosts() -> None:
+    client = DatabricksHttpClient("https://adb.example.com", "token")
+
+    with pytest.raises(ValueError, match="does not belong"):
+        client.request_json(
+            "GET", "https://other.example.com/api/2.1/jobs/runs/get", timeout_seconds=1
+        )
+
+
+def test_check_job_status_shares_client_and_resolves_auth_once(
+    monkeypatch: pytest.MonkeyPatch,
+    stub_server: _StubDatabricksServer,
+) -> None:
+    stub_server.responses["/api/2.1/jobs/runs/get"] = (
+        200,
+        {"state": {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"}},
+    )
+    lookups: list[str] = []
+
+    def _fake_get_secret(key: str) -> str:
+        lookups.append(key)
+        return {
+            "agent-execute-mode": "live",
+            "databricks-host": stub_server.base_url,
+            "databricks-agent-token": "token",
+        }[key]
+
+    monkeypatch.setattr("tools.databricks_jobs.get_secret", _fake_get_secret)
+    databricks_jobs.reset_databricks_client()
+    try:
+        results = [databricks_jobs.check_job_status("42") for _ in range(3)]
+        metrics = databricks_jobs.databricks_http_metrics()
+    finally:
+        databricks_jobs.reset_databricks_client()
+
+    assert {result["status"] for result in results} == {"finished"}
+    assert lookups.count("databricks-host") == 1
+    assert lookups.count("databricks-agent-token") == 1
+    assert len(stub_server.client_ports) == 1
+    endpoint = metrics[stub_server.base_url]["endpoints"]["GET /api/2.1/jobs/runs/get"]
+    assert endpoint["requests"] == 3
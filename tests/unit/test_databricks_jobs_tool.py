@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
+from tools.databricks_http import DatabricksHttpError
 from tools.databricks_jobs import (
-    _DatabricksHttpError,
     check_job_status,
+    reset_databricks_client,
     run_databricks_job,
+    wait_for_job_runs,
 )
+from tools.rate_limiter import rate_limiter_metrics
 
 
 def _fake_jobs_config() -> SimpleNamespace:
@@ -24,13 +28,18 @@ def _fake_jobs_config() -> SimpleNamespace:
 
 
 @pytest.fixture(autouse=True)
-def _patch_default_execute_mode_secret(monkeypatch: pytest.MonkeyPatch) -> None:
+def _patch_default_execute_mode_secret(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[None]:
     def _fake_get_secret(key: str) -> str:
         if key == "agent-execute-mode":
             return "dry-run"
         raise AssertionError(f"Unexpected secret lookup: {key}")
 
     monkeypatch.setattr("tools.databricks_jobs.get_secret", _fake_get_secret)
+    reset_databricks_client()
+    yield
+    reset_databricks_client()
 
 
 def test_run_databricks_job_resolves_refresh_job_id_from_config(
@@ -271,7 +280,7 @@ def test_run_databricks_job_retries_5xx_after_status_check(
 
     responses = iter(
         [
-            _DatabricksHttpError(
+            DatabricksHttpError(
                 "Databricks API error status=503: temporary",
                 status_code=503,
             ),
@@ -311,7 +320,7 @@ def test_run_databricks_job_retries_5xx_after_status_check(
         "https://adb.example.com/api/2.1/jobs/runs/list?job_id=101002&active_only=true&limit=1",
         "https://adb.example.com/api/2.1/jobs/run-now",
     ]
-    assert sleep_calls == [10.0]
+    assert sleep_calls == [pytest.approx(10.0, rel=0.1)]
 
 
 def test_run_databricks_job_retries_when_active_run_lookup_fails_after_5xx(
@@ -336,7 +345,7 @@ def test_run_databricks_job_retries_when_active_run_lookup_fails_after_5xx(
 
     responses = iter(
         [
-            _DatabricksHttpError(
+            DatabricksHttpError(
                 "Databricks API error status=503: temporary",
                 status_code=503,
             ),
@@ -376,7 +385,7 @@ def test_run_databricks_job_retries_when_active_run_lookup_fails_after_5xx(
         "https://adb.example.com/api/2.1/jobs/runs/list?job_id=101002&active_only=true&limit=1",
         "https://adb.example.com/api/2.1/jobs/run-now",
     ]
-    assert sleep_calls == [10.0]
+    assert sleep_calls == [pytest.approx(10.0, rel=0.1)]
 
 
 def test_run_databricks_job_5xx_checks_active_run_before_any_retry(
@@ -401,7 +410,7 @@ def test_run_databricks_job_5xx_checks_active_run_before_any_retry(
 
     responses = iter(
         [
-            _DatabricksHttpError(
+            DatabricksHttpError(
                 "Databricks API error status=503: temporary",
                 status_code=503,
             ),
@@ -501,7 +510,7 @@ def test_run_databricks_job_retries_when_active_run_lookup_fails_after_timeout(
         "https://adb.example.com/api/2.1/jobs/runs/list?job_id=101002&active_only=true&limit=1",
         "https://adb.example.com/api/2.1/jobs/run-now",
     ]
-    assert sleep_calls == [5.0]
+    assert sleep_calls == [pytest.approx(5.0, rel=0.1)]
 
 
 def test_run_databricks_job_does_not_parse_5xx_from_plain_exception_text(
@@ -662,3 +671,229 @@ def test_check_job_status_returns_databricks_state(
         "life_cycle_state": "RUNNING",
         "result_state": None,
     }
+
+
+def _live_secrets(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fake_get_secret(key: str) -> str:
+        if key == "agent-execute-mode":
+            return "live"
+        if key == "databricks-host":
+            return "https://adb.example.com"
+        if key == "databricks-agent-token":
+            return "token"
+        raise AssertionError(f"Unexpected secret lookup: {key}")
+
+    monkeypatch.setattr("tools.databricks_jobs.get_secret", _fake_get_secret)
+
+
+class _ZeroJitter:
+    def uniform(self, low: float, high: float) -> float:
+        _ = low, high
+        return 0.0
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _state(life_cycle_state: str, result_state: str | None = None) -> dict[str, Any]:
+    return {
+        "state": {"life_cycle_state": life_cycle_state, "result_state": result_state}
+    }
+
+
+def test_wait_for_job_runs_backs_off_until_run_terminates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _live_secrets(monkeypatch)
+    responses = iter(
+        [_state("PENDING"), _state("RUNNING"), _state("TERMINATED", "SUCCESS")]
+    )
+    request_urls: list[str] = []
+
+    def _fake_http_json_request(**kwargs: Any) -> dict[str, Any]:
+        request_urls.append(kwargs["url"])
+        return next(responses)
+
+    monkeypatch.setattr(
+        "tools.databricks_jobs._http_json_request", _fake_http_json_request
+    )
+    clock = _FakeClock()
+
+    result = wait_for_job_runs(
+        ["5678"], clock=clock, sleep=clock.sleep, rng=_ZeroJitter()
+    )
+
+    assert result.statuses == {
+        "5678": {
+            "status": "finished",
+            "job_run_id": "5678",
+            "life_cycle_state": "TERMINATED",
+            "result_state": "SUCCESS",
+        }
+    }
+    assert result.timed_out is False
+    assert (result.polls, result.api_calls) == (3, 3)
+    assert clock.sleeps == [5.0, 10.0]
+    assert set(request_urls) == {
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=5678"
+    }
+
+
+def test_wait_for_job_runs_batches_many_ids_through_runs_list(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _live_secrets(monkeypatch)
+    request_urls: list[str] = []
+    list_url = (
+        "https://adb.example.com/api/2.1/jobs/runs/list"
+        "?active_only=true&limit=25&job_id=101002"
+    )
+    responses = {
+        list_url: [
+            {
+                "runs": [
+                    {"run_id": 1, **_state("RUNNING")},
+                    {"run_id": 2, **_state("RUNNING")},
+                ],
+                "has_more": False,
+            }
+        ],
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=3": [
+            _state("TERMINATED", "SUCCESS")
+        ],
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=1": [
+            _state("TERMINATED", "SUCCESS")
+        ],
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=2": [
+            _state("INTERNAL_ERROR")
+        ],
+    }
+
+    def _fake_http_json_request(**kwargs: Any) -> dict[str, Any]:
+        request_urls.append(kwargs["url"])
+        return responses[kwargs["url"]].pop(0)
+
+    monkeypatch.setattr(
+        "tools.databricks_jobs._http_json_request", _fake_http_json_request
+    )
+    clock = _FakeClock()
+
+    result = wait_for_job_runs(
+        ["1", "2", "3"],
+        job_id=101002,
+        clock=clock,
+        sleep=clock.sleep,
+        rng=_ZeroJitter(),
+    )
+
+    assert {run_id: s["status"] for run_id, s in result.statuses.items()} == {
+        "1": "finished",
+        "2": "failed",
+        "3": "finished",
+    }
+    assert request_urls == [
+        list_url,
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=3",
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=1",
+        "https://adb.example.com/api/2.1/jobs/runs/get?run_id=2",
+    ]
+    assert (result.polls, result.api_calls) == (2, 4)
+
+
+def test_wait_for_job_runs_stops_at_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _live_secrets(monkeypatch)
+    monkeypatch.setattr(
+        "tools.databricks_jobs._http_json_request",
+        lambda **_kwargs: _state("RUNNING"),
+    )
+    clock = _FakeClock()
+
+    result = wait_for_job_runs(
+        ["5678"],
+        deadline_seconds=12.0,
+        clock=clock,
+        sleep=clock.sleep,
+        rng=_ZeroJitter(),
+    )
+
+    assert result.timed_out is True
+    assert result.pending == ("5678",)
+    assert result.statuses["5678"]["status"] == "running"
+    assert clock.sleeps == [5.0, 7.0]
+
+
+def test_wait_for_job_runs_dry_run_returns_without_polling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _unexpected_http(**_kwargs: Any) -> dict[str, Any]:
+        raise AssertionError("dry-run must not call Databricks")
+
+    monkeypatch.setattr("tools.databricks_jobs._http_json_request", _unexpected_http)
+
+    result = wait_for_job_runs(["5678", "5678"], sleep=_unexpected_http)
+
+    assert list(result.statuses) == ["5678"]
+    assert result.statuses["5678"]["status"] == "dry_run"
+    assert (result.polls, result.api_calls, result.timed_out) == (0, 0, False)
+
+
+def test_run_databricks_job_honors_retry_after_on_429(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "tools.databricks_jobs.load_databricks_jobs_config",
+        _fake_jobs_config,
+    )
+    sleep_calls: list[float] = []
+    responses = iter(
+        [
+            DatabricksHttpError(
+                "Databricks API error status=429: throttled",
+                status_code=429,
+                retry_after=30.0,
+            ),
+            {"runs": []},
+            {"run_id": 778},
+        ]
+    )
+
+    def _fake_http_json_request(
+        *,
+        method: str,
+        url: str,
+        token: str,
+        payload: dict[str, Any] | None = None,
+        timeout_seconds: float,
+    ) -> dict[str, Any]:
+        _ = method, url, token, payload, timeout_seconds
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    _live_secrets(monkeypatch)
+    monkeypatch.setattr(
+        "tools.databricks_jobs._http_json_request",
+        _fake_http_json_request,
+    )
+    monkeypatch.setattr("tools.databricks_jobs.time.sleep", sleep_calls.append)
+
+    result = run_databricks_job("retry_pipeline", {"pipeline": "pipeline_b"})
+
+    assert result["job_run_id"] == "778"
+    assert sleep_calls == [pytest.approx(30.0, rel=0.1)]
+    metrics = rate_limiter_metrics()["databricks"]
+    assert metrics["retries"] == 1
+    assert metrics["retry_after_honored"] == 1
@@ -39,3 +39,20 @@ def test_entrypoint_imports_without_src_pythonpath() -> None:
     )
 
     assert result.returncode == 0, result.stderr
+
+
+def test_entrypoint_daemon_flag_runs_watchdog_daemon(monkeypatch) -> None:
+    events: list[str] = []
+
+    class _FakeDaemon:
+        def install_signal_handlers(self) -> None:
+            events.append("signals")
+
+        def run(self) -> int:
+            events.append("run")
+            return 0
+
+    monkeypatch.setattr("runtime.daemon.WatchdogDaemon", _FakeDaemon)
+
+    assert entrypoint.main(["--daemon"]) == 0
+    assert events == ["signals", "run"]
@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+import time
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
 import graph.graph as graph_module
 from graph.graph import END, START, build_graph
 
@@ -150,3 +158,216 @@ def test_build_graph_uses_langgraph_adapter_path(
     graph = graph_module.build_graph()
 
     assert graph.backend == "langgraph"
+
+
+def _shim_with_nodes(**overrides) -> Any:
+    definition = graph_module._build_definition()
+    return graph_module._CompiledGraphShim(
+        replace(definition, nodes={**definition.nodes, **overrides})
+    )
+
+
+def test_shim_ainvoke_matches_sync_invoke_for_sync_nodes() -> None:
+    shim = _shim_with_nodes()
+    state = {
+        "incident_id": "inc-cutoff-async",
+        "pipeline": "pipeline_silver",
+        "run_id": "run-cutoff-async",
+        "detected_at": "2026-02-18T15:40:00+00:00",
+        "fingerprint": "fp-cutoff-async",
+        "pipeline_states": {
+            "pipeline_silver": {
+                "status": "success",
+                "last_success_ts": "2026-02-18T15:09:59+00:00",
+            }
+        },
+        "dq_status": [],
+        "exception_ledger": [],
+    }
+
+    assert asyncio.run(shim.ainvoke(state)) == shim.invoke(state)
+
+
+def test_shim_ainvoke_interleaves_async_nodes_on_one_event_loop() -> None:
+    async def _slow_detect(state):
+        await asyncio.sleep(0.2)
+        return {"detected_issues": [], "pipeline_states": {}}
+
+    shim = _shim_with_nodes(detect=_slow_detect)
+
+    async def _run_all() -> list[dict[str, Any]]:
+        return await asyncio.gather(
+            *(shim.ainvoke({"incident_id": f"inc-async-{idx}"}) for idx in range(10))
+        )
+
+    started = time.monotonic()
+    results = asyncio.run(_run_all())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert [result["incident_id"] for result in results] == [
+        f"inc-async-{idx}" for idx in range(10)
+    ]
+    assert all(result["detected_issues"] == [] for result in results)
+
+
+def test_shim_invoke_rejects_async_nodes() -> None:
+    async def _async_detect(state):
+        return {"detected_issues": []}
+
+    shim = _shim_with_nodes(detect=_async_detect)
+
+    with pytest.raises(TypeError, match="node detect is async; use ainvoke"):
+        shim.invoke({"incident_id": "inc-sync"})
+
+
+def test_langgraph_adapter_ainvoke_runs_sync_nodes() -> None:
+    graph = build_graph()
+
+    result = asyncio.run(
+        graph.ainvoke(
+            {
+                "incident_id": "inc-async-lg",
+                "pipeline": "pipeline_silver",
+                "run_id": "run-async-lg",
+                "detected_at": "2026-02-23T00:00:00+00:00",
+                "fingerprint": "fp-async-lg",
+            }
+        )
+    )
+
+    assert result["detected_issues"] == []
+
+
+def test_shim_passes_read_only_state_view_and_leaves_input_untouched() -> None:
+    seen: dict[str, Any] = {}
+
+    def _mutating_detect(state):
+        seen["type"] = type(state)
+        state["detected_issues"] = ["sneaky"]
+        return {}
+
+    shim = _shim_with_nodes(detect=_mutating_detect)
+    initial_state = {"incident_id": "inc-ro"}
+
+    with pytest.raises(TypeError):
+        shim.invoke(initial_state)
+    assert seen["type"] is MappingProxyType
+    assert initial_state == {"incident_id": "inc-ro"}
+
+
+def test_shim_applies_only_declared_write_field_deltas() -> None:
+    shim = _shim_with_nodes()
+    initial_state = {
+        "incident_id": "inc-delta",
+        "pipeline": "pipeline_silver",
+        "run_id": "run-delta",
+        "detected_at": "2026-02-23T00:00:00+00:00",
+        "fingerprint": "fp-delta",
+    }
+
+    result = shim.invoke(initial_state)
+
+    assert set(result) - set(initial_state) == {"pipeline_states", "detected_issues"}
+    assert "detected_issues" not in initial_state
+
+
+@pytest.mark.parametrize("backend", ["shim", "langgraph"])
+def test_graph_fails_loudly_on_undeclared_state_write(
+    backend: str, monkeypatch
+) -> None:
+    def _overreaching_detect(state):
+        return {"detected_issues": [], "final_status": "resolved"}
+
+    if backend == "shim":
+        graph = _shim_with_nodes(detect=_overreaching_detect)
+    else:
+        monkeypatch.setattr(graph_module.detect, "run", _overreaching_detect)
+        graph = build_graph()
+
+    with pytest.raises(
+        graph_module.UndeclaredStateWriteError,
+        match="node detect wrote undeclared fields: final_status",
+    ):
+        graph.invoke({"incident_id": "inc-undeclared"})
+
+
+@pytest.mark.parametrize("backend", ["shim", "langgraph"])
+def test_graph_projects_state_down_to_declared_node_reads(
+    backend: str, monkeypatch
+) -> None:
+    seen: dict[str, set[str]] = {}
+
+    def _recording_detect(state):
+        seen["detect"] = set(state)
+        return {"detected_issues": [], "pipeline_states": {}}
+
+    if backend == "shim":
+        graph = _shim_with_nodes(detect=_recording_detect)
+    else:
+        monkeypatch.setattr(graph_module.detect, "run", _recording_detect)
+        graph = build_graph()
+
+    graph.invoke(
+        {
+            "incident_id": "inc-projection",
+            "pipeline": "pipeline_silver",
+            "run_id": "run-projection",
+            "detected_at": "2026-02-23T00:00:00+00:00",
+            "fingerprint": "fp-projection",
+            "pipeline_states": {},
+            "triage_report_raw": "not for detect",
+            "postmortem_report": "not for detect",
+        }
+    )
+
+    assert seen["detect"] == {
+        "incident_id",
+        "pipeline",
+        "run_id",
+        "detected_at",
+        "fingerprint",
+        "pipeline_states",
+    }
+
+
+def test_projection_includes_raw_input_fields_for_detect() -> None:
+    seen: dict[str, Any] = {}
+
+    def _recording_detect(state):
+        seen.update(state)
+        return {"detected_issues": [], "pipeline_states": {}}
+
+    shim = _shim_with_nodes(detect=_recording_detect)
+    shim.invoke(
+        {
+            "incident_id": "inc-raw",
+            "dq_status": [{"dq_tag": "SOURCE_STALE"}],
+            "bad_records": [{"reason": "collect only"}],
+        }
+    )
+
+    assert seen["dq_status"] == [{"dq_tag": "SOURCE_STALE"}]
+    assert "bad_records" not in seen
+
+
+def test_dependency_map_lists_nodes_reading_changed_fields() -> None:
+    graph = build_graph()
+
+    assert graph.read_fields["collect"] == (
+        "pipeline",
+        "run_id",
+        "pipeline_states",
+        "detected_issues",
+        "exceptions",
+        "dq_tags",
+        "bad_records_summary",
+        "exception_ledger",
+        "dq_status",
+        "bad_records",
+    )
+    assert graph_module.nodes_reading(["dq_status"]) == {"detect", "collect"}
+    assert graph_module.nodes_reading(["human_decision"]) == {
+        "execute",
+        "postmortem",
+    }
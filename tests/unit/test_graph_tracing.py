@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import graph.graph as graph_module
+from graph.graph import build_graph
+from graph.tracing import GraphTracer, JsonlTraceSink, update_size_bytes
+
+
+def _cutoff_state(incident_id: str) -> dict[str, Any]:
+    return {
+        "incident_id": incident_id,
+        "pipeline": "pipeline_silver",
+        "run_id": "run-cutoff-1",
+        "detected_at": "2026-02-18T15:40:00+00:00",
+        "fingerprint": "fp-cutoff-1",
+        "pipeline_states": {
+            "pipeline_silver": {
+                "status": "success",
+                "last_success_ts": "2026-02-18T15:09:59+00:00",
+            }
+        },
+        "dq_status": [],
+        "exception_ledger": [],
+    }
+
+
+def _shim(tracer: GraphTracer) -> Any:
+    definition = graph_module._instrument_definition(
+        graph_module._build_definition(), tracer
+    )
+    return graph_module._CompiledGraphShim(definition, tracer=tracer)
+
+
+@pytest.mark.parametrize("backend", ["shim", "langgraph"])
+def test_traced_graph_records_each_step_with_routing(backend: str) -> None:
+    tracer = GraphTracer()
+    graph = _shim(tracer) if backend == "shim" else build_graph(tracer=tracer)
+
+    result = graph.invoke(_cutoff_state("inc-trace-1"))
+
+    trace = result["node_trace"]
+    assert [record["node"] for record in trace] == ["detect", "report_only"]
+    assert [record["step"] for record in trace] == [0, 1]
+    assert trace[0]["route"] == "report_only"
+    assert trace[0]["update_keys"] == ["detected_issues", "pipeline_states"]
+    assert trace[0]["update_bytes"] > 0
+    assert all(record["wall_seconds"] >= 0 for record in trace)
+    assert all(record["cpu_seconds"] >= 0 for record in trace)
+    assert all(record["error"] is None for record in trace)
+
+
+def test_traced_shim_ainvoke_records_steps() -> None:
+    graph = _shim(GraphTracer())
+
+    result = asyncio.run(graph.ainvoke(_cutoff_state("inc-trace-async")))
+
+    assert [record["node"] for record in result["node_trace"]] == [
+        "detect",
+        "report_only",
+    ]
+
+
+def test_trace_sink_appends_jsonl_lines_per_step(tmp_path: Path) -> None:
+    sink_path = tmp_path / "traces" / "graph.jsonl"
+    graph = _shim(GraphTracer(sink=JsonlTraceSink(sink_path)))
+
+    graph.invoke(_cutoff_state("inc-trace-1"))
+    graph.invoke(_cutoff_state("inc-trace-2"))
+
+    lines = [json.loads(line) for line in sink_path.read_text().splitlines()]
+    assert [(line["incident_id"], line["node"]) for line in lines] == [
+        ("inc-trace-1", "detect"),
+        ("inc-trace-1", "report_only"),
+        ("inc-trace-2", "detect"),
+        ("inc-trace-2", "report_only"),
+    ]
+    assert all(line["pipeline"] == "pipeline_silver" for line in lines)
+
+
+def test_trace_records_failing_node_before_reraising(tmp_path: Path) -> None:
+    sink_path = tmp_path / "graph.jsonl"
+    tracer = GraphTracer(sink=JsonlTraceSink(sink_path))
+
+    def _failing_detect(state):
+        raise TimeoutError("pipeline_state query timed out")
+
+    failing = tracer.wrap_node("detect", _failing_detect)
+
+    with pytest.raises(TimeoutError):
+        with tracer.session({"incident_id": "inc-fail"}):
+            failing({})
+
+    line = json.loads(sink_path.read_text())
+    assert line["node"] == "detect"
+    assert line["error"] == "TimeoutError"
+
+
+def test_untraced_graph_result_has_no_trace_field() -> None:
+    result = build_graph().invoke(_cutoff_state("inc-untraced"))
+
+    assert "node_trace" not in result
+
+
+def test_update_size_bytes_handles_empty_and_non_json_values() -> None:
+    assert update_size_bytes(None) == 0
+    assert update_size_bytes({}) == 0
+    assert update_size_bytes({"a": 1}) == len('{"a":1}')
+    assert update_size_bytes({"ts": object()}) > 0
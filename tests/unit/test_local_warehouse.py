@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from tools.data_collector import build_pipeline_state_query
+from tools.local_warehouse import (
+    connect_local_warehouse,
+    execute_query_spec,
+    to_sqlite_sql,
+)
+
+
+def test_to_sqlite_sql_rewrites_pyformat_params() -> None:
+    assert (
+        to_sqlite_sql("WHERE a = %(a)s AND b >= %(b_ts)s")
+        == "WHERE a = :a AND b >= :b_ts"
+    )
+
+
+def test_execute_query_spec_decodes_single_and_list_shapes() -> None:
+    conn = connect_local_warehouse()
+    conn.execute(
+        "CREATE TABLE gold.pipeline_state (pipeline_name TEXT, status TEXT, "
+        "last_success_ts TEXT, last_processed_end TEXT, last_run_id TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO gold.pipeline_state VALUES "
+        "('pipeline_silver', 'failure', '2026-02-23T00:10:00Z', NULL, 'run-1')"
+    )
+
+    single = execute_query_spec(conn, build_pipeline_state_query("pipeline_silver"))
+    missing = execute_query_spec(conn, build_pipeline_state_query("pipeline_b"))
+    listed = execute_query_spec(
+        conn,
+        {
+            "sql": "SELECT pipeline_name FROM gold.pipeline_state",
+            "params": {},
+            "result_shape": "list",
+        },
+    )
+
+    assert single == {
+        "pipeline_name": "pipeline_silver",
+        "status": "failure",
+        "last_success_ts": "2026-02-23T00:10:00Z",
+        "last_processed_end": None,
+        "last_run_id": "run-1",
+    }
+    assert missing is None
+    assert listed == [{"pipeline_name": "pipeline_silver"}]
+
+
+def test_get_json_object_follows_databricks_string_semantics() -> None:
+    conn = connect_local_warehouse()
+
+    row = conn.execute(
+        "SELECT get_json_object(:doc, '$.field') AS field, "
+        "get_json_object(:doc, '$.limit') AS limit_value, "
+        "get_json_object(:doc, '$.missing') AS missing, "
+        "get_json_object('not-json', '$.field') AS invalid",
+        {"doc": '{"field": "amount", "limit": 5}'},
+    ).fetchone()
+
+    assert dict(row) == {
+        "field": "amount",
+        "limit_value": "5",
+        "missing": None,
+        "invalid": None,
+    }
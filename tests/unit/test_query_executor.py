@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+import sqlite3
+import sys
+import time
+import types
+from typing import Any
+
+import pytest
+
+from tools.data_collector import collect_pipeline_context
+from tools.query_executor import (
+    ConnectionPool,
+    DatabricksSqlQueryBackend,
+    QueryExecutor,
+    SqliteQueryBackend,
+)
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE gold.pipeline_state (pipeline_name TEXT, "
+        "status TEXT, last_success_ts TEXT, last_processed_end TEXT, last_run_id TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE silver.dq_status (source_table TEXT, dq_tag TEXT, "
+        "severity TEXT, run_id TEXT, window_end_ts TEXT, date_kst TEXT)"
+    )
+    conn.execute(
+        "CREATE TABLE gold.exception_ledger (severity TEXT, domain TEXT, "
+        "exception_type TEXT, source_table TEXT, metric TEXT, metric_value REAL, "
+        "run_id TEXT, generated_at TEXT)"
+    )
+    conn.execute(
+        "INSERT INTO gold.pipeline_state VALUES "
+        "('pipeline_silver', 'failure', '2026-02-22T15:10:00Z', NULL, 'run-1')"
+    )
+    recent_ts = datetime.now(tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    conn.execute(
+        "INSERT INTO silver.dq_status VALUES "
+        "('silver.orders', 'SOURCE_STALE', 'CRITICAL', 'run-1', ?, ?)",
+        (recent_ts, recent_ts[:10]),
+    )
+    conn.execute(
+        "INSERT INTO gold.exception_ledger VALUES "
+        "('CRITICAL', 'dq', 'SchemaViolation', 'silver.orders', 'rate', 0.2, "
+        "'run-1', ?)",
+        (recent_ts,),
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def backend(tmp_path) -> SqliteQueryBackend:
+    sqlite_backend = SqliteQueryBackend(str(tmp_path / "warehouse.db"))
+    conn = sqlite_backend.connect()
+    _seed(conn)
+    conn.close()
+    return sqlite_backend
+
+
+def test_executor_runs_collect_specs_with_shape_aware_decoding(backend) -> None:
+    specs = collect_pipeline_context("pipeline_silver", "run-1")
+
+    with QueryExecutor(backend, pool_size=2) as executor:
+        results = executor.execute_all(specs)
+
+    assert results["pipeline_state"] == {
+        "pipeline_name": "pipeline_silver",
+        "status": "failure",
+        "last_success_ts": "2026-02-22T15:10:00Z",
+        "last_processed_end": None,
+        "last_run_id": "run-1",
+    }
+    assert [row["dq_tag"] for row in results["dq_status"]] == ["SOURCE_STALE"]
+    assert [row["exception_type"] for row in results["exception_ledger"]] == [
+        "SchemaViolation"
+    ]
+
+
+def test_executor_returns_none_for_missing_single_row(backend) -> None:
+    with QueryExecutor(backend) as executor:
+        result = executor.execute(
+            collect_pipeline_context("pipeline_b", "run-1")["pipeline_state"]
+        )
+
+    assert result is None
+
+
+def test_executor_reuses_pooled_connections_under_concurrency(backend) -> None:
+    spec = collect_pipeline_context("pipeline_silver", "run-1")["dq_status"]
+
+    with QueryExecutor(backend, pool_size=2) as executor:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: executor.execute(spec), range(40)))
+        created = executor.pool.created
+
+    assert all(len(rows) == 1 for rows in results)
+    assert created <= 2
+
+
+def test_executor_times_out_and_discards_connection(backend) -> None:
+    slow_spec = {
+        "sql": (
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) "
+            "SELECT COUNT(*) AS total FROM n"
+        ),
+        "params": {},
+        "result_shape": "single",
+    }
+
+    with QueryExecutor(backend, pool_size=1) as executor:
+        with pytest.raises(TimeoutError, match="query timed out"):
+            executor.execute(slow_spec, timeout_seconds=0.05)
+        assert executor.pool.created == 0
+
+        spec = collect_pipeline_context("pipeline_silver", "run-1")["pipeline_state"]
+        assert executor.execute(spec)["status"] == "failure"
+
+
+def test_executor_rejects_unknown_result_shape(backend) -> None:
+    with QueryExecutor(backend) as executor:
+        with pytest.raises(ValueError, match="Unsupported result_shape: rows"):
+            executor.execute({"sql": "SELECT 1", "params": {}, "result_shape": "rows"})
+
+
+def test_connection_pool_times_out_when_exhausted() -> None:
+    pool = ConnectionPool(object, max_size=1, acquire_timeout_seconds=0.01)
+
+    with pool.connection():
+        with pytest.raises(TimeoutError, match="pooled connection"):
+            with pool.connection():
+                pass
+
+    assert pool.created == 1
+    assert pool.idle == 1
+
+
+def test_databricks_backend_uses_connector_and_cursor_cancel(monkeypatch) -> None:
+    connect_calls: list[dict[str, Any]] = []
+    fake_sql = types.ModuleType("databricks.sql")
+    fake_sql.connect = lambda **kwargs: connect_calls.append(kwargs) or "conn"  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "databricks", types.ModuleType("databricks"))
+    monkeypatch.setitem(sys.modules, "databricks.sql", fake_sql)
+    monkeypatch.setenv("SECRET_DATABRICKS_HOST", "https://adb-1.azuredatabricks.net/")
+    monkeypatch.setenv("SECRET_DATABRICKS_SQL_HTTP_PATH", "/sql/1.0/warehouses/abc")
+    monkeypatch.setenv("SECRET_DATABRICKS_AGENT_TOKEN", "token-1")
+
+    backend = DatabricksSqlQueryBackend.from_secrets()
+
+    assert backend.connect() == "conn"
+    assert connect_calls == [
+        {
+            "server_hostname": "adb-1.azuredatabricks.net",
+            "http_path": "/sql/1.0/warehouses/abc",
+            "access_token": "token-1",
+        }
+    ]
+    sql = "SELECT 1 WHERE a = %(a)s"
+    assert backend.prepare(sql, {"a": 1}) == (sql, {"a": 1})
+
+    cancelled: list[bool] = []
+
+    class _Cursor:
+        def cancel(self) -> None:
+            cancelled.append(True)
+
+    backend.cancel("conn", _Cursor())
+    assert cancelled == [True]
+
+
+class _SleepyCursor:
+    def __init__(self, delay_seconds: float) -> None:
+        self._delay_seconds = delay_seconds
+        self.description: list[tuple[str]] = []
+        self._rows: list[tuple[Any, ...]] = []
+
+    def execute(self, sql: str, params: Any) -> None:
+        if sql == "FAIL":
+            raise ConnectionError("warehouse connection reset")
+        time.sleep(self._delay_seconds)
+        self.description = [("name",)]
+        self._rows = [(sql,)]
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+    def close(self) -> None:
+        return None
+
+
+class _SleepyBackend:
+    def __init__(self, delay_seconds: float) -> None:
+        self.delay_seconds = delay_seconds
+
+    def connect(self) -> Any:
+        backend = self
+
+        class _Connection:
+            def cursor(self) -> _SleepyCursor:
+                return _SleepyCursor(backend.delay_seconds)
+
+            def close(self) -> None:
+                return None
+
+        return _Connection()
+
+    def prepare(self, sql: str, params: Any) -> tuple[str, Any]:
+        return sql, params
+
+    def cancel(self, connection: Any, cursor: Any) -> None:
+        return None
+
+
+def test_execute_concurrently_overlaps_queries_and_records_timings() -> None:
+    specs = {
+        name: {"sql": name, "params": {}, "result_shape": "single"}
+        for name in ("pipeline_state", "dq_status", "exception_ledger")
+    }
+
+    with QueryExecutor(_SleepyBackend(0.2), pool_size=3) as executor:
+        started = time.monotonic()
+        fanout = executor.execute_concurrently(specs)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert fanout.errors == {}
+    assert fanout.results == {
+        "pipeline_state": {"name": "pipeline_state"},
+        "dq_status": {"name": "dq_status"},
+        "exception_ledger": {"name": "exception_ledger"},
+    }
+    assert set(fanout.timings) == set(specs)
+    assert all(timing >= 0.2 for timing in fanout.timings.values())
+
+
+def test_execute_concurrently_keeps_partial_results_on_failure() -> None:
+    specs = {
+        "ok": {"sql": "ok", "params": {}, "result_shape": "list"},
+        "broken": {"sql": "FAIL", "params": {}, "result_shape": "list"},
+    }
+
+    with QueryExecutor(_SleepyBackend(0.0), pool_size=2) as executor:
+        fanout = executor.execute_concurrently(specs)
+
+    assert fanout.results == {"ok": [{"name": "ok"}]}
+    assert isinstance(fanout.errors["broken"], ConnectionError)
+    assert set(fanout.timings) == {"ok", "broken"}
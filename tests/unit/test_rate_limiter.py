@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+import random
+import threading
+
+import pytest
+
+from tools.rate_limiter import (
+    RateLimitPolicy,
+    RateLimiter,
+    configure_rate_limiter,
+    parse_retry_after,
+    rate_limiter,
+    rate_limiter_metrics,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+def _limiter(clock: _FakeClock, **overrides: float) -> RateLimiter:
+    policy = replace(
+        RateLimitPolicy(rate_per_second=2.0, burst=2.0, jitter_ratio=0.0),
+        **overrides,
+    )
+    return RateLimiter("test", policy, clock=clock, sleep=clock.sleep)
+
+
+def test_rate_limiter_throttles_callers_beyond_burst_and_records_wait() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+    metrics = limiter.metrics()
+    assert metrics["acquired"] == 4
+    assert metrics["throttled"] == 2
+    assert metrics["throttled_seconds"] == pytest.approx(1.0)
+    assert metrics["max_throttled_seconds"] == pytest.approx(0.5)
+
+
+def test_rate_limiter_retry_budget_denies_retry_storms() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, retry_burst=2.0, min_retry_rate_per_second=0.0)
+
+    allowed = [limiter.allow_retry() for _ in range(3)]
+
+    assert allowed == [True, True, False]
+    assert limiter.metrics()["retries_denied"] == 1
+
+
+def test_rate_limiter_retry_budget_refills_from_successful_traffic() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(
+        clock,
+        burst=10.0,
+        retry_burst=1.0,
+        retry_ratio=0.5,
+        min_retry_rate_per_second=0.0,
+    )
+    assert limiter.allow_retry() is True
+    assert limiter.allow_retry() is False
+
+    limiter.acquire()
+    limiter.acquire()
+
+    assert limiter.allow_retry() is True
+
+
+def test_rate_limiter_retry_after_blocks_every_caller_for_destination() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, burst=10.0)
+
+    delay = limiter.retry_delay(1.0, retry_after=30.0)
+    waited = limiter.acquire()
+
+    assert delay == pytest.approx(30.0)
+    assert waited == pytest.approx(30.0)
+    assert limiter.metrics()["retry_after_honored"] == 1
+
+
+def test_rate_limiter_caps_retry_after_and_only_jitters_upward() -> None:
+    clock = _FakeClock()
+    limiter = RateLimiter(
+        "test",
+        RateLimitPolicy(
+            rate_per_second=1.0,
+            burst=1.0,
+            jitter_ratio=0.2,
+            max_retry_after_seconds=60.0,
+        ),
+        clock=clock,
+        sleep=clock.sleep,
+        rng=random.Random(7),
+    )
+
+    delays = [limiter.retry_delay(10.0) for _ in range(50)]
+
+    assert all(10.0 <= delay <= 12.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert limiter.retry_delay(1.0, retry_after=3600.0) <= 72.0
+
+
+def test_rate_limiter_shares_tokens_across_concurrent_callers() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, rate_per_second=10.0, burst=5.0)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _index: limiter.acquire(), range(25)))
+
+    metrics = limiter.metrics()
+    assert metrics["acquired"] == 25
+    assert clock.now >= 2.0 - 1e-9
+
+
+def test_rate_limiter_registry_shares_one_limiter_per_destination() -> None:
+    limiter = rate_limiter("databricks")
+    limiter.acquire()
+
+    assert rate_limiter("databricks") is limiter
+    assert rate_limiter_metrics()["databricks"]["acquired"] == 1
+    with pytest.raises(ValueError, match="Unknown rate limit destination"):
+        rate_limiter("unknown")
+
+    replaced = configure_rate_limiter("databricks", burst=1.0)
+    assert rate_limiter("databricks") is replaced
+    assert replaced.policy.burst == 1.0
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates() -> None:
+    now = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after({"Retry-After": "12"}) == 12.0
+    assert parse_retry_after(
+        {"Retry-After": "Thu, 01 Jan 2026 00:00:30 GMT"}, now=now
+    ) == pytest.approx(30.0)
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+
+from orchestrator.pipeline_monitoring_config import load_pipeline_monitoring_config
+
+from runtime.scheduler import PollScheduler
+
+
+def _utc(hour: int, minute: int, second: int = 0, *, day: int = 25) -> datetime:
+    return datetime(2026, 2, day, hour, minute, second, tzinfo=timezone.utc)
+
+
+def _scheduler(targets: list[str], start_utc: datetime) -> PollScheduler:
+    return PollScheduler(
+        load_pipeline_monitoring_config(), targets, start_utc=start_utc
+    )
+
+
+def test_microbatch_pipeline_is_due_on_every_poll_boundary() -> None:
+    scheduler = _scheduler(["pipeline_a"], _utc(0, 3, 10))
+
+    assert scheduler.next_wakeup() == _utc(0, 5)
+    assert scheduler.pop_due(_utc(0, 4, 59)) == []
+    assert [poll.pipeline for poll in scheduler.pop_due(_utc(0, 5))] == ["pipeline_a"]
+    assert scheduler.next_wakeup() == _utc(0, 10)
+
+
+def test_late_tick_catches_up_missed_microbatch_slots_once() -> None:
+    scheduler = _scheduler(["pipeline_a"], _utc(0, 4, 59))
+
+    due = scheduler.pop_due(_utc(0, 16, 3))
+
+    assert len(due) == 1
+    assert due[0].due_utc == _utc(0, 5)
+    assert due[0].missed_slots == 2
+    assert scheduler.next_wakeup() == _utc(0, 20)
+
+
+def test_daily_pipeline_is_due_from_poll_after_kst_until_kst_midnight() -> None:
+    scheduler = _scheduler(["pipeline_silver"], _utc(15, 0))
+
+    assert scheduler.next_wakeup() == _utc(15, 10)
+    assert scheduler.pop_due(_utc(15, 10))[0].pipeline == "pipeline_silver"
+    assert scheduler.next_wakeup() == _utc(15, 15)
+
+    late_scheduler = _scheduler(["pipeline_silver"], _utc(14, 52))
+    assert late_scheduler.next_wakeup() == _utc(14, 55)
+    late_scheduler.pop_due(_utc(14, 55))
+    assert late_scheduler.next_wakeup() == _utc(15, 10)
+
+
+def test_scheduler_orders_pipelines_by_next_due_and_skips_unknown(caplog) -> None:
+    with caplog.at_level(logging.WARNING):
+        scheduler = _scheduler(
+            ["pipeline_c", "pipeline_silver", "pipeline_a", "unknown_pipeline"],
+            _utc(15, 0, 1),
+        )
+
+    assert "Unknown target pipeline skipped: unknown_pipeline" in caplog.text
+    assert scheduler.next_wakeup() == _utc(15, 5)
+    assert [poll.pipeline for poll in scheduler.pop_due(_utc(15, 10))] == [
+        "pipeline_a",
+        "pipeline_silver",
+    ]
+    assert [poll.pipeline for poll in scheduler.pop_due(_utc(15, 45))] == [
+        "pipeline_silver",
+        "pipeline_a",
+        "pipeline_c",
+    ]
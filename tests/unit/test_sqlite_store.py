@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from orchestrator.utils.sqlite_store import SqliteStore, shared_sqlite_store
+
+_COUNTER_MIGRATION = (
+    "CREATE TABLE counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT INTO counters (name, value) VALUES ('seed', 0)",
+)
+
+
+def test_sqlite_store_enables_wal_and_reuses_connections(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "checkpoints" / "agent.db")
+
+    assert store.fetchone("PRAGMA journal_mode") == ("wal",)
+    for _ in range(10):
+        store.fetchone("SELECT 1")
+
+    assert store.stats()["connections_opened"] == 1
+    store.close()
+
+
+def test_sqlite_store_applies_each_migration_once(tmp_path: Path) -> None:
+    db_path = tmp_path / "agent.db"
+    first = SqliteStore(db_path)
+    first.migrate("counters_v1", *_COUNTER_MIGRATION)
+    first.migrate("counters_v1", *_COUNTER_MIGRATION)
+    first.close()
+
+    reopened = SqliteStore(db_path)
+    reopened.migrate("counters_v1", *_COUNTER_MIGRATION)
+
+    assert reopened.fetchall("SELECT name, value FROM counters") == [("seed", 0)]
+    assert reopened.fetchall("SELECT name FROM schema_migrations") == [("counters_v1",)]
+    reopened.close()
+
+
+def test_sqlite_store_retries_busy_writes(tmp_path: Path) -> None:
+    db_path = tmp_path / "agent.db"
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    sleeps: list[float] = []
+
+    def _release_lock(delay: float) -> None:
+        sleeps.append(delay)
+        blocker.execute("COMMIT")
+
+    store = SqliteStore(
+        db_path,
+        busy_timeout_seconds=0,
+        retry_delay_seconds=0.01,
+        sleep=_release_lock,
+    )
+    store.migrate("counters_v1", *_COUNTER_MIGRATION)
+    blocker.execute("BEGIN IMMEDIATE")
+
+    updated = store.execute("UPDATE counters SET value = value + 1")
+
+    assert updated == 1
+    assert sleeps == [0.01]
+    assert store.stats()["busy_retries"] == 1
+    blocker.close()
+    store.close()
+
+
+def test_sqlite_store_raises_after_busy_retries_are_exhausted(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "agent.db"
+    store = SqliteStore(
+        db_path,
+        busy_timeout_seconds=0,
+        busy_retries=2,
+        sleep=lambda _delay: None,
+    )
+    store.migrate("counters_v1", *_COUNTER_MIGRATION)
+    blocker = sqlite3.connect(db_path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        store.execute("UPDATE counters SET value = value + 1")
+
+    assert store.stats()["busy_retries"] == 2
+    blocker.close()
+    store.close()
+
+
+def test_sqlite_store_serves_concurrent_writers(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "agent.db")
+    store.migrate("counters_v1", *_COUNTER_MIGRATION)
+
+    def _increment(_index: int) -> int:
+        return store.execute("UPDATE counters SET value = value + 1")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_increment, range(200)))
+
+    assert results == [1] * 200
+    assert store.fetchone("SELECT value FROM counters") == (200,)
+    assert store.stats()["connections_opened"] <= 8
+    store.close()
+
+
+def test_sqlite_store_transaction_rolls_back_on_error(tmp_path: Path) -> None:
+    store = SqliteStore(tmp_path / "agent.db")
+    store.migrate("counters_v1", *_COUNTER_MIGRATION)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with store.transaction() as conn:
+            conn.execute("UPDATE counters SET value = 10")
+            raise RuntimeError("boom")
+
+    assert store.fetchone("SELECT value FROM counters") == (0,)
+    store.close()
+
+
+def test_sqlite_store_memory_path_shares_one_database() -> None:
+    store = SqliteStore(":memory:")
+    store.migrate("counters_v1", *_COUNTER_MIGRATION)
+
+    store.execute("UPDATE counters SET value = 5")
+
+    assert store.fetchone("SELECT value FROM counters") == (5,)
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+        store.fetchone("SELECT 1")
+
+
+def test_shared_sqlite_store_returns_one_store_per_file(tmp_path: Path) -> None:
+    db_path = tmp_path / "agent.db"
+
+    assert shared_sqlite_store(db_path) is shared_sqlite_store(str(db_path))
+    assert shared_sqlite_store(":memory:") is not shared_sqlite_store(":memory:")
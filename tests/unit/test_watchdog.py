@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import logging
+from typing import Any
 
 from orchestrator.utils.config import load_runtime_settings
 
@@ -70,3 +71,69 @@ def test_pipelines_to_poll_logs_warning_and_skips_unknown_pipeline(caplog) -> No
 
     assert result == ["pipeline_silver"]
     assert "Unknown target pipeline skipped: unknown_pipeline" in caplog.text
+
+
+class _RecordingQueryRunner:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.specs: list[dict[str, Any]] = []
+
+    def execute(self, query_spec: dict[str, Any]) -> list[dict[str, Any]]:
+        self.specs.append(query_spec)
+        return self.rows
+
+
+def test_run_once_fetches_polled_pipeline_states_in_one_query() -> None:
+    settings = load_runtime_settings(
+        {
+            "TARGET_PIPELINES": "pipeline_silver,pipeline_a,pipeline_b,pipeline_c",
+            "LANGFUSE_HOST": "http://localhost:3000",
+        }
+    )
+    runner = _RecordingQueryRunner(
+        [
+            {"pipeline_name": "pipeline_silver", "status": "success"},
+            {"pipeline_name": "pipeline_a", "status": "failure"},
+            {"pipeline_name": "pipeline_b", "status": "success"},
+        ]
+    )
+
+    result = watchdog.run_once(
+        now_utc=datetime(2026, 2, 25, 20, 15, tzinfo=timezone.utc),
+        settings=settings,
+        query_runner=runner,
+    )
+
+    assert result["polled_pipelines"] == [
+        "pipeline_silver",
+        "pipeline_a",
+        "pipeline_b",
+        "pipeline_c",
+    ]
+    assert len(runner.specs) == 1
+    assert "IN (" in runner.specs[0]["sql"]
+    assert result["pipeline_states"] == {
+        "pipeline_silver": {"pipeline_name": "pipeline_silver", "status": "success"},
+        "pipeline_a": {"pipeline_name": "pipeline_a", "status": "failure"},
+        "pipeline_b": {"pipeline_name": "pipeline_b", "status": "success"},
+        "pipeline_c": None,
+    }
+
+
+def test_run_once_skips_state_query_when_nothing_is_due() -> None:
+    settings = load_runtime_settings(
+        {
+            "TARGET_PIPELINES": "pipeline_a",
+            "LANGFUSE_HOST": "http://localhost:3000",
+        }
+    )
+    runner = _RecordingQueryRunner([])
+
+    result = watchdog.run_once(
+        now_utc=datetime(2026, 2, 25, 0, 12, tzinfo=timezone.utc),
+        settings=settings,
+        query_runner=runner,
+    )
+
+    assert result["pipeline_states"] == {}
+    assert runner.specs == []
@@ -1,7 +1,12 @@
 __all__ = [
     "alerting",
+    "collect_watermarks",
     "data_collector",
+    "databricks_http",
     "databricks_jobs",
     "domain_validator",
     "llm_client",
+    "local_warehouse",
+    "query_executor",
+    "rate_limiter",
 ]
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from datetime import datetime, timezone
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 from urllib import error, request
 
+from tools.rate_limiter import ALERTING, RateLimiter, parse_retry_after, rate_limiter
+
 TRIAGE_READY = "TRIAGE_READY"
 APPROVAL_TIMEOUT = "APPROVAL_TIMEOUT"
 EXECUTION_FAILED = "EXECUTION_FAILED"
@@ -16,6 +19,8 @@ SEVERITY_WARNING = "WARNING"
 SEVERITY_ERROR = "ERROR"
 SEVERITY_CRITICAL = "CRITICAL"
 
+_RETRY_BASE_DELAY_SECONDS = 0.5
+
 
 class AlertError(RuntimeError):
     def __init__(
@@ -58,6 +63,7 @@ def emit_alert(
     *,
     environ: Mapping[str, str] | None = None,
     sender: Any | None = None,
+    sleep: Callable[[float], None] = time.sleep,
 ) -> None:
     env = environ if environ is not None else os.environ
     endpoint = env.get("LOG_ANALYTICS_DCR_ENDPOINT", "").strip()
@@ -95,9 +101,12 @@ def emit_alert(
         method="POST",
     )
     send = sender if sender is not None else _default_sender
+    limiter = rate_limiter(ALERTING)
 
     for attempt in range(max_retries + 1):
+        retry_after = None
         try:
+            limiter.acquire(sleep=sleep)
             response = send(req, timeout_seconds)
             status = getattr(response, "status", None)
             if status is None and hasattr(response, "getcode"):
@@ -105,6 +114,7 @@ def emit_alert(
             if status is None or 200 <= int(status) < 300:
                 return
             if int(status) in {408, 429, 500, 502, 503, 504}:
+                retry_after = parse_retry_after(getattr(response, "headers", None))
                 raise TransientAlertError(
                     event_type=event_type,
                     target=url,
@@ -116,16 +126,36 @@ def emit_alert(
                 reason=f"http status {int(status)}",
             )
         except AlertError as exc:
-            if isinstance(exc, TransientAlertError) and attempt < max_retries:
+            if isinstance(exc, TransientAlertError) and _backoff(
+                limiter, attempt, max_retries, retry_after, sleep
+            ):
                 continue
             raise
         except Exception as exc:
             classified = _classify_alert_error(exc, event_type=event_type, target=url)
-            if isinstance(classified, TransientAlertError) and attempt < max_retries:
+            if isinstance(exc, error.HTTPError):
+                retry_after = parse_retry_after(exc.headers)
+            if isinstance(classified, TransientAlertError) and _backoff(
+                limiter, attempt, max_retries, retry_after, sleep
+            ):
                 continue
             raise classified from exc
 
 
+def _backoff(
+    limiter: RateLimiter,
+    attempt: int,
+    max_retries: int,
+    retry_after: float | None,
+    sleep: Callable[[float], None],
+) -> bool:
+    if attempt >= max_retries or not limiter.allow_retry():
+        return False
+    base_delay = _RETRY_BASE_DELAY_SECONDS * (2**attempt)
+    sleep(limiter.retry_delay(base_delay, retry_after=retry_after))
+    return True
+
+
 def _serialize_event_payload(
     *, severity: str, event_type: str, summary: str, detail: dict[str, Any]
 ) -> bytes:
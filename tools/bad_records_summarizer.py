@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from collections import Counter, OrderedDict, deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import ExitStack
+import heapq
+from itertools import chain, islice
 import json
-from collections import defaultdict
+import os
 from typing import Any
 
 MAX_TYPE_COUNT = 50
@@ -10,80 +16,458 @@ MAX_TABLE_LENGTH = 80
 MAX_FIELD_LENGTH = 80
 MAX_REASON_LENGTH = 160
 MAX_RECORD_JSON_LENGTH = 240
+REASON_CACHE_SIZE = 4096
+SHARD_SIZE = 100_000
 
+_ViolationKey = tuple[str, str, str]
 
-def summarize_bad_records(
-    bad_records: list[dict[str, Any]],
-    *,
-    max_type_count: int = MAX_TYPE_COUNT,
-    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
-    max_table_length: int = MAX_TABLE_LENGTH,
-    max_field_length: int = MAX_FIELD_LENGTH,
-    max_reason_length: int = MAX_REASON_LENGTH,
-    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
-) -> dict[str, Any]:
-    if not bad_records:
+
+class _ReasonCache:
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, str]] = OrderedDict()
+
+    def lookup(self, raw_reason: Any) -> tuple[str, str]:
+        if not isinstance(raw_reason, str) or self.max_size <= 0:
+            return _extract_field_and_reason(raw_reason)
+
+        cached = self._entries.get(raw_reason)
+        if cached is not None:
+            self.hits += 1
+            self._entries.move_to_end(raw_reason)
+            return cached
+
+        self.misses += 1
+        parsed = _extract_field_and_reason(raw_reason)
+        self._entries[raw_reason] = parsed
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return parsed
+
+    def stats(self) -> dict[str, int]:
         return {
-            "total_records": 0,
-            "type_count": 0,
-            "types_truncated": False,
-            "types": [],
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
         }
 
-    grouped_counts: dict[tuple[str, str, str], int] = defaultdict(int)
-    grouped_samples: dict[tuple[str, str, str], list[dict[str, str]]] = defaultdict(
-        list
-    )
+    def absorb_stats(self, other: _ReasonCache) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
 
-    for record in bad_records:
-        source_table = _normalize_text(record.get("source_table", "unknown"))
-        field, reason = _extract_field_and_reason(
-            record.get("reason"),
-        )
+    def __getstate__(self) -> dict[str, Any]:
+        return {"max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.max_size = state["max_size"]
+        self.hits = state["hits"]
+        self.misses = state["misses"]
+        self._entries = OrderedDict()
+
+
+class BadRecordsAccumulator:
+    def __init__(
+        self,
+        *,
+        max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+        max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+        reason_cache_size: int = REASON_CACHE_SIZE,
+    ) -> None:
+        self.max_samples_per_type = max_samples_per_type
+        self.max_record_json_length = max_record_json_length
+        self.total_records = 0
+        self._counts: dict[_ViolationKey, int] = {}
+        self._samples: dict[_ViolationKey, list[dict[str, str]]] = {}
+        self._reason_cache = _ReasonCache(reason_cache_size)
 
+    @property
+    def key_count(self) -> int:
+        return len(self._counts)
+
+    def reason_cache_stats(self) -> dict[str, int]:
+        return self._reason_cache.stats()
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        source_table = _normalize_text(record.get("source_table", "unknown"))
+        field, reason = self._reason_cache.lookup(record.get("reason"))
         violation_key = (source_table, field, reason)
-        grouped_counts[violation_key] += 1
 
-        if len(grouped_samples[violation_key]) < max_samples_per_type:
-            grouped_samples[violation_key].append(
+        self.total_records += 1
+        count = self._counts.get(violation_key, 0)
+        self._counts[violation_key] = count + 1
+
+        if count < self.max_samples_per_type:
+            self._samples.setdefault(violation_key, []).append(
                 {
                     "record_json": _abbreviate(
                         record.get("record_json", ""),
-                        max_record_json_length,
+                        self.max_record_json_length,
                     )
                 }
             )
 
-    sorted_keys = sorted(
-        grouped_counts,
-        key=lambda key: (-grouped_counts[key], key[0], key[1], key[2]),
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> BadRecordsAccumulator:
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: BadRecordsAccumulator) -> BadRecordsAccumulator:
+        self.total_records += other.total_records
+        for key, count in other._counts.items():
+            self._counts[key] = self._counts.get(key, 0) + count
+
+        for key, other_samples in other._samples.items():
+            samples = self._samples.get(key)
+            if samples is None:
+                self._samples[key] = other_samples[: self.max_samples_per_type]
+                continue
+            room = self.max_samples_per_type - len(samples)
+            if room > 0:
+                samples.extend(other_samples[:room])
+
+        self._reason_cache.absorb_stats(other._reason_cache)
+        return self
+
+    def add_columns(self, columns: Any) -> BadRecordsAccumulator:
+        column_map = _as_column_mapping(columns)
+        row_count = _column_row_count(column_map)
+        if row_count == 0:
+            return self
+
+        source_tables = column_map.get("source_table")
+        if source_tables is None:
+            source_tables = ["unknown"] * row_count
+        reasons = column_map.get("reason")
+        if reasons is None:
+            reasons = [None] * row_count
+
+        try:
+            pair_counts = Counter(zip(source_tables, reasons))
+        except TypeError:
+            # Unhashable cells (e.g. struct-typed reasons) take the per-row path.
+            return self.extend(_iter_column_rows(column_map, row_count))
+
+        key_by_pair: dict[tuple[Any, Any], _ViolationKey] = {}
+        batch_counts: dict[_ViolationKey, int] = {}
+        for pair, count in pair_counts.items():
+            raw_table, raw_reason = pair
+            field, reason = self._reason_cache.lookup(raw_reason)
+            violation_key = (_normalize_text(raw_table), field, reason)
+            key_by_pair[pair] = violation_key
+            batch_counts[violation_key] = batch_counts.get(violation_key, 0) + count
+
+        self.total_records += row_count
+        sample_needs: dict[_ViolationKey, int] = {}
+        for violation_key, count in batch_counts.items():
+            self._counts[violation_key] = self._counts.get(violation_key, 0) + count
+            taken = len(self._samples.get(violation_key, ()))
+            need = min(self.max_samples_per_type - taken, count)
+            if need > 0:
+                sample_needs[violation_key] = need
+
+        remaining = sum(sample_needs.values())
+        if remaining == 0:
+            return self
+
+        record_jsons = column_map.get("record_json")
+        if record_jsons is None:
+            record_jsons = [""] * row_count
+        for pair, record_json in zip(zip(source_tables, reasons), record_jsons):
+            violation_key = key_by_pair[pair]
+            need = sample_needs.get(violation_key, 0)
+            if need == 0:
+                continue
+            self._samples.setdefault(violation_key, []).append(
+                {"record_json": _abbreviate(record_json, self.max_record_json_length)}
+            )
+            sample_needs[violation_key] = need - 1
+            remaining -= 1
+            if remaining == 0:
+                break
+        return self
+
+    def summarize(
+        self,
+        *,
+        max_type_count: int = MAX_TYPE_COUNT,
+        max_table_length: int = MAX_TABLE_LENGTH,
+        max_field_length: int = MAX_FIELD_LENGTH,
+        max_reason_length: int = MAX_REASON_LENGTH,
+        include_metadata: bool = False,
+    ) -> dict[str, Any]:
+        counts = self._counts
+        selected_keys = heapq.nsmallest(
+            max_type_count,
+            counts,
+            key=lambda key: (-counts[key], key[0], key[1], key[2]),
+        )
+
+        types = []
+        for key in selected_keys:
+            source_table, field, reason = key
+            count = counts[key]
+            samples = list(self._samples.get(key, []))
+            types.append(
+                {
+                    "source_table": _abbreviate(source_table, max_table_length),
+                    "field": _abbreviate(field, max_field_length),
+                    "reason": _abbreviate(reason, max_reason_length),
+                    "count": count,
+                    "samples_truncated": count > len(samples),
+                    "samples": samples,
+                }
+            )
+
+        summary: dict[str, Any] = {
+            "total_records": self.total_records,
+            "type_count": len(types),
+            "types_truncated": len(counts) > max_type_count,
+            "types": types,
+        }
+        if include_metadata:
+            summary["metadata"] = {"reason_cache": self.reason_cache_stats()}
+        return summary
+
+
+def summarize_bad_records(
+    bad_records: Iterable[Mapping[str, Any]],
+    *,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+    max_table_length: int = MAX_TABLE_LENGTH,
+    max_field_length: int = MAX_FIELD_LENGTH,
+    max_reason_length: int = MAX_REASON_LENGTH,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+    reason_cache_size: int = REASON_CACHE_SIZE,
+    include_metadata: bool = False,
+) -> dict[str, Any]:
+    accumulator = BadRecordsAccumulator(
+        max_samples_per_type=max_samples_per_type,
+        max_record_json_length=max_record_json_length,
+        reason_cache_size=reason_cache_size,
     )
-    selected_keys = sorted_keys[:max_type_count]
-
-    types = []
-    for key in selected_keys:
-        source_table, field, reason = key
-        count = grouped_counts[key]
-        samples = grouped_samples[key]
-        types.append(
-            {
-                "source_table": _abbreviate(source_table, max_table_length),
-                "field": _abbreviate(field, max_field_length),
-                "reason": _abbreviate(reason, max_reason_length),
-                "count": count,
-                "samples_truncated": count > len(samples),
-                "samples": samples,
+    accumulator.extend(bad_records)
+    return accumulator.summarize(
+        max_type_count=max_type_count,
+        max_table_length=max_table_length,
+        max_field_length=max_field_length,
+        max_reason_length=max_reason_length,
+        include_metadata=include_metadata,
+    )
+
+
+def summarize_bad_record_chunks(
+    chunks: Iterable[Iterable[Mapping[str, Any]]],
+    *,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+    max_table_length: int = MAX_TABLE_LENGTH,
+    max_field_length: int = MAX_FIELD_LENGTH,
+    max_reason_length: int = MAX_REASON_LENGTH,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+    reason_cache_size: int = REASON_CACHE_SIZE,
+    include_metadata: bool = False,
+) -> dict[str, Any]:
+    return summarize_bad_records(
+        chain.from_iterable(chunks),
+        max_type_count=max_type_count,
+        max_samples_per_type=max_samples_per_type,
+        max_table_length=max_table_length,
+        max_field_length=max_field_length,
+        max_reason_length=max_reason_length,
+        max_record_json_length=max_record_json_length,
+        reason_cache_size=reason_cache_size,
+        include_metadata=include_metadata,
+    )
+
+
+def summarize_bad_record_batches(
+    batches: Iterable[Any],
+    *,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+    max_table_length: int = MAX_TABLE_LENGTH,
+    max_field_length: int = MAX_FIELD_LENGTH,
+    max_reason_length: int = MAX_REASON_LENGTH,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+    reason_cache_size: int = REASON_CACHE_SIZE,
+    include_metadata: bool = False,
+) -> dict[str, Any]:
+    accumulator = BadRecordsAccumulator(
+        max_samples_per_type=max_samples_per_type,
+        max_record_json_length=max_record_json_length,
+        reason_cache_size=reason_cache_size,
+    )
+    for batch in batches:
+        accumulator.add_columns(batch)
+    return accumulator.summarize(
+        max_type_count=max_type_count,
+        max_table_length=max_table_length,
+        max_field_length=max_field_length,
+        max_reason_length=max_reason_length,
+        include_metadata=include_metadata,
+    )
+
+
+def summarize_aggregated_bad_records(
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_table_length: int = MAX_TABLE_LENGTH,
+    max_field_length: int = MAX_FIELD_LENGTH,
+    max_reason_length: int = MAX_REASON_LENGTH,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+) -> dict[str, Any]:
+    total_records = 0
+    distinct_type_count = 0
+    types_by_rank: dict[int, dict[str, Any]] = {}
+
+    for row in rows:
+        type_rank = int(row["type_rank"])
+        if type_rank > max_type_count:
+            continue
+        total_records = int(row["total_records"])
+        distinct_type_count = int(row["distinct_type_count"])
+
+        violation = types_by_rank.get(type_rank)
+        if violation is None:
+            violation = {
+                "source_table": _abbreviate(row["source_table"], max_table_length),
+                "field": _abbreviate(row["field"], max_field_length),
+                "reason": _abbreviate(row["reason"], max_reason_length),
+                "count": int(row["violation_count"]),
+                "samples_truncated": False,
+                "samples": [],
             }
-        )
+            types_by_rank[type_rank] = violation
+
+        record_json = row.get("record_json")
+        if record_json is not None:
+            violation["samples"].append(
+                {"record_json": _abbreviate(record_json, max_record_json_length)}
+            )
+
+    types = [types_by_rank[rank] for rank in sorted(types_by_rank)]
+    for violation in types:
+        violation["samples_truncated"] = violation["count"] > len(violation["samples"])
 
     return {
-        "total_records": len(bad_records),
+        "total_records": total_records,
         "type_count": len(types),
-        "types_truncated": len(sorted_keys) > max_type_count,
+        "types_truncated": distinct_type_count > max_type_count,
         "types": types,
     }
 
 
+def summarize_bad_records_sharded(
+    bad_records: Iterable[Mapping[str, Any]],
+    *,
+    shard_size: int = SHARD_SIZE,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+    max_table_length: int = MAX_TABLE_LENGTH,
+    max_field_length: int = MAX_FIELD_LENGTH,
+    max_reason_length: int = MAX_REASON_LENGTH,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+    reason_cache_size: int = REASON_CACHE_SIZE,
+    include_metadata: bool = False,
+) -> dict[str, Any]:
+    if shard_size <= 0:
+        raise ValueError("shard_size must be a positive integer")
+
+    merged = BadRecordsAccumulator(
+        max_samples_per_type=max_samples_per_type,
+        max_record_json_length=max_record_json_length,
+        reason_cache_size=reason_cache_size,
+    )
+    max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+
+    with ExitStack() as resources:
+        pool = executor
+        if pool is None:
+            pool = resources.enter_context(ProcessPoolExecutor(max_workers=max_workers))
+
+        # Shards are contiguous and merged in submission order, so the first-N
+        # samples per key match the serial path exactly.
+        pending: deque[Future[BadRecordsAccumulator]] = deque()
+        for shard in _iter_shards(bad_records, shard_size):
+            pending.append(
+                pool.submit(
+                    _accumulate_shard,
+                    shard,
+                    max_samples_per_type,
+                    max_record_json_length,
+                    reason_cache_size,
+                )
+            )
+            if len(pending) >= max_in_flight:
+                merged.merge(pending.popleft().result())
+        while pending:
+            merged.merge(pending.popleft().result())
+
+    return merged.summarize(
+        max_type_count=max_type_count,
+        max_table_length=max_table_length,
+        max_field_length=max_field_length,
+        max_reason_length=max_reason_length,
+        include_metadata=include_metadata,
+    )
+
+
+def _iter_shards(
+    records: Iterable[Mapping[str, Any]], shard_size: int
+) -> Iterator[list[Mapping[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        shard = list(islice(iterator, shard_size))
+        if not shard:
+            return
+        yield shard
+
+
+def _accumulate_shard(
+    shard: list[Mapping[str, Any]],
+    max_samples_per_type: int,
+    max_record_json_length: int,
+    reason_cache_size: int,
+) -> BadRecordsAccumulator:
+    accumulator = BadRecordsAccumulator(
+        max_samples_per_type=max_samples_per_type,
+        max_record_json_length=max_record_json_length,
+        reason_cache_size=reason_cache_size,
+    )
+    return accumulator.extend(shard)
+
+
+def _as_column_mapping(columns: Any) -> Mapping[str, Sequence[Any]]:
+    to_pydict = getattr(columns, "to_pydict", None)
+    if callable(to_pydict):
+        return to_pydict()
+    if isinstance(columns, Mapping):
+        return columns
+    raise TypeError("columns must be a mapping of column arrays or an Arrow batch")
+
+
+def _column_row_count(column_map: Mapping[str, Sequence[Any]]) -> int:
+    lengths = {len(values) for values in column_map.values()}
+    if len(lengths) > 1:
+        raise ValueError("bad_records columns must have equal lengths")
+    return lengths.pop() if lengths else 0
+
+
+def _iter_column_rows(
+    column_map: Mapping[str, Sequence[Any]], row_count: int
+) -> Iterator[dict[str, Any]]:
+    names = list(column_map)
+    for idx in range(row_count):
+        yield {name: column_map[name][idx] for name in names}
+
+
 def _extract_field_and_reason(
     raw_reason: Any,
 ) -> tuple[str, str]:
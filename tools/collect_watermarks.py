@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from utils.sqlite_store import SqliteStore
+
+FULL_WINDOW = timedelta(hours=24)
+MAX_POLL_GAP = timedelta(minutes=30)
+WATERMARK_COLUMNS = {
+    "dq_status": "window_end_ts",
+    "exception_ledger": "generated_at",
+}
+
+_TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@dataclass(frozen=True)
+class CollectWindow:
+    start_ts: str
+    incremental: bool
+
+
+class WatermarkStore:
+    def __init__(self, checkpoint_db_path: str) -> None:
+        self._store = SqliteStore(checkpoint_db_path)
+        self._store.migrate(
+            "collect_watermarks_v1",
+            """
+            CREATE TABLE IF NOT EXISTS collect_watermarks (
+                pipeline TEXT NOT NULL,
+                source TEXT NOT NULL,
+                watermark_ts TEXT NOT NULL,
+                polled_at TEXT NOT NULL,
+                PRIMARY KEY (pipeline, source)
+            )
+            """,
+        )
+
+    def close(self) -> None:
+        self._store.close()
+
+    def get(self, pipeline: str, source: str) -> tuple[str, str] | None:
+        row = self._store.fetchone(
+            "SELECT watermark_ts, polled_at FROM collect_watermarks "
+            "WHERE pipeline = ? AND source = ?",
+            (pipeline, source),
+        )
+        return None if row is None else (row[0], row[1])
+
+    def advance(
+        self,
+        pipeline: str,
+        source: str,
+        watermark_ts: str,
+        *,
+        polled_at: datetime,
+    ) -> None:
+        self._store.execute(
+            """
+            INSERT INTO collect_watermarks (
+                pipeline,
+                source,
+                watermark_ts,
+                polled_at
+            ) VALUES (?, ?, ?, ?)
+            ON CONFLICT(pipeline, source) DO UPDATE SET
+                watermark_ts = MAX(
+                    collect_watermarks.watermark_ts,
+                    excluded.watermark_ts
+                ),
+                polled_at = excluded.polled_at
+            """,
+            (pipeline, source, watermark_ts, _format_ts(polled_at)),
+        )
+
+
+def resolve_collect_windows(
+    store: WatermarkStore | None,
+    pipeline: str,
+    *,
+    now_utc: datetime,
+    full_window: timedelta = FULL_WINDOW,
+    max_poll_gap: timedelta = MAX_POLL_GAP,
+) -> dict[str, CollectWindow]:
+    full_window_start = _format_ts(now_utc - full_window)
+    windows: dict[str, CollectWindow] = {}
+    for source in WATERMARK_COLUMNS:
+        stored = None if store is None else store.get(pipeline, source)
+        windows[source] = CollectWindow(start_ts=full_window_start, incremental=False)
+        if stored is None:
+            continue
+        watermark_ts, polled_at = stored
+        if _parse_ts(polled_at) < now_utc - max_poll_gap:
+            continue
+        if watermark_ts < full_window_start:
+            continue
+        windows[source] = CollectWindow(start_ts=watermark_ts, incremental=True)
+    return windows
+
+
+def latest_watermark(rows: Iterable[Any], column: str) -> str | None:
+    candidates: list[str] = []
+    for row in rows:
+        if not isinstance(row, Mapping):
+            continue
+        value = row.get(column)
+        if isinstance(value, datetime):
+            value = _format_ts(value)
+        if isinstance(value, str) and value:
+            candidates.append(value)
+    return max(candidates, default=None)
+
+
+def _format_ts(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).strftime(_TS_FORMAT)
+
+
+def _parse_ts(value: str) -> datetime:
+    return datetime.strptime(value, _TS_FORMAT).replace(tzinfo=UTC)
+
+
+__all__ = [
+    "FULL_WINDOW",
+    "MAX_POLL_GAP",
+    "WATERMARK_COLUMNS",
+    "CollectWindow",
+    "WatermarkStore",
+    "latest_watermark",
+    "resolve_collect_windows",
+]
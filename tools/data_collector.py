@@ -1,8 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from tools.bad_records_summarizer import (
+    MAX_RECORD_JSON_LENGTH,
+    MAX_SAMPLES_PER_TYPE,
+    MAX_TYPE_COUNT,
+)
+from tools.collect_watermarks import CollectWindow
+
+_BAD_RECORDS_FIELD_SQL = (
+    "CASE WHEN TRIM(COALESCE(get_json_object(reason, '$.field'), '')) = '' "
+    "THEN 'unknown' ELSE get_json_object(reason, '$.field') END"
+)
+_BAD_RECORDS_REASON_SQL = (
+    "CASE "
+    "WHEN TRIM(COALESCE(get_json_object(reason, '$.detail'), '')) <> '' "
+    "THEN get_json_object(reason, '$.detail') "
+    "WHEN TRIM(COALESCE(get_json_object(reason, '$.rule'), '')) <> '' "
+    "THEN get_json_object(reason, '$.rule') "
+    "WHEN TRIM(COALESCE(get_json_object(reason, '$.reason'), '')) <> '' "
+    "THEN get_json_object(reason, '$.reason') "
+    "WHEN COALESCE(reason, '') <> '' THEN reason "
+    "ELSE 'unknown' END"
+)
+
 
 def build_pipeline_state_query(pipeline: str) -> dict[str, Any]:
     return {
@@ -16,13 +40,48 @@ def build_pipeline_state_query(pipeline: str) -> dict[str, Any]:
     }
 
 
-def build_dq_status_query(run_id: str, window_start_ts: str) -> dict[str, Any]:
+def build_pipeline_states_query(pipelines: list[str]) -> dict[str, Any]:
+    unique_pipelines = list(dict.fromkeys(pipelines))
+    if not unique_pipelines:
+        raise ValueError("pipelines must not be empty")
+
+    params = {
+        f"pipeline_name_{idx}": pipeline
+        for idx, pipeline in enumerate(unique_pipelines)
+    }
+    placeholders = ", ".join(f"%({name})s" for name in params)
+    return {
+        "sql": (
+            "SELECT pipeline_name, status, last_success_ts, last_processed_end, last_run_id "
+            "FROM gold.pipeline_state "
+            f"WHERE pipeline_name IN ({placeholders})"
+        ),
+        "params": params,
+        "result_shape": "list",
+    }
+
+
+def split_pipeline_states(
+    pipelines: list[str], rows: list[dict[str, Any]]
+) -> dict[str, dict[str, Any] | None]:
+    states: dict[str, dict[str, Any] | None] = dict.fromkeys(pipelines)
+    for row in rows:
+        pipeline = row.get("pipeline_name")
+        if pipeline in states and states[pipeline] is None:
+            states[pipeline] = row
+    return states
+
+
+def build_dq_status_query(
+    run_id: str, window_start_ts: str, *, incremental: bool = False
+) -> dict[str, Any]:
+    operator = ">" if incremental else ">="
     return {
         "sql": (
             "SELECT source_table, dq_tag, severity, run_id, window_end_ts, date_kst "
             "FROM silver.dq_status "
             "WHERE run_id = %(run_id)s "
-            "AND window_end_ts >= %(window_start_ts)s"
+            f"AND window_end_ts {operator} %(window_start_ts)s"
         ),
         "params": {
             "run_id": run_id,
@@ -32,14 +91,17 @@ def build_dq_status_query(run_id: str, window_start_ts: str) -> dict[str, Any]:
     }
 
 
-def build_exception_ledger_query(run_id: str, window_start_ts: str) -> dict[str, Any]:
+def build_exception_ledger_query(
+    run_id: str, window_start_ts: str, *, incremental: bool = False
+) -> dict[str, Any]:
+    operator = ">" if incremental else ">="
     return {
         "sql": (
             "SELECT severity, domain, exception_type, source_table, metric, metric_value, run_id, generated_at "
             "FROM gold.exception_ledger "
             "WHERE domain = %(domain)s "
             "AND run_id = %(run_id)s "
-            "AND generated_at >= %(window_start_ts)s"
+            f"AND generated_at {operator} %(window_start_ts)s"
         ),
         "params": {
             "domain": "dq",
@@ -50,21 +112,95 @@ def build_exception_ledger_query(run_id: str, window_start_ts: str) -> dict[str,
     }
 
 
-def collect_pipeline_context(pipeline: str, run_id: str | None) -> dict[str, Any]:
+def build_bad_records_summary_query(
+    run_id: str,
+    *,
+    max_type_count: int = MAX_TYPE_COUNT,
+    max_samples_per_type: int = MAX_SAMPLES_PER_TYPE,
+    max_record_json_length: int = MAX_RECORD_JSON_LENGTH,
+) -> dict[str, Any]:
+    return {
+        "sql": (
+            "WITH parsed AS ("
+            "SELECT COALESCE(source_table, 'unknown') AS source_table, "
+            f"{_BAD_RECORDS_FIELD_SQL} AS field, "
+            f"{_BAD_RECORDS_REASON_SQL} AS reason, "
+            "record_json "
+            "FROM silver.bad_records "
+            "WHERE run_id = %(run_id)s"
+            "), grouped AS ("
+            "SELECT source_table, field, reason, COUNT(*) AS violation_count "
+            "FROM parsed "
+            "GROUP BY source_table, field, reason"
+            "), ranked AS ("
+            "SELECT source_table, field, reason, violation_count, "
+            "ROW_NUMBER() OVER ("
+            "ORDER BY violation_count DESC, source_table, field, reason"
+            ") AS type_rank, "
+            "COUNT(*) OVER () AS distinct_type_count, "
+            "SUM(violation_count) OVER () AS total_records "
+            "FROM grouped"
+            "), sampled AS ("
+            "SELECT source_table, field, reason, "
+            "SUBSTR(record_json, 1, %(record_json_prefix_length)s) AS record_json, "
+            "ROW_NUMBER() OVER ("
+            "PARTITION BY source_table, field, reason ORDER BY record_json"
+            ") AS sample_rank "
+            "FROM parsed"
+            ") "
+            "SELECT ranked.source_table, ranked.field, ranked.reason, "
+            "ranked.violation_count, ranked.type_rank, ranked.distinct_type_count, "
+            "ranked.total_records, sampled.record_json, sampled.sample_rank "
+            "FROM ranked "
+            "LEFT JOIN sampled "
+            "ON sampled.source_table = ranked.source_table "
+            "AND sampled.field = ranked.field "
+            "AND sampled.reason = ranked.reason "
+            "AND sampled.sample_rank <= %(max_samples_per_type)s "
+            "WHERE ranked.type_rank <= %(max_type_count)s "
+            "ORDER BY ranked.type_rank, sampled.sample_rank"
+        ),
+        "params": {
+            "run_id": run_id,
+            "max_type_count": max_type_count,
+            "max_samples_per_type": max_samples_per_type,
+            "record_json_prefix_length": max_record_json_length + 1,
+        },
+        "result_shape": "list",
+    }
+
+
+def collect_pipeline_context(
+    pipeline: str,
+    run_id: str | None,
+    *,
+    include_bad_records_summary: bool = False,
+    windows: Mapping[str, CollectWindow] | None = None,
+) -> dict[str, Any]:
     if run_id is None:
         raise ValueError("run_id is required")
 
     window_start_ts = (datetime.now(tz=UTC) - timedelta(hours=24)).strftime(
         "%Y-%m-%dT%H:%M:%SZ"
     )
+    full_window = CollectWindow(start_ts=window_start_ts, incremental=False)
+    windows = windows or {}
+    dq_window = windows.get("dq_status", full_window)
+    ledger_window = windows.get("exception_ledger", full_window)
 
-    return {
+    context = {
         "pipeline_state": build_pipeline_state_query(pipeline),
         "dq_status": build_dq_status_query(
-            run_id=run_id, window_start_ts=window_start_ts
+            run_id=run_id,
+            window_start_ts=dq_window.start_ts,
+            incremental=dq_window.incremental,
         ),
         "exception_ledger": build_exception_ledger_query(
             run_id=run_id,
-            window_start_ts=window_start_ts,
+            window_start_ts=ledger_window.start_ts,
+            incremental=ledger_window.incremental,
         ),
     }
+    if include_bad_records_summary:
+        context["bad_records_summary"] = build_bad_records_summary_query(run_id)
+    return context
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import http.client
+import json
+import socket
+import threading
+import time
+from typing import Any
+from urllib import parse
+
+from tools.rate_limiter import parse_retry_after
+
+DEFAULT_MAX_IDLE_CONNECTIONS = 4
+DEFAULT_IDLE_KEEPALIVE_SECONDS = 20.0
+_IDEMPOTENT_METHODS = {"GET", "HEAD"}
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class DatabricksHttpError(RuntimeError):
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclass
+class _EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    reconnects: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+@dataclass
+class _IdleConnection:
+    conn: http.client.HTTPConnection
+    released_at: float
+
+
+class DatabricksHttpClient:
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        *,
+        max_idle_connections: int = DEFAULT_MAX_IDLE_CONNECTIONS,
+        idle_keepalive_seconds: float = DEFAULT_IDLE_KEEPALIVE_SECONDS,
+        connection_factory: Callable[..., http.client.HTTPConnection] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        parsed = parse.urlsplit(base_url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"Unsupported Databricks base URL: {base_url}")
+        if max_idle_connections <= 0:
+            raise ValueError("max_idle_connections must be a positive integer")
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self._max_idle_connections = max_idle_connections
+        self._idle_keepalive_seconds = idle_keepalive_seconds
+        self._connection_factory = connection_factory or (
+            http.client.HTTPSConnection
+            if parsed.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._idle: list[_IdleConnection] = []
+        self._stats: dict[str, _EndpointStats] = {}
+        self._connections_opened = 0
+        self._closed = False
+
+    def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        payload: dict[str, Any] | None = None,
+        timeout_seconds: float,
+    ) -> dict[str, Any]:
+        target = self._request_target(url)
+        endpoint = f"{method} {parse.urlsplit(target).path}"
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        started = time.perf_counter()
+        try:
+            status, reason, raw_body, retry_after = self._send(
+                method, target, body, timeout_seconds, endpoint
+            )
+        except Exception:
+            self._record(endpoint, time.perf_counter() - started, error=True)
+            raise
+        elapsed = time.perf_counter() - started
+
+        if status >= 400:
+            self._record(endpoint, elapsed, error=True)
+            detail = raw_body.decode("utf-8", errors="replace")
+            raise DatabricksHttpError(
+                f"Databricks API error status={status}: {detail or reason}",
+                status_code=status,
+                retry_after=retry_after,
+            )
+        self._record(endpoint, elapsed, error=False)
+
+        if not raw_body:
+            return {}
+        decoded = json.loads(raw_body.decode("utf-8"))
+        if not isinstance(decoded, dict):
+            raise RuntimeError("Databricks response must be a JSON object")
+        return decoded
+
+    def record_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self._stats.setdefault(endpoint, _EndpointStats()).retries += 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            endpoints = {
+                endpoint: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "reconnects": stats.reconnects,
+                    "avg_seconds": (
+                        round(stats.total_seconds / stats.requests, 6)
+                        if stats.requests
+                        else 0.0
+                    ),
+                    "max_seconds": round(stats.max_seconds, 6),
+                }
+                for endpoint, stats in sorted(self._stats.items())
+            }
+            return {
+                "connections_opened": self._connections_opened,
+                "idle_connections": len(self._idle),
+                "endpoints": endpoints,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            entry.conn.close()
+
+    def _request_target(self, url: str) -> str:
+        if url.startswith("/"):
+            return url
+        if not url.startswith(self.base_url + "/"):
+            raise ValueError(f"URL does not belong to {self.base_url}: {url}")
+        return url[len(self.base_url) :]
+
+    def _send(
+        self,
+        method: str,
+        target: str,
+        body: bytes | None,
+        timeout_seconds: float,
+        endpoint: str,
+    ) -> tuple[int, str, bytes, float | None]:
+        conn, reused = self._checkout(timeout_seconds)
+        try:
+            try:
+                return self._exchange(conn, method, target, body)
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                with self._lock:
+                    self._stats.setdefault(endpoint, _EndpointStats()).reconnects += 1
+                conn, reused = self._open(timeout_seconds), False
+                return self._exchange(conn, method, target, body)
+        except (socket.timeout, TimeoutError) as exc:
+            conn.close()
+            raise TimeoutError("Databricks request timed out") from exc
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            raise DatabricksHttpError(f"Databricks request failed: {exc}") from exc
+
+    def _exchange(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+    ) -> tuple[int, str, bytes, float | None]:
+        conn.request(method, target, body=body, headers=self._headers)
+        response = conn.getresponse()
+        raw_body = response.read()
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+        retry_after = parse_retry_after(response.headers)
+        return response.status, response.reason, raw_body, retry_after
+
+    def _checkout(
+        self, timeout_seconds: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        now = self._clock()
+        expired: list[http.client.HTTPConnection] = []
+        reusable: http.client.HTTPConnection | None = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Databricks HTTP client is closed")
+            while self._idle:
+                entry = self._idle.pop()
+                if now - entry.released_at <= self._idle_keepalive_seconds:
+                    reusable = entry.conn
+                    break
+                expired.append(entry.conn)
+        for conn in expired:
+            conn.close()
+        if reusable is None:
+            return self._open(timeout_seconds), False
+        reusable.timeout = timeout_seconds
+        if reusable.sock is not None:
+            reusable.sock.settimeout(timeout_seconds)
+        return reusable, True
+
+    def _open(self, timeout_seconds: float) -> http.client.HTTPConnection:
+        conn = self._connection_factory(self._host, self._port, timeout=timeout_seconds)
+        with self._lock:
+            self._connections_opened += 1
+        return conn
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if not self._closed and len(self._idle) < self._max_idle_connections:
+                self._idle.append(_IdleConnection(conn, self._clock()))
+                return
+        conn.close()
+
+    def _record(self, endpoint: str, elapsed: float, *, error: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, _EndpointStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+
+
+__all__ = [
+    "DatabricksHttpClient",
+    "DatabricksHttpError",
+]
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
-import socket
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import random
+import threading
 import time
 from typing import Any
-from urllib import error, parse, request
+from urllib import parse
 
 from orchestrator.databricks_jobs_config import load_databricks_jobs_config
+from tools.databricks_http import DatabricksHttpClient, DatabricksHttpError
+from tools.rate_limiter import DATABRICKS, rate_limiter
 from utils.secrets import get_secret
 
-
 _SUPPORTED_ACTIONS = {"backfill_silver", "retry_pipeline"}
 _SUPPORTED_EXECUTE_MODES = {"dry-run", "live"}
 _RUN_NOW_TIMEOUT_SECONDS = 20.0
@@ -18,12 +21,20 @@ _TIMEOUT_RETRY_DELAY_SECONDS = 5.0
 _API_5XX_RETRY_DELAY_SECONDS = 10.0
 _MAX_TIMEOUT_RETRIES = 2
 _MAX_5XX_RETRIES = 2
-
-
-class _DatabricksHttpError(RuntimeError):
-    def __init__(self, message: str, *, status_code: int | None = None) -> None:
-        super().__init__(message)
-        self.status_code = status_code
+_RUN_NOW_ENDPOINT = "POST /api/2.1/jobs/run-now"
+_WAIT_DEADLINE_SECONDS = 3600.0
+_WAIT_INITIAL_DELAY_SECONDS = 5.0
+_WAIT_MAX_DELAY_SECONDS = 60.0
+_WAIT_BACKOFF_FACTOR = 2.0
+_WAIT_JITTER_RATIO = 0.2
+_RUNS_LIST_MIN_RUN_IDS = 3
+_RUNS_LIST_PAGE_LIMIT = 25
+_RUNS_LIST_MAX_PAGES = 4
+_TERMINAL_LIFE_CYCLE_STATES = {"TERMINATED", "SKIPPED", "INTERNAL_ERROR"}
+
+_CLIENTS: dict[tuple[str, str], DatabricksHttpClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+_DEFAULT_CLIENT: DatabricksHttpClient | None = None
 
 
 def run_databricks_job(action: str, parameters: dict[str, Any]) -> dict[str, Any]:
@@ -51,7 +62,9 @@ def run_databricks_job(action: str, parameters: dict[str, Any]) -> dict[str, Any
             "parameters": parameters,
         }
 
-    base_url, token = _load_databricks_auth()
+    client = _databricks_client()
+    base_url, token = client.base_url, client.token
+    limiter = rate_limiter(DATABRICKS)
     timeout_retries_left = _MAX_TIMEOUT_RETRIES
     api_5xx_retries_left = _MAX_5XX_RETRIES
 
@@ -95,10 +108,13 @@ def run_databricks_job(action: str, parameters: dict[str, Any]) -> dict[str, Any
                 raise RuntimeError(
                     "Databricks run-now timed out after retries"
                 ) from exc
+            if not limiter.allow_retry():
+                raise RuntimeError("Databricks run-now retry budget exhausted") from exc
             timeout_retries_left -= 1
-            time.sleep(_TIMEOUT_RETRY_DELAY_SECONDS)
+            client.record_retry(_RUN_NOW_ENDPOINT)
+            time.sleep(limiter.retry_delay(_TIMEOUT_RETRY_DELAY_SECONDS))
         except Exception as exc:
-            if not _is_http_5xx_error(exc):
+            if not (_is_http_5xx_error(exc) or _is_http_throttled_error(exc)):
                 raise
             try:
                 active_run_id = _find_active_run_id_for_job(
@@ -120,8 +136,16 @@ def run_databricks_job(action: str, parameters: dict[str, Any]) -> dict[str, Any
                 raise RuntimeError(
                     "Databricks run-now failed with 5xx after retries"
                 ) from exc
+            if not limiter.allow_retry():
+                raise RuntimeError("Databricks run-now retry budget exhausted") from exc
             api_5xx_retries_left -= 1
-            time.sleep(_API_5XX_RETRY_DELAY_SECONDS)
+            client.record_retry(_RUN_NOW_ENDPOINT)
+            time.sleep(
+                limiter.retry_delay(
+                    _API_5XX_RETRY_DELAY_SECONDS,
+                    retry_after=getattr(exc, "retry_after", None),
+                )
+            )
 
 
 def check_job_status(job_run_id: str) -> dict[str, Any]:
@@ -138,7 +162,133 @@ def check_job_status(job_run_id: str) -> dict[str, Any]:
             "result_state": None,
         }
 
-    base_url, token = _load_databricks_auth()
+    client = _databricks_client()
+    return _fetch_run_status(client.base_url, client.token, run_id)
+
+
+@dataclass(frozen=True)
+class JobRunWaitResult:
+    statuses: dict[str, dict[str, Any]]
+    pending: tuple[str, ...]
+    polls: int
+    api_calls: int
+
+    @property
+    def timed_out(self) -> bool:
+        return bool(self.pending)
+
+
+def wait_for_job_runs(
+    job_run_ids: Iterable[str],
+    *,
+    deadline_seconds: float = _WAIT_DEADLINE_SECONDS,
+    initial_delay_seconds: float = _WAIT_INITIAL_DELAY_SECONDS,
+    max_delay_seconds: float = _WAIT_MAX_DELAY_SECONDS,
+    job_id: int | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+    rng: random.Random | None = None,
+) -> JobRunWaitResult:
+    run_ids = list(dict.fromkeys(str(run_id).strip() for run_id in job_run_ids))
+    if not run_ids or not all(run_ids):
+        raise ValueError("job_run_ids must be non-empty strings")
+    if deadline_seconds <= 0:
+        raise ValueError("deadline_seconds must be positive")
+
+    if _resolve_execute_mode({}) == "dry-run":
+        return JobRunWaitResult(
+            statuses={run_id: check_job_status(run_id) for run_id in run_ids},
+            pending=(),
+            polls=0,
+            api_calls=0,
+        )
+
+    client = _databricks_client()
+    jitter = rng or random.Random()
+    deadline = clock() + deadline_seconds
+    statuses: dict[str, dict[str, Any]] = {}
+    pending = list(run_ids)
+    polls = api_calls = 0
+    delay = initial_delay_seconds
+
+    while True:
+        polls += 1
+        snapshot, calls = _poll_run_statuses(
+            client.base_url, client.token, pending, job_id=job_id
+        )
+        api_calls += calls
+        statuses.update(snapshot)
+        pending = [
+            run_id
+            for run_id in pending
+            if statuses[run_id]["life_cycle_state"] not in _TERMINAL_LIFE_CYCLE_STATES
+        ]
+        remaining = deadline - clock()
+        if not pending or remaining <= 0:
+            break
+        jittered = delay * (1 + jitter.uniform(-_WAIT_JITTER_RATIO, _WAIT_JITTER_RATIO))
+        sleep(min(max(jittered, 0.0), remaining))
+        delay = min(delay * _WAIT_BACKOFF_FACTOR, max_delay_seconds)
+
+    return JobRunWaitResult(
+        statuses={run_id: statuses[run_id] for run_id in run_ids},
+        pending=tuple(pending),
+        polls=polls,
+        api_calls=api_calls,
+    )
+
+
+def _poll_run_statuses(
+    base_url: str,
+    token: str,
+    run_ids: list[str],
+    *,
+    job_id: int | None,
+) -> tuple[dict[str, dict[str, Any]], int]:
+    if len(run_ids) < _RUNS_LIST_MIN_RUN_IDS:
+        return {
+            run_id: _fetch_run_status(base_url, token, run_id) for run_id in run_ids
+        }, len(run_ids)
+
+    active, calls = _list_active_runs(base_url, token, job_id=job_id)
+    statuses: dict[str, dict[str, Any]] = {}
+    for run_id in run_ids:
+        if run_id in active:
+            statuses[run_id] = _run_status_from_payload(run_id, active[run_id])
+        else:
+            statuses[run_id] = _fetch_run_status(base_url, token, run_id)
+            calls += 1
+    return statuses, calls
+
+
+def _list_active_runs(
+    base_url: str, token: str, *, job_id: int | None
+) -> tuple[dict[str, dict[str, Any]], int]:
+    params: dict[str, Any] = {"active_only": "true", "limit": _RUNS_LIST_PAGE_LIMIT}
+    if job_id is not None:
+        params["job_id"] = job_id
+    active: dict[str, dict[str, Any]] = {}
+    calls = 0
+    while calls < _RUNS_LIST_MAX_PAGES:
+        payload = _http_json_request(
+            method="GET",
+            url=f"{base_url}/api/2.1/jobs/runs/list?{parse.urlencode(params)}",
+            token=token,
+            timeout_seconds=_STATUS_TIMEOUT_SECONDS,
+        )
+        calls += 1
+        runs = payload.get("runs")
+        for run in runs if isinstance(runs, list) else []:
+            if isinstance(run, dict) and run.get("run_id") is not None:
+                active[str(run["run_id"])] = run
+        next_page_token = payload.get("next_page_token")
+        if not payload.get("has_more") or not next_page_token:
+            break
+        params["page_token"] = next_page_token
+    return active, calls
+
+
+def _fetch_run_status(base_url: str, token: str, run_id: str) -> dict[str, Any]:
     query = parse.urlencode({"run_id": run_id})
     payload = _http_json_request(
         method="GET",
@@ -146,6 +296,10 @@ def check_job_status(job_run_id: str) -> dict[str, Any]:
         token=token,
         timeout_seconds=_STATUS_TIMEOUT_SECONDS,
     )
+    return _run_status_from_payload(run_id, payload)
+
+
+def _run_status_from_payload(run_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     raw_state = payload.get("state")
     state: dict[str, Any] = raw_state if isinstance(raw_state, dict) else {}
     life_cycle_state = str(state.get("life_cycle_state") or "UNKNOWN")
@@ -205,6 +359,43 @@ def _find_active_run_id_for_job(
     return str(run_id)
 
 
+def databricks_http_metrics() -> dict[str, Any]:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+    return {client.base_url: client.metrics() for client in clients}
+
+
+def reset_databricks_client() -> None:
+    global _DEFAULT_CLIENT
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+        _DEFAULT_CLIENT = None
+    for client in clients:
+        client.close()
+
+
+def _databricks_client() -> DatabricksHttpClient:
+    global _DEFAULT_CLIENT
+    with _CLIENTS_LOCK:
+        if _DEFAULT_CLIENT is not None:
+            return _DEFAULT_CLIENT
+    base_url, token = _load_databricks_auth()
+    client = _client_for(base_url, token)
+    with _CLIENTS_LOCK:
+        _DEFAULT_CLIENT = client
+    return client
+
+
+def _client_for(base_url: str, token: str) -> DatabricksHttpClient:
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get((base_url, token))
+        if client is None:
+            client = DatabricksHttpClient(base_url, token)
+            _CLIENTS[(base_url, token)] = client
+        return client
+
+
 def _http_json_request(
     *,
     method: str,
@@ -213,49 +404,26 @@ def _http_json_request(
     payload: dict[str, Any] | None = None,
     timeout_seconds: float,
 ) -> dict[str, Any]:
-    data: bytes | None = None
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, method=method, headers=headers)
-
-    try:
-        with request.urlopen(req, timeout=timeout_seconds) as response:
-            raw_body = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="replace") if exc.fp else ""
-        raise _DatabricksHttpError(
-            f"Databricks API error status={exc.code}: {detail or exc.reason}",
-            status_code=exc.code,
-        ) from exc
-    except (error.URLError, socket.timeout, TimeoutError) as exc:
-        reason = getattr(exc, "reason", exc)
-        reason_text = str(reason).lower()
-        if "timed out" in reason_text or isinstance(
-            exc, (socket.timeout, TimeoutError)
-        ):
-            raise TimeoutError("Databricks request timed out") from exc
-        raise _DatabricksHttpError(f"Databricks request failed: {reason}") from exc
-
-    if not raw_body:
-        return {}
-    decoded = json.loads(raw_body)
-    if not isinstance(decoded, dict):
-        raise RuntimeError("Databricks response must be a JSON object")
-    return decoded
+    parsed = parse.urlsplit(url)
+    client = _client_for(f"{parsed.scheme}://{parsed.netloc}", token)
+    rate_limiter(DATABRICKS).acquire()
+    return client.request_json(
+        method, url, payload=payload, timeout_seconds=timeout_seconds
+    )
 
 
 def _is_http_5xx_error(exc: Exception) -> bool:
     return (
-        isinstance(exc, _DatabricksHttpError)
+        isinstance(exc, DatabricksHttpError)
         and exc.status_code is not None
         and 500 <= exc.status_code < 600
     )
 
 
+def _is_http_throttled_error(exc: Exception) -> bool:
+    return isinstance(exc, DatabricksHttpError) and exc.status_code == 429
+
+
 def _map_lifecycle_to_status(life_cycle_state: str) -> str:
     if life_cycle_state in {"PENDING", "RUNNING", "QUEUED", "TERMINATING"}:
         return "running"
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import logging
 import os
-import sqlite3
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Callable, Mapping
 from urllib import error
 
+from tools.rate_limiter import LLM, parse_retry_after, rate_limiter
+from utils.sqlite_store import shared_sqlite_store
+
 REQUEST_TIMEOUT_SECONDS = 60.0
 RETRY_DELAYS_SECONDS = (2.0, 4.0, 8.0)
 RETRYABLE_HTTP_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
@@ -56,15 +58,21 @@ def invoke_llm(
             f"LLM daily cap reached: {daily_cap} requests for {_today_kst_key()}"
         )
 
+    limiter = rate_limiter(LLM)
     for attempt in range(len(RETRY_DELAYS_SECONDS) + 1):
         logger.info("Starting LLM HTTP attempt %d", attempt + 1)
+        retry_after = None
         try:
+            limiter.acquire(sleep=sleep)
             response = requester(REQUEST_TIMEOUT_SECONDS)
             status = getattr(response, "status", None)
             if status is not None:
                 status_code = int(status)
                 if not (200 <= status_code < 300):
                     if status_code in RETRYABLE_HTTP_STATUS_CODES:
+                        retry_after = parse_retry_after(
+                            getattr(response, "headers", None)
+                        )
                         raise LLMTransientError(f"http status {status_code}")
                     if status_code in {401, 403, 404}:
                         raise LLMPermanentError(f"http status {status_code}")
@@ -79,10 +87,18 @@ def invoke_llm(
                 raise LLMPermanentError("response parse/validation failure") from exc
         except Exception as exc:
             classified = _classify_error(exc)
-            if isinstance(classified, LLMTransientError) and attempt < len(
-                RETRY_DELAYS_SECONDS
+            if isinstance(exc, error.HTTPError):
+                retry_after = parse_retry_after(exc.headers)
+            if (
+                isinstance(classified, LLMTransientError)
+                and attempt < len(RETRY_DELAYS_SECONDS)
+                and limiter.allow_retry()
             ):
-                sleep(RETRY_DELAYS_SECONDS[attempt])
+                sleep(
+                    limiter.retry_delay(
+                        RETRY_DELAYS_SECONDS[attempt], retry_after=retry_after
+                    )
+                )
                 continue
             if classified is exc:
                 raise classified
@@ -120,26 +136,27 @@ def _parse_daily_cap(raw: str | None) -> int:
 def _consume_daily_budget(db_path: str, *, daily_cap: int) -> bool:
     _ensure_parent_dir(db_path)
     date_key = _today_kst_key()
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS llm_daily_usage (
-                day_key TEXT PRIMARY KEY,
-                request_count INTEGER NOT NULL
-            )
-            """
-        )
-        cursor = conn.execute(
-            """
-            INSERT INTO llm_daily_usage(day_key, request_count)
-            VALUES (?, 1)
-            ON CONFLICT(day_key) DO UPDATE
-            SET request_count = llm_daily_usage.request_count + 1
-            WHERE llm_daily_usage.request_count < ?
-            """,
-            (date_key, daily_cap),
+    store = shared_sqlite_store(db_path)
+    store.migrate(
+        "llm_daily_usage_v1",
+        """
+        CREATE TABLE IF NOT EXISTS llm_daily_usage (
+            day_key TEXT PRIMARY KEY,
+            request_count INTEGER NOT NULL
         )
-        return cursor.rowcount == 1
+        """,
+    )
+    updated = store.execute(
+        """
+        INSERT INTO llm_daily_usage(day_key, request_count)
+        VALUES (?, 1)
+        ON CONFLICT(day_key) DO UPDATE
+        SET request_count = llm_daily_usage.request_count + 1
+        WHERE llm_daily_usage.request_count < ?
+        """,
+        (date_key, daily_cap),
+    )
+    return updated == 1
 
 
 def _today_kst_key() -> str:
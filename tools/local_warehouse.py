@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from typing import Any, Mapping
+
+LOCAL_SCHEMAS = ("silver", "gold")
+
+_PYFORMAT_PARAM = re.compile(r"%\((\w+)\)s")
+_JSON_PATH_KEY = re.compile(r"^\$\.(\w+)$")
+
+
+def connect_local_warehouse(database: str = ":memory:") -> sqlite3.Connection:
+    conn = sqlite3.connect(database, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for schema in LOCAL_SCHEMAS:
+        schema_database = (
+            ":memory:" if database == ":memory:" else f"{database}.{schema}"
+        )
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (schema_database,))
+    conn.create_function("get_json_object", 2, _get_json_object, deterministic=True)
+    return conn
+
+
+def to_sqlite_sql(sql: str) -> str:
+    return _PYFORMAT_PARAM.sub(r":\1", sql)
+
+
+def execute_query_spec(conn: sqlite3.Connection, query_spec: Mapping[str, Any]) -> Any:
+    cursor = conn.execute(
+        to_sqlite_sql(query_spec["sql"]),
+        dict(query_spec.get("params") or {}),
+    )
+    rows = [dict(row) for row in cursor.fetchall()]
+    if query_spec.get("result_shape") == "single":
+        return rows[0] if rows else None
+    return rows
+
+
+def _get_json_object(raw_json: Any, path: Any) -> str | None:
+    if not isinstance(raw_json, str) or not isinstance(path, str):
+        return None
+    match = _JSON_PATH_KEY.match(path)
+    if match is None:
+        return None
+    try:
+        loaded = json.loads(raw_json)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(loaded, dict):
+        return None
+
+    value = loaded.get(match.group(1))
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+__all__ = [
+    "LOCAL_SCHEMAS",
+    "connect_local_warehouse",
+    "execute_query_spec",
+    "to_sqlite_sql",
+]
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+import importlib
+import sqlite3
+import threading
+import time
+from typing import Any, Protocol
+
+from tools.local_warehouse import connect_local_warehouse, to_sqlite_sql
+from utils.secrets import get_secret
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_QUERY_TIMEOUT_SECONDS = 30.0
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+_RESULT_SHAPES = {"single", "list"}
+
+
+class QueryBackend(Protocol):
+    def connect(self) -> Any: ...
+
+    def prepare(self, sql: str, params: Mapping[str, Any]) -> tuple[str, Any]: ...
+
+    def cancel(self, connection: Any, cursor: Any) -> None: ...
+
+
+class SqliteQueryBackend:
+    def __init__(self, database: str) -> None:
+        self.database = database
+
+    def connect(self) -> sqlite3.Connection:
+        return connect_local_warehouse(self.database)
+
+    def prepare(self, sql: str, params: Mapping[str, Any]) -> tuple[str, Any]:
+        return to_sqlite_sql(sql), dict(params)
+
+    def cancel(self, connection: sqlite3.Connection, cursor: Any) -> None:
+        _ = cursor
+        connection.interrupt()
+
+
+class DatabricksSqlQueryBackend:
+    def __init__(
+        self,
+        *,
+        server_hostname: str,
+        http_path: str,
+        access_token: str,
+    ) -> None:
+        self.server_hostname = server_hostname
+        self.http_path = http_path
+        self._access_token = access_token
+
+    @classmethod
+    def from_secrets(cls) -> DatabricksSqlQueryBackend:
+        host = get_secret("databricks-host").strip().rstrip("/")
+        return cls(
+            server_hostname=host.removeprefix("https://"),
+            http_path=get_secret("databricks-sql-http-path").strip(),
+            access_token=get_secret("databricks-agent-token").strip(),
+        )
+
+    def connect(self) -> Any:
+        module = importlib.import_module("databricks.sql")
+        return module.connect(
+            server_hostname=self.server_hostname,
+            http_path=self.http_path,
+            access_token=self._access_token,
+        )
+
+    def prepare(self, sql: str, params: Mapping[str, Any]) -> tuple[str, Any]:
+        return sql, dict(params)
+
+    def cancel(self, connection: Any, cursor: Any) -> None:
+        _ = connection
+        cursor.cancel()
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        max_size: int = DEFAULT_POOL_SIZE,
+        acquire_timeout_seconds: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self._connect = connect
+        self._idle: list[Any] = []
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def created(self) -> int:
+        return self._created
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        conn = self._checkout()
+        try:
+            yield conn
+        except (TimeoutError, ConnectionError):
+            self._checkin(conn, discard=True)
+            raise
+        except BaseException:
+            self._checkin(conn, discard=False)
+            raise
+        else:
+            self._checkin(conn, discard=False)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._condition.notify_all()
+        for conn in idle:
+            _close_quietly(conn)
+
+    def _checkout(self) -> Any:
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("connection pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.max_size:
+                    self._created += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("timed out waiting for a pooled connection")
+                self._condition.wait(remaining)
+
+        try:
+            return self._connect()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def _checkin(self, conn: Any, *, discard: bool) -> None:
+        with self._condition:
+            discard = discard or self._closed
+            if discard:
+                self._created -= 1
+            else:
+                self._idle.append(conn)
+            self._condition.notify()
+        if discard:
+            _close_quietly(conn)
+
+
+@dataclass(frozen=True)
+class QueryFanoutResult:
+    results: dict[str, Any]
+    errors: dict[str, Exception]
+    timings: dict[str, float]
+
+
+class QueryExecutor:
+    def __init__(
+        self,
+        backend: QueryBackend,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout_seconds: float = DEFAULT_QUERY_TIMEOUT_SECONDS,
+        acquire_timeout_seconds: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.backend = backend
+        self.timeout_seconds = timeout_seconds
+        self.pool = ConnectionPool(
+            backend.connect,
+            max_size=pool_size,
+            acquire_timeout_seconds=acquire_timeout_seconds,
+        )
+
+    def __enter__(self) -> QueryExecutor:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def execute(
+        self,
+        query_spec: Mapping[str, Any],
+        *,
+        timeout_seconds: float | None = None,
+    ) -> Any:
+        result_shape = query_spec.get("result_shape")
+        if result_shape not in _RESULT_SHAPES:
+            raise ValueError(f"Unsupported result_shape: {result_shape}")
+        sql, params = self.backend.prepare(
+            query_spec["sql"],
+            query_spec.get("params") or {},
+        )
+        timeout = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+
+        with self.pool.connection() as conn:
+            columns, rows = self._run(conn, sql, params, timeout)
+
+        return decode_query_result(columns, rows, result_shape)
+
+    def execute_all(
+        self,
+        query_specs: Mapping[str, Mapping[str, Any]],
+        *,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        return {
+            name: self.execute(query_spec, timeout_seconds=timeout_seconds)
+            for name, query_spec in query_specs.items()
+        }
+
+    def execute_concurrently(
+        self,
+        query_specs: Mapping[str, Mapping[str, Any]],
+        *,
+        max_workers: int | None = None,
+        timeout_seconds: float | None = None,
+    ) -> QueryFanoutResult:
+        results: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+        timings: dict[str, float] = {}
+        if not query_specs:
+            return QueryFanoutResult(results=results, errors=errors, timings=timings)
+
+        def _timed(name: str) -> tuple[str, Any, Exception | None, float]:
+            started = time.monotonic()
+            try:
+                value = self.execute(query_specs[name], timeout_seconds=timeout_seconds)
+            except Exception as exc:
+                return name, None, exc, time.monotonic() - started
+            return name, value, None, time.monotonic() - started
+
+        workers = max_workers or min(len(query_specs), self.pool.max_size)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="query-fanout"
+        ) as pool:
+            outcomes = list(pool.map(_timed, query_specs))
+
+        for name, value, exc, elapsed in outcomes:
+            timings[name] = round(elapsed, 6)
+            if exc is None:
+                results[name] = value
+            else:
+                errors[name] = exc
+        return QueryFanoutResult(results=results, errors=errors, timings=timings)
+
+    def _run(
+        self, conn: Any, sql: str, params: Any, timeout: float
+    ) -> tuple[list[str], list[Any]]:
+        cursor = conn.cursor()
+        timed_out = threading.Event()
+
+        def _cancel() -> None:
+            timed_out.set()
+            self.backend.cancel(conn, cursor)
+
+        timer = threading.Timer(timeout, _cancel)
+        timer.daemon = True
+        timer.start()
+        try:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+            columns = [column[0] for column in cursor.description or ()]
+        except Exception as exc:
+            if timed_out.is_set():
+                raise TimeoutError(f"query timed out after {timeout:g}s") from exc
+            raise
+        finally:
+            timer.cancel()
+            cursor.close()
+        return columns, rows
+
+
+def decode_query_result(columns: list[str], rows: list[Any], result_shape: str) -> Any:
+    decoded = [dict(zip(columns, row)) for row in rows]
+    if result_shape == "single":
+        return decoded[0] if decoded else None
+    return decoded
+
+
+def _close_quietly(conn: Any) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+__all__ = [
+    "ConnectionPool",
+    "DatabricksSqlQueryBackend",
+    "QueryBackend",
+    "QueryExecutor",
+    "QueryFanoutResult",
+    "SqliteQueryBackend",
+    "decode_query_result",
+]
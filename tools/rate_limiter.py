@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import Any
+
+DATABRICKS = "databricks"
+LLM = "llm"
+ALERTING = "alerting"
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    rate_per_second: float
+    burst: float
+    retry_ratio: float = 0.2
+    retry_burst: float = 10.0
+    min_retry_rate_per_second: float = 0.1
+    jitter_ratio: float = 0.1
+    max_retry_after_seconds: float = 300.0
+
+
+DEFAULT_POLICIES: dict[str, RateLimitPolicy] = {
+    DATABRICKS: RateLimitPolicy(rate_per_second=5.0, burst=10.0),
+    LLM: RateLimitPolicy(rate_per_second=1.0, burst=5.0),
+    ALERTING: RateLimitPolicy(rate_per_second=10.0, burst=20.0),
+}
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        destination: str,
+        policy: RateLimitPolicy,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        if policy.rate_per_second <= 0 or policy.burst < 1:
+            raise ValueError("rate_per_second must be positive and burst >= 1")
+        self.destination = destination
+        self.policy = policy
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._updated_at = clock()
+        self._tokens = policy.burst
+        self._retry_tokens = policy.retry_burst
+        self._blocked_until = 0.0
+        self._acquired = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+        self._max_throttled_seconds = 0.0
+        self._retries = 0
+        self._retries_denied = 0
+        self._retry_after_honored = 0
+
+    def acquire(self, *, sleep: Callable[[float], None] | None = None) -> float:
+        wait_fn = sleep or self._sleep
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._refill()
+                wait = max(self._blocked_until - now, 0.0)
+                if wait <= 0 and self._tokens < 1:
+                    wait = (1 - self._tokens) / self.policy.rate_per_second
+                if wait <= 0:
+                    self._tokens -= 1
+                    self._retry_tokens = min(
+                        self.policy.retry_burst,
+                        self._retry_tokens + self.policy.retry_ratio,
+                    )
+                    self._acquired += 1
+                    if waited > 0:
+                        self._throttled += 1
+                        self._throttled_seconds += waited
+                        self._max_throttled_seconds = max(
+                            self._max_throttled_seconds, waited
+                        )
+                    return waited
+            wait_fn(wait)
+            waited += wait
+
+    def allow_retry(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self._retry_tokens < 1:
+                self._retries_denied += 1
+                return False
+            self._retry_tokens -= 1
+            self._retries += 1
+            return True
+
+    def retry_delay(
+        self, base_delay_seconds: float, *, retry_after: float | None = None
+    ) -> float:
+        delay = base_delay_seconds
+        with self._lock:
+            if retry_after is not None and retry_after > 0:
+                retry_after = min(retry_after, self.policy.max_retry_after_seconds)
+                self._blocked_until = max(
+                    self._blocked_until, self._clock() + retry_after
+                )
+                self._retry_after_honored += 1
+                delay = max(delay, retry_after)
+            jitter = self._rng.uniform(0.0, self.policy.jitter_ratio)
+        return delay * (1 + jitter)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "throttled_seconds": round(self._throttled_seconds, 6),
+                "max_throttled_seconds": round(self._max_throttled_seconds, 6),
+                "retries": self._retries,
+                "retries_denied": self._retries_denied,
+                "retry_after_honored": self._retry_after_honored,
+            }
+
+    def _refill(self) -> float:
+        now = self._clock()
+        elapsed = max(now - self._updated_at, 0.0)
+        self._updated_at = now
+        self._tokens = min(
+            self.policy.burst, self._tokens + elapsed * self.policy.rate_per_second
+        )
+        self._retry_tokens = min(
+            self.policy.retry_burst,
+            self._retry_tokens + elapsed * self.policy.min_retry_rate_per_second,
+        )
+        return now
+
+
+_LIMITERS: dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def rate_limiter(destination: str) -> RateLimiter:
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(destination)
+        if limiter is None:
+            policy = DEFAULT_POLICIES.get(destination)
+            if policy is None:
+                raise ValueError(f"Unknown rate limit destination: {destination}")
+            limiter = RateLimiter(destination, policy)
+            _LIMITERS[destination] = limiter
+        return limiter
+
+
+def configure_rate_limiter(
+    destination: str,
+    policy: RateLimitPolicy | None = None,
+    **overrides: Any,
+) -> RateLimiter:
+    base = policy or DEFAULT_POLICIES.get(destination)
+    if base is None:
+        raise ValueError(f"Unknown rate limit destination: {destination}")
+    limiter = RateLimiter(destination, replace(base, **overrides))
+    with _LIMITERS_LOCK:
+        _LIMITERS[destination] = limiter
+    return limiter
+
+
+def rate_limiter_metrics() -> dict[str, dict[str, Any]]:
+    with _LIMITERS_LOCK:
+        limiters = dict(_LIMITERS)
+    return {name: limiter.metrics() for name, limiter in sorted(limiters.items())}
+
+
+def reset_rate_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def parse_retry_after(
+    headers: Mapping[str, Any] | Any | None, *, now: datetime | None = None
+) -> float | None:
+    if headers is None:
+        return None
+    raw = headers.get("Retry-After")
+    if raw is None:
+        return None
+    value = str(raw).strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    current = now or datetime.now(timezone.utc)
+    return max((retry_at - current).total_seconds(), 0.0)
+
+
+__all__ = [
+    "ALERTING",
+    "DATABRICKS",
+    "DEFAULT_POLICIES",
+    "LLM",
+    "RateLimitPolicy",
+    "RateLimiter",
+    "configure_rate_limiter",
+    "parse_retry_after",
+    "rate_limiter",
+    "rate_limiter_metrics",
+    "reset_rate_limiters",
+]
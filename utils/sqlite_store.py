@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+try:
+    from orchestrator.utils.sqlite_store import (
+        DEFAULT_BUSY_TIMEOUT_SECONDS,
+        SqliteStore,
+        close_shared_sqlite_stores,
+        connect_sqlite,
+        is_busy_error,
+        shared_sqlite_store,
+    )
+except ModuleNotFoundError as exc:
+    if exc.name is None or exc.name.split(".", 1)[0] != "orchestrator":
+        raise
+    from src.orchestrator.utils.sqlite_store import (
+        DEFAULT_BUSY_TIMEOUT_SECONDS,
+        SqliteStore,
+        close_shared_sqlite_stores,
+        connect_sqlite,
+        is_busy_error,
+        shared_sqlite_store,
+    )
+
+__all__ = [
+    "DEFAULT_BUSY_TIMEOUT_SECONDS",
+    "SqliteStore",
+    "close_shared_sqlite_stores",
+    "connect_sqlite",
+    "is_busy_error",
+    "shared_sqlite_store",
+]